@@ -1,6 +1,8 @@
 import requests
 import json
 import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configuration
 API_URL = "http://localhost:8000/api/projects/"
@@ -11,19 +13,30 @@ PROJECT_DATA = {
     "icon": "💻"
 }
 
-def create_project():
-    print(f"Target URL: {API_URL}")
-    print(f"Creating Project: {PROJECT_DATA['name']}...")
+def build_session():
+    """Create a keep-alive session shared by every project request."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.2)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def create_project(session, data):
+    print(f"Creating Project: {data['name']}...")
     
     try:
         # Send POST request
-        response = requests.post(API_URL, json=PROJECT_DATA, headers={"Content-Type": "application/json"}, timeout=5)
+        response = session.post(API_URL, json=data, timeout=5)
         
         if response.status_code in [200, 201]:
             print("\n[SUCCESS] Project created successfully!")
             print("Response Data:")
             print(json.dumps(response.json(), indent=2))
-            print("\n-> Now refresh your dashboard (F5) to see it in the sidebar.")
+            return True
         else:
             print(f"\n[ERROR] Failed to create project. Status Code: {response.status_code}")
             print("Response Text:", response.text)
@@ -33,6 +46,18 @@ def create_project():
         print("Make sure 'python main.py' is running in another terminal!")
     except Exception as e:
         print(f"\n[EXCEPTION] An error occurred: {e}")
+        
+    return False
+
+def create_projects(projects):
+    print(f"Target URL: {API_URL}")
+    
+    with build_session() as session:
+        created = sum(1 for project in projects if create_project(session, project))
+        
+    if created:
+        print("\n-> Now refresh your dashboard (F5) to see it in the sidebar.")
+    return created
 
 if __name__ == "__main__":
     if sys.platform == "win32":
@@ -41,4 +66,4 @@ if __name__ == "__main__":
         except:
             pass
         
-    create_project()
+    create_projects([PROJECT_DATA])
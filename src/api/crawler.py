@@ -4,6 +4,7 @@ Provides endpoints to start, stop, and monitor crawls.
 """
 
 from typing import Optional, Dict, Any
+import asyncio
 from fastapi import APIRouter, HTTPException, status, BackgroundTasks
 from pydantic import BaseModel
 
@@ -11,6 +12,7 @@ from ..storage import db_manager, CrawlStatus
 from ..crawler.scheduler import crawl_scheduler
 from ..crawler.crawl_manager import CrawlManager
 from ..utils.logger import setup_logger
+from ..utils.async_utils import run_blocking
 
 logger = setup_logger(__name__)
 
@@ -56,7 +58,7 @@ async def start_crawl(source_id: str, background_tasks: BackgroundTasks):
         Trigger confirmation
     """
     # Check if source exists
-    source = db_manager.get_source(source_id)
+    source = await run_blocking(db_manager.get_source, source_id)
     if not source:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -72,7 +74,7 @@ async def start_crawl(source_id: str, background_tasks: BackgroundTasks):
         
     try:
         # Trigger crawl
-        success = crawl_scheduler.trigger_source_crawl(source_id)
+        success = await run_blocking(crawl_scheduler.trigger_source_crawl, source_id)
         
         if success:
             logger.info(f"Triggered manual crawl for source: {source_id}")
@@ -106,7 +108,7 @@ async def stop_crawl(source_id: str):
         Stop confirmation
     """
     # Check if source exists
-    source = db_manager.get_source(source_id)
+    source = await run_blocking(db_manager.get_source, source_id)
     if not source:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -115,7 +117,7 @@ async def stop_crawl(source_id: str):
         
     try:
         # Pause the job
-        success = crawl_scheduler.pause_source_job(source_id)
+        success = await run_blocking(crawl_scheduler.pause_source_job, source_id)
         
         if success:
             logger.info(f"Paused crawl job for source: {source_id}")
@@ -144,7 +146,7 @@ async def resume_crawl(source_id: str):
         Resume confirmation
     """
     # Check if source exists
-    source = db_manager.get_source(source_id)
+    source = await run_blocking(db_manager.get_source, source_id)
     if not source:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -153,14 +155,14 @@ async def resume_crawl(source_id: str):
         
     try:
         # Resume the job
-        success = crawl_scheduler.resume_source_job(source_id)
+        success = await run_blocking(crawl_scheduler.resume_source_job, source_id)
         
         if success:
             logger.info(f"Resumed crawl job for source: {source_id}")
             return {"message": "Crawl job resumed", "source_id": source_id}
         else:
             # Job might not exist, try to add it
-            crawl_scheduler.add_source_job(source_id)
+            await run_blocking(crawl_scheduler.add_source_job, source_id)
             return {"message": "Crawl job scheduled", "source_id": source_id}
             
     except Exception as e:
@@ -183,7 +185,7 @@ async def get_crawl_status(source_id: str):
         Crawl status information
     """
     # Get source
-    source = db_manager.get_source(source_id)
+    source = await run_blocking(db_manager.get_source, source_id)
     if not source:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -212,16 +214,15 @@ async def get_crawl_stats():
         Global statistics
     """
     try:
-        # Get stats from database
-        stats = db_manager.get_global_stats()
+        # Get stats and active crawl count from database in parallel
+        stats, active_crawls = await asyncio.gather(
+            run_blocking(db_manager.get_global_stats),
+            run_blocking(db_manager.count_sources_by_status, CrawlStatus.RUNNING)
+        )
         
         # Get scheduler info
         jobs = crawl_scheduler.list_jobs()
         
-        # Count active crawls
-        sources = db_manager.list_sources()
-        active_crawls = sum(1 for s in sources if s.status == CrawlStatus.RUNNING)
-        
         return CrawlStatsResponse(
             total_sources=stats["total_sources"],
             total_documents=stats["total_documents"],
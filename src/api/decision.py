@@ -1,16 +1,42 @@
 from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
-import requests
-from ..storage import db_manager
+from fastapi.responses import StreamingResponse
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
+import asyncio
+import hashlib
+import io
+import json
+import re
+import time
+import httpx
+from cachetools import TTLCache
+from ..storage import db_manager, SearchQuery
 from ..processing.intelligent_keywords import intelligent_extractor
+from ..utils.async_utils import run_blocking
 from datetime import datetime, timedelta
 
 router = APIRouter()
 
 # Ollama Configuration
-OLLAMA_API = "http://localhost:11434/api/generate"
+OLLAMA_HOST = "http://localhost:11434"
+OLLAMA_API = "/api/generate"
+OLLAMA_CONNECT_TIMEOUT = 2.0
 OLLAMA_MODEL = "mistral:7b-instruct"
 
+# Shared Ollama client (keep-alive connections are reused across requests)
+_ollama_client: Optional[httpx.AsyncClient] = None
+
+# Response caches (summary keyed by minute bucket, chat by question + corpus size)
+SUMMARY_CACHE_TTL = 60
+_summary_cache: TTLCache = TTLCache(maxsize=4, ttl=SUMMARY_CACHE_TTL)
+_chat_cache: TTLCache = TTLCache(maxsize=256, ttl=SUMMARY_CACHE_TTL)
+
+# In-flight LLM requests keyed by prompt hash, so identical concurrent calls share one run.
+# Each entry is [task, number of callers awaiting it].
+_inflight: Dict[str, list] = {}
+
+# Keyword extraction cache keyed by (latest crawled_at, doc count) fingerprint
+_keywords_cache: TTLCache = TTLCache(maxsize=16, ttl=3600)
+
 # System prompt for grounding
 SYSTEM_PROMPT = """You are an analytical assistant integrated into an intelligent dashboard.
 Your role is to analyze structured and semi-structured data, detect trends, anomalies, and risks, and generate concise, decision-oriented insights.
@@ -18,12 +44,75 @@ You must explain your reasoning clearly, adapt explanations to non-technical use
 You do not hallucinate data. If information is missing, you explicitly state it.
 When citing data, reference document IDs or timestamps provided in the context."""
 
+# Punctuation stripped from chat questions before they hit the $text search
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# Grounded prompt for the executive summary
+_SUMMARY_TMPL = """Analyze this data:
+- Total documents in database: {total_docs}
+- Documents collected in last 24 hours: {recent_count}
+- Top emerging keywords: {keywords}
+- Number of active sources: {total_sources}
+
+Provide a 2-sentence executive summary highlighting the most critical insight for decision-makers."""
+
+
+def start_ollama_client() -> httpx.AsyncClient:
+    """Create the shared Ollama client if it does not exist yet."""
+    global _ollama_client
+    if _ollama_client is None or _ollama_client.is_closed:
+        _ollama_client = httpx.AsyncClient(
+            base_url=OLLAMA_HOST,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            timeout=httpx.Timeout(60.0, connect=OLLAMA_CONNECT_TIMEOUT)
+        )
+    return _ollama_client
 
-def call_llm(prompt: str, timeout: int = 120) -> str:
+
+async def close_ollama_client() -> None:
+    """Close the shared Ollama client and release its connections."""
+    global _ollama_client
+    if _ollama_client is not None:
+        await _ollama_client.aclose()
+        _ollama_client = None
+
+
+async def call_llm(prompt: str, timeout: int = 60) -> str:
     """
     Send grounded prompt to Mistral via Ollama.
+    Concurrent calls with the same prompt await a single model run.
     Falls back to heuristic response if Ollama is unavailable.
     """
+    key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    entry = _inflight.get(key)
+    if entry is None or entry[0].cancelled():
+        task = asyncio.ensure_future(_request_llm(prompt, timeout))
+        entry = [task, 0]
+        _inflight[key] = entry
+        
+        def _forget(_task: asyncio.Task) -> None:
+            if _inflight.get(key) is entry:
+                del _inflight[key]
+                
+        task.add_done_callback(_forget)
+        
+    task = entry[0]
+    entry[1] += 1
+    try:
+        # Shielded so one caller being cancelled doesn't cancel the run for the others
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        if entry[1] == 1:
+            # Nobody else is waiting; stop the model run too
+            task.cancel()
+        raise
+    finally:
+        entry[1] -= 1
+
+
+async def _request_llm(prompt: str, timeout: int) -> str:
+    """Run a single non-streaming Ollama generation."""
     try:
         payload = {
             "model": OLLAMA_MODEL,
@@ -31,16 +120,20 @@ def call_llm(prompt: str, timeout: int = 120) -> str:
             "stream": False
         }
         
-        # Increased timeout to 120s for first-run latency
-        response = requests.post(OLLAMA_API, json=payload, timeout=timeout)
+        client = start_ollama_client()
+        response = await client.post(
+            OLLAMA_API,
+            json=payload,
+            timeout=httpx.Timeout(timeout, connect=OLLAMA_CONNECT_TIMEOUT)
+        )
         
         if response.status_code == 200:
             return response.json().get("response", "LLM response unavailable.")
         else:
             raise Exception(f"Ollama returned status {response.status_code}")
             
-    except requests.exceptions.Timeout:
-        print("LLM call timed out (120s). Using fallback.")
+    except httpx.TimeoutException:
+        print(f"LLM call timed out ({timeout}s). Using fallback.")
         return generate_fallback_response(prompt)
     except Exception as e:
         # Fallback to heuristic response if Ollama not available
@@ -48,6 +141,47 @@ def call_llm(prompt: str, timeout: int = 120) -> str:
         return generate_fallback_response(prompt)
 
 
+async def stream_llm(prompt: str, timeout: int = 60) -> AsyncIterator[str]:
+    """
+    Stream a grounded Mistral response token by token via Ollama.
+    Yields the heuristic fallback response if Ollama is unavailable.
+    """
+    payload = {
+        "model": OLLAMA_MODEL,
+        "prompt": f"{SYSTEM_PROMPT}\\n\\n{prompt}",
+        "stream": True
+    }
+    
+    try:
+        client = start_ollama_client()
+        async with client.stream(
+            "POST",
+            OLLAMA_API,
+            json=payload,
+            timeout=httpx.Timeout(timeout, connect=OLLAMA_CONNECT_TIMEOUT)
+        ) as response:
+            if response.status_code != 200:
+                raise Exception(f"Ollama returned status {response.status_code}")
+                
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if chunk.get("response"):
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    break
+                    
+    except Exception as e:
+        print(f"LLM stream failed: {e}. Using fallback logic.")
+        yield generate_fallback_response(prompt)
+
+
+def _sse_event(data: Dict[str, Any]) -> str:
+    """Format a payload as a server-sent event."""
+    return f"data: {json.dumps(data)}\n\n"
+
+
 def generate_fallback_response(prompt: str) -> str:
     """Heuristic fallback when LLM is unavailable."""
     if "spike" in prompt.lower() or "anomaly" in prompt.lower():
@@ -58,49 +192,80 @@ def generate_fallback_response(prompt: str) -> str:
         return "Analysis in progress. Please ensure Ollama is running for full LLM capabilities."
 
 
+async def _build_summary_context() -> Dict[str, Any]:
+    """Gather grounding data and build the executive summary prompt."""
+    # 1. Gather Grounding Data
+    global_stats = await run_blocking(db_manager.get_global_stats)
+    total_docs = global_stats.get("total_documents", 0)
+    
+    # 2. Fetch the 50 most recent snippets (indexed top-k read) and the
+    # indexed 24h count concurrently
+    last_24h = datetime.utcnow() - timedelta(hours=24)
+    projection = {
+        "crawled_at": 1,
+        "cleaned_text": {"$substrCP": [{"$ifNull": ["$cleaned_text", ""]}, 0, 500]}
+    }
+    docs, recent_count = await asyncio.gather(
+        run_blocking(lambda: list(
+            db_manager.documents.find({}, projection).sort("crawled_at", -1).limit(50)
+        )),
+        run_blocking(db_manager.documents.count_documents, {"crawled_at": {"$gte": last_24h}})
+    )
+    
+    # 3. Get Recent Keywords (Semantic Layer), reusing them until a new document arrives
+    fingerprint = (docs[0].get("crawled_at"), len(docs)) if docs else None
+    top_keywords = _keywords_cache.get(fingerprint)
+    
+    if top_keywords is None:
+        # Snippets are already truncated server-side
+        buf = io.StringIO()
+        for d in docs:
+            buf.write(d.get("cleaned_text", ""))
+            buf.write(" ")
+        combined_text = buf.getvalue().strip()
+        top_keywords = await run_blocking(intelligent_extractor.get_best_keywords, combined_text, top_n=5) if combined_text else []
+        _keywords_cache[fingerprint] = top_keywords
+        
+    keywords_str = ", ".join(top_keywords) if top_keywords else "No keywords extracted"
+    
+    # 4. Build Grounded Prompt
+    grounding_context = _SUMMARY_TMPL.format(
+        total_docs=total_docs,
+        recent_count=recent_count,
+        keywords=keywords_str,
+        total_sources=global_stats.get('total_sources', 0)
+    )
+    
+    return {
+        "prompt": grounding_context,
+        "top_keywords": top_keywords,
+        "recent_count": recent_count
+    }
+
+
 @router.get("/summary")
 async def get_decision_summary():
     """
     Generates an executive-level summary grounded in the NoSQL database.
+    Results are cached per minute since inputs only change as documents are crawled.
     """
-    try:
-        # 1. Gather Grounding Data
-        global_stats = db_manager.get_global_stats()
-        total_docs = global_stats.get("total_documents", 0)
-        
-        # 2. Get Recent Keywords (Semantic Layer)
-        pipeline = [
-            {"$project": {"cleaned_text": 1, "crawled_at": 1}},
-            {"$sort": {"crawled_at": -1}},
-            {"$limit": 50}
-        ]
-        docs = list(db_manager.documents.aggregate(pipeline))
-        combined_text = " ".join([d.get("cleaned_text", "")[:500] for d in docs])  # Limit text length
-        
-        top_keywords = intelligent_extractor.get_best_keywords(combined_text, top_n=5) if combined_text else []
-        keywords_str = ", ".join([k[0] for k in top_keywords]) if top_keywords else "No keywords extracted"
+    cache_key = int(time.time() // SUMMARY_CACHE_TTL)
+    cached = _summary_cache.get(cache_key)
+    if cached is not None:
+        return cached
         
-        # 3. Count documents in last 24h for trend detection
-        last_24h = datetime.utcnow() - timedelta(hours=24)
-        recent_count = db_manager.documents.count_documents({"crawled_at": {"$gte": last_24h}})
-        
-        # 4. Build Grounded Prompt
-        grounding_context = f"""Analyze this data:
-- Total documents in database: {total_docs}
-- Documents collected in last 24 hours: {recent_count}
-- Top emerging keywords: {keywords_str}
-- Number of active sources: {global_stats.get('total_sources', 0)}
-
-Provide a 2-sentence executive summary highlighting the most critical insight for decision-makers."""
+    try:
+        context = await _build_summary_context()
+        top_keywords = context["top_keywords"]
         
         # 5. Call LLM
-        llm_tldr = call_llm(grounding_context, timeout=30)
+        llm_tldr = await call_llm(context["prompt"], timeout=30)
         
         # 6. Generate Insights (can also use LLM for each)
         insights = [
             {
                 "type": "trend",
-                "text": f"Primary focus detected: {top_keywords[0][0] if top_keywords else 'diverse topics'}",
+                "text": f"Primary focus detected: {top_keywords[0] if top_keywords else 'diverse topics'}",
                 "confidence": 0.92
             },
             {
@@ -113,31 +278,49 @@ Provide a 2-sentence executive summary highlighting the most critical insight fo
         summary = {
             "title": "Executive Intelligence Briefing",
             "timestamp": datetime.now().isoformat(),
-            "status": "ACTIVE" if recent_count > 0 else "STALE",
+            "status": "ACTIVE" if context["recent_count"] > 0 else "STALE",
             "tldr": llm_tldr,
             "insights": insights,
             "recommendation": "Monitor keyword evolution. Expand source coverage if concentration exceeds 60%."
         }
         
+        _summary_cache[cache_key] = summary
         return summary
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Summary generation failed: {str(e)}")
 
 
-@router.post("/chat")
-async def decision_chat(query: Dict[str, str]):
+@router.get("/summary/stream")
+async def stream_decision_summary():
     """
-    Copilot-like Q&A grounded in the database.
+    Streams the executive summary TL;DR as server-sent events while the LLM generates it.
     """
-    user_msg = query.get("message", "").lower()
-    
-    if not user_msg:
-        return {"text": "Please ask a question.", "grounding_sources": []}
+    try:
+        context = await _build_summary_context()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Summary generation failed: {str(e)}")
+        
+    async def event_stream():
+        async for token in stream_llm(context["prompt"], timeout=30):
+            yield _sse_event({"token": token})
+        yield _sse_event({"done": True, "status": "ACTIVE" if context["recent_count"] > 0 else "STALE"})
+        
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+async def _build_chat_prompt(user_msg: str, keywords: str) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Search grounding documents and build the Copilot prompt.
     
+    Args:
+        user_msg: The question as the user wrote it (quoted verbatim in the prompt)
+        keywords: Normalized question used for the $text search
+    """
     # 1. Search for grounding documents (simple keyword match)
-    search_results = db_manager.search_documents(
-        db_manager.SearchQuery(keywords=user_msg, limit=5)
+    search_results = await run_blocking(
+        db_manager.search_documents,
+        SearchQuery(keywords=keywords, limit=5)
     )
     
     # 2. Build grounding context
@@ -159,8 +342,37 @@ Grounding data from NoSQL database:
 
 Provide a concise answer based ONLY on the grounding data above. If the data doesn't answer the question, say so explicitly."""
     
-    # 4. Get LLM response
-    llm_response = call_llm(llm_prompt, timeout=30)
+    return llm_prompt, sources
+
+
+def _normalize_message(message: str) -> str:
+    """Strip punctuation and whitespace for the cache key and $text search (never the prompt)."""
+    return _PUNCT_RE.sub("", message).strip()
+
+
+@router.post("/chat")
+async def decision_chat(query: Dict[str, str]):
+    """
+    Copilot-like Q&A grounded in the database.
+    """
+    user_msg = query.get("message", "").strip()
+    keywords = _normalize_message(user_msg)
+    
+    if not keywords:
+        return {"text": "Please ask a question.", "grounding_sources": []}
+    
+    # Cache answers per question; new documents change the key and invalidate them
+    cache_key = (keywords, await run_blocking(db_manager.documents.estimated_document_count))
+    cached = _chat_cache.get(cache_key)
+    
+    if cached is None:
+        llm_prompt, sources = await _build_chat_prompt(user_msg, keywords)
+        
+        # 4. Get LLM response
+        cached = (await call_llm(llm_prompt, timeout=30), sources)
+        _chat_cache[cache_key] = cached
+        
+    llm_response, sources = cached
     
     response = {
         "text": llm_response,
@@ -169,3 +381,25 @@ Provide a concise answer based ONLY on the grounding data above. If the data doe
     }
     
     return response
+
+
+@router.post("/chat/stream")
+async def stream_decision_chat(query: Dict[str, str]):
+    """
+    Copilot-like Q&A streamed as server-sent events.
+    Emits one event per generated token, then a final event with grounding sources.
+    """
+    user_msg = query.get("message", "").strip()
+    keywords = _normalize_message(user_msg)
+    
+    if not keywords:
+        return {"text": "Please ask a question.", "grounding_sources": []}
+    
+    llm_prompt, sources = await _build_chat_prompt(user_msg, keywords)
+    
+    async def event_stream():
+        async for token in stream_llm(llm_prompt, timeout=30):
+            yield _sse_event({"token": token})
+        yield _sse_event({"done": True, "grounding_sources": sources})
+        
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
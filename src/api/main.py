@@ -6,23 +6,39 @@ Provides REST API for web crawler and reporting platform.
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from pathlib import Path
+import asyncio
+import hashlib
+import time
 import traceback
+import orjson
 
 from ..storage import db_manager
 from ..crawler.scheduler import crawl_scheduler
 from ..utils.logger import setup_logger
 from ..utils.config import settings
+from ..utils.async_utils import run_blocking
+from .decision import start_ollama_client, close_ollama_client
+from .reports import shutdown_keyword_pool
 
 logger = setup_logger(__name__)
 
+DASHBOARD_FILE = Path(__file__).parent.parent / "dashboard" / "templates" / "index.html"
+FALLBACK_HTML = b"<h1>Web Crawler & Reporting Platform</h1><p>API is running. Dashboard not found.</p>"
+
+# Serialized /health payload, rebuilt at most once per HEALTH_CACHE_TTL seconds
+HEALTH_CACHE_TTL = 1.0
+_health_bytes: bytes = b""
+_health_bytes_expires: float = 0.0
+
 # Create FastAPI app
 app = FastAPI(
     title="Web Crawler & Reporting Platform",
     description="Configurable web crawler with MongoDB storage and reporting dashboard",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -63,23 +79,40 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
+def load_dashboard() -> None:
+    """Read the dashboard page once and cache it with its ETag on app state."""
+    html = DASHBOARD_FILE.read_bytes() if DASHBOARD_FILE.exists() else FALLBACK_HTML
+    app.state.dashboard_html = html
+    app.state.dashboard_etag = f'"{hashlib.md5(html).hexdigest()}"'
+
+
 # Startup and shutdown events
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
     try:
-        # Connect to MongoDB
-        db_manager.connect()
+        # Connect to MongoDB and start scheduler concurrently (independent of each other)
+        await asyncio.gather(
+            run_blocking(db_manager.connect),
+            run_blocking(crawl_scheduler.start)
+        )
         logger.info("MongoDB connected")
-        
-        # Start scheduler
-        crawl_scheduler.start()
         logger.info("Crawler scheduler started")
         
-        # Load existing source schedules
-        count = crawl_scheduler.load_all_sources()
+        # Open pooled Ollama client
+        start_ollama_client()
+        logger.info("Ollama client initialized")
+        
+        # Cache dashboard page in memory
+        load_dashboard()
+        
+        # Load existing source schedules (requires MongoDB)
+        count = await run_blocking(crawl_scheduler.load_all_sources)
         logger.info(f"Loaded {count} scheduled crawl jobs")
         
+        # Keep search suggestion keywords fresh
+        crawl_scheduler.add_keyword_stats_job()
+        
     except Exception as e:
         logger.error(f"Startup failed: {e}")
         raise
@@ -93,6 +126,14 @@ async def shutdown_event():
         crawl_scheduler.shutdown(wait=True)
         logger.info("Crawler scheduler shut down")
         
+        # Close pooled Ollama client
+        await close_ollama_client()
+        logger.info("Ollama client closed")
+        
+        # Stop keyword extraction worker pool
+        shutdown_keyword_pool()
+        logger.info("Keyword extraction pool shut down")
+        
         # Disconnect from MongoDB
         db_manager.disconnect()
         logger.info("MongoDB disconnected")
@@ -105,26 +146,34 @@ async def shutdown_event():
 @app.get("/health", tags=["System"])
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "mongodb": db_manager._connected,
-        "scheduler": crawl_scheduler.scheduler.running
-    }
+    global _health_bytes, _health_bytes_expires
+    now = time.monotonic()
+    
+    if now >= _health_bytes_expires:
+        _health_bytes = orjson.dumps({
+            "status": "healthy",
+            "mongodb": db_manager._connected,
+            "scheduler": crawl_scheduler.scheduler.running
+        })
+        _health_bytes_expires = now + HEALTH_CACHE_TTL
+        
+    return Response(content=_health_bytes, media_type="application/json")
 
 
 # Root endpoint
 @app.get("/", response_class=HTMLResponse, tags=["System"])
-async def root():
+async def root(request: Request):
     """Serve dashboard."""
-    dashboard_file = Path(__file__).parent.parent / "dashboard" / "templates" / "index.html"
+    if not hasattr(app.state, "dashboard_html"):
+        load_dashboard()
+        
+    etag = app.state.dashboard_etag
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
     
-    if dashboard_file.exists():
-        return HTMLResponse(content=dashboard_file.read_text(encoding='utf-8'), status_code=200)
-    else:
-        return HTMLResponse(
-            content="<h1>Web Crawler & Reporting Platform</h1><p>API is running. Dashboard not found.</p>",
-            status_code=200
-        )
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+    return HTMLResponse(content=app.state.dashboard_html, status_code=200, headers=headers)
 
 
 # Mount static files
@@ -3,10 +3,12 @@ Projects API router.
 Handles CRUD operations for projects.
 """
 
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional
 from ..storage import db_manager
 from ..storage.models import Project
+from ..utils.async_utils import run_blocking
 
 router = APIRouter()
 
@@ -15,7 +17,7 @@ router = APIRouter()
 async def create_project(project: Project) -> dict:
     """Create a new project."""
     try:
-        project_id = db_manager.create_project(project)
+        project_id = await run_blocking(db_manager.create_project, project)
         return {"id": project_id, "message": "Project created successfully"}
     except Exception as e:
         raise HTTPException(
@@ -25,27 +27,34 @@ async def create_project(project: Project) -> dict:
 
 
 @router.get("/", response_model=List[Project])
-async def list_projects() -> List[Project]:
+async def list_projects(
+    include: Optional[str] = Query(None, description="Set to 'stats' to add source and document counts")
+) -> ORJSONResponse:
     """List all projects."""
-    return db_manager.list_projects()
+    if include == "stats":
+        return ORJSONResponse(await run_blocking(db_manager.list_projects_with_stats))
+        
+    projects = await run_blocking(db_manager.list_projects)
+    # Already validated on load; dump directly to skip response_model re-validation
+    return ORJSONResponse([project.model_dump() for project in projects])
 
 
 @router.get("/{project_id}", response_model=Project)
-async def get_project(project_id: str) -> Project:
+async def get_project(project_id: str) -> ORJSONResponse:
     """Get project by ID."""
-    project = db_manager.get_project(project_id)
+    project = await run_blocking(db_manager.get_project, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project {project_id} not found"
         )
-    return project
+    return ORJSONResponse(project.model_dump())
 
 
 @router.put("/{project_id}")
 async def update_project(project_id: str, updates: dict) -> dict:
     """Update project fields."""
-    success = db_manager.update_project(project_id, updates)
+    success = await run_blocking(db_manager.update_project, project_id, updates)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -57,7 +66,7 @@ async def update_project(project_id: str, updates: dict) -> dict:
 @router.delete("/{project_id}")
 async def delete_project(project_id: str) -> dict:
     """Delete project and all associated sources."""
-    success = db_manager.delete_project(project_id)
+    success = await run_blocking(db_manager.delete_project, project_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -3,12 +3,22 @@ Reporting and export API endpoints.
 Generates reports and exports data in various formats.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
 from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+from cachetools import TTLCache
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
 import csv
+import functools
+import hashlib
 import io
+import multiprocessing
+import os
+import orjson
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
@@ -16,12 +26,143 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.units import inch
 
 from ..storage import db_manager, ContentType
-from ..processing.text_cleaner import TextCleaner
+from ..processing.text_cleaner import text_cleaner
 from ..utils.logger import setup_logger
+from ..utils.async_utils import run_blocking
 
 logger = setup_logger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Worker processes for in-request keyword extraction (created on first use)
+KEYWORD_POOL_WORKERS = min(4, os.cpu_count() or 1)
+_keyword_pool: Optional[ProcessPoolExecutor] = None
+
+# Rows written to the CSV buffer before it is flushed to the client
+CSV_BATCH_ROWS = 500
+
+# PDF table styling, built once at import
+REPORT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+PDF_STYLES = getSampleStyleSheet()
+
+# Document fields written to the CSV export (skips raw_content and cleaned_text)
+DOCUMENT_EXPORT_PROJECTION = {
+    "_id": 0,
+    "url": 1,
+    "metadata.title": 1,
+    "content_type": 1,
+    "source_id": 1,
+    "crawled_at": 1,
+    "metadata.word_count": 1
+}
+
+# Source fields read by the summary report
+SOURCE_REPORT_PROJECTION = {
+    "name": 1,
+    "total_documents": 1,
+    "last_crawl": 1
+}
+
+# Report responses keyed on (endpoint, params, data version)
+REPORT_CACHE_TTL = 60
+_report_cache: TTLCache = TTLCache(maxsize=256, ttl=REPORT_CACHE_TTL)
+REPORT_CACHE_CONTROL = f"public, max-age={REPORT_CACHE_TTL}, stale-while-revalidate=30"
+
+# Rendered PDF exports keyed on (report type, source, data version)
+_pdf_cache: TTLCache = TTLCache(maxsize=16, ttl=REPORT_CACHE_TTL)
+
+
+def _get_keyword_pool() -> ProcessPoolExecutor:
+    """
+    Create the keyword extraction process pool on first use.
+    
+    Workers are spawned rather than forked: the API process runs the
+    scheduler and driver threads, whose locks a forked child would inherit.
+    """
+    global _keyword_pool
+    if _keyword_pool is None:
+        _keyword_pool = ProcessPoolExecutor(
+            max_workers=KEYWORD_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _keyword_pool
+
+
+def shutdown_keyword_pool() -> None:
+    """Shut down the keyword extraction process pool."""
+    global _keyword_pool
+    if _keyword_pool is not None:
+        _keyword_pool.shutdown(wait=False, cancel_futures=True)
+        _keyword_pool = None
+
+
+def _extract_batch(texts: List[str]) -> Counter:
+    """Count keywords over a batch of texts (runs in a worker process)."""
+    counts: Counter = Counter()
+    for text in texts:
+        counts.update(text_cleaner.extract_keywords(text, top_n=50))
+    return counts
+
+
+async def _count_keywords(texts: List[str]) -> Counter:
+    """
+    Count keywords across texts, spreading batches over the process pool.
+    
+    Args:
+        texts: Document texts
+        
+    Returns:
+        Merged keyword counts
+    """
+    if not texts:
+        return Counter()
+        
+    pool = _get_keyword_pool()
+    batch_size = -(-len(texts) // KEYWORD_POOL_WORKERS)
+    batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    
+    loop = asyncio.get_running_loop()
+    counters = await asyncio.gather(*[
+        loop.run_in_executor(pool, _extract_batch, batch) for batch in batches
+    ])
+    # Merge in place; sum() would allocate a new Counter per batch
+    merged: Counter = Counter()
+    for counter in counters:
+        merged.update(counter)
+    return merged
+
+
+def cached_report(func):
+    """
+    Cache an async report endpoint's result by its parameters.
+    
+    The key includes db_manager.data_version, so finished crawls and
+    deletions invalidate cached reports before the TTL expires.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            key = (func.__name__, args, tuple(sorted(kwargs.items())), db_manager.data_version)
+            hash(key)
+        except TypeError:
+            return await func(*args, **kwargs)
+            
+        cached = _report_cache.get(key)
+        if cached is None:
+            cached = await func(*args, **kwargs)
+            _report_cache[key] = cached
+        return cached
+        
+    return wrapper
 
 
 # Response models
@@ -46,9 +187,214 @@ class CrawlTimelineItem(BaseModel):
     document_count: int
 
 
+# Report data helpers (shared by endpoints and exporters)
+@cached_report
+async def _keyword_frequency_data(
+    top_n: int,
+    source_id: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Compute keyword frequencies shared by the report endpoint and exporters.
+    
+    Args:
+        top_n: Number of top keywords to return
+        source_id: Optional source filter
+        date_from: Optional start date filter
+        date_to: Optional end date filter
+        
+    Returns:
+        List of {"keyword", "frequency"} dicts
+    """
+    # Count keywords stored at ingestion time
+    top_keywords = await run_blocking(
+        db_manager.get_keyword_frequencies,
+        top_n=top_n,
+        source_id=source_id,
+        date_from=date_from,
+        date_to=date_to
+    )
+    
+    if not top_keywords:
+        # Documents ingested before keywords were stored: extract them here
+        texts = await run_blocking(
+            db_manager.list_document_texts,
+            source_id=source_id,
+            date_from=date_from,
+            date_to=date_to,
+            limit=1000  # Limit for performance
+        )
+        
+        # Extract and count keywords across worker processes
+        keyword_counts = await _count_keywords(texts)
+        
+        # Get top N
+        top_keywords = [
+            {"keyword": kw, "frequency": count}
+            for kw, count in keyword_counts.most_common(top_n)
+        ]
+    
+    return top_keywords
+
+
+@cached_report
+async def _source_summary_data() -> List[Dict[str, Any]]:
+    """
+    Compute the per-source summary shared by the report endpoint and exporters.
+    
+    Returns:
+        List of sources with document counts
+    """
+    sources = await run_blocking(
+        lambda: list(db_manager.sources.find({}, SOURCE_REPORT_PROJECTION).limit(1000))
+    )
+    
+    summary = [
+        {
+            "source_id": str(source["_id"]),
+            "source_name": source.get("name"),
+            "document_count": source.get("total_documents", 0),
+            "last_crawl": source["last_crawl"].isoformat() if source.get("last_crawl") else None
+        }
+        for source in sources
+    ]
+    
+    return summary
+
+
+@cached_report
+async def _crawl_timeline_data(days: int) -> List[Dict[str, Any]]:
+    """
+    Compute daily crawl activity for the last `days` days.
+    
+    Args:
+        days: Number of days to include in timeline
+        
+    Returns:
+        Timeline of crawl activity
+    """
+    # Calculate date range
+    end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=days)
+    
+    # Group crawl stats by day in MongoDB
+    pipeline = [
+        {"$match": {"started_at": {"$gte": start_date, "$lte": end_date}}},
+        {"$group": {
+            "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$started_at"}},
+            "crawl_count": {"$sum": 1},
+            "documents_collected": {"$sum": {"$ifNull": ["$pages_crawled", 0]}}
+        }},
+        {"$sort": {"_id": 1}},
+        {"$project": {"_id": 0, "date": "$_id", "crawl_count": 1, "documents_collected": 1}}
+    ]
+    
+    timeline = await run_blocking(lambda: list(db_manager.crawl_stats.aggregate(pipeline)))
+    
+    return timeline
+
+
+@cached_report
+async def _content_type_distribution_data() -> List[Dict[str, Any]]:
+    """
+    Compute the distribution of documents by content type.
+    
+    Returns:
+        Content type distribution
+    """
+    # Aggregate by content_type (leading $sort lets the content_type index drive the group)
+    pipeline = [
+        {"$sort": {"content_type": 1}},
+        {"$group": {
+            "_id": "$content_type",
+            "count": {"$sum": 1}
+        }},
+        {"$sort": {"count": -1}}
+    ]
+    
+    results = await run_blocking(lambda: list(db_manager.documents.aggregate(pipeline)))
+    
+    distribution = [
+        {
+            "content_type": item["_id"],
+            "count": item["count"]
+        }
+        for item in results
+    ]
+    
+    return distribution
+
+
+@cached_report
+async def _blocking_stats_data() -> Dict[str, Any]:
+    """
+    Compute blocking statistics across sources.
+    
+    Returns:
+        Blocking statistics
+    """
+    # Status counts and blocked-source details in one round-trip
+    pipeline = [
+        {"$facet": {
+            "counts": [
+                {"$group": {"_id": "$status", "n": {"$sum": 1}}}
+            ],
+            "blocked": [
+                {"$match": {"status": "blocked"}},
+                {"$limit": 1000},
+                {"$project": {"_id": 0, "name": 1, "content_type": 1, "last_error": 1}}
+            ]
+        }}
+    ]
+    facets = await run_blocking(lambda: next(db_manager.sources.aggregate(pipeline), {}))
+    
+    counts = {row["_id"]: row["n"] for row in facets.get("counts", [])}
+    
+    return {
+        "total": sum(counts.values()),
+        "blocked": counts.get("blocked", 0),
+        "healthy": counts.get("idle", 0) + counts.get("completed", 0),
+        "running": counts.get("running", 0),
+        "failed": counts.get("failed", 0),
+        "blocked_sources": [
+            {
+                "name": s.get("name"),
+                "content_type": s.get("content_type"),
+                "error": s.get("last_error") or "Unknown"
+            }
+            for s in facets.get("blocked", [])
+        ]
+    }
+
+
+def _etag_response(request: Request, payload: Any) -> Response:
+    """
+    Serialize a report payload with a content-hash ETag.
+    
+    Returns 304 Not Modified when the client already holds the same body.
+    
+    Args:
+        request: Incoming request
+        payload: JSON-serializable report data
+        
+    Returns:
+        JSON response or empty 304 response
+    """
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": REPORT_CACHE_CONTROL}
+    
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # Endpoints
 @router.get("/keyword-frequency")
 async def get_keyword_frequency(
+    request: Request,
     top_n: int = Query(20, ge=1, le=100, description="Number of top keywords"),
     source_id: Optional[str] = Query(None, description="Filter by source ID"),
     date_from: Optional[datetime] = Query(None, description="Filter from date"),
@@ -67,38 +413,13 @@ async def get_keyword_frequency(
         List of keywords with frequencies
     """
     try:
-        # Get documents
-        documents = db_manager.list_documents(
+        result = await _keyword_frequency_data(
+            top_n=top_n,
             source_id=source_id,
-            limit=1000  # Limit for performance
+            date_from=date_from,
+            date_to=date_to
         )
-        
-        # Aggregate keyword frequencies
-        text_cleaner = TextCleaner()
-        all_keywords = []
-        
-        for doc in documents:
-            # Filter by date if specified
-            if date_from and doc.crawled_at < date_from:
-                continue
-            if date_to and doc.crawled_at > date_to:
-                continue
-                
-            # Extract keywords
-            keywords = text_cleaner.extract_keywords(doc.cleaned_text, top_n=50)
-            all_keywords.extend(keywords)
-            
-        # Count frequencies
-        from collections import Counter
-        keyword_counts = Counter(all_keywords)
-        
-        # Get top N
-        top_keywords = [
-            {"keyword": kw, "frequency": count}
-            for kw, count in keyword_counts.most_common(top_n)
-        ]
-        
-        return top_keywords
+        return _etag_response(request, result)
         
     except Exception as e:
         logger.error(f"Failed to generate keyword frequency report: {e}")
@@ -109,7 +430,7 @@ async def get_keyword_frequency(
 
 
 @router.get("/source-summary")
-async def get_source_summary():
+async def get_source_summary(request: Request):
     """
     Get summary of documents per source.
     
@@ -117,19 +438,7 @@ async def get_source_summary():
         List of sources with document counts
     """
     try:
-        sources = db_manager.list_sources(limit=1000)
-        
-        summary = [
-            {
-                "source_id": source.id,
-                "source_name": source.name,
-                "document_count": source.total_documents,
-                "last_crawl": source.last_crawl.isoformat() if source.last_crawl else None
-            }
-            for source in sources
-        ]
-        
-        return summary
+        return _etag_response(request, await _source_summary_data())
         
     except Exception as e:
         logger.error(f"Failed to generate source summary: {e}")
@@ -141,6 +450,7 @@ async def get_source_summary():
 
 @router.get("/crawl-timeline")
 async def get_crawl_timeline(
+    request: Request,
     days: int = Query(30, ge=1, le=365, description="Number of days to include")
 ):
     """
@@ -153,36 +463,7 @@ async def get_crawl_timeline(
         Timeline of crawl activity
     """
     try:
-        # Calculate date range
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=days)
-        
-        # Get crawl stats
-        stats_list = list(db_manager.crawl_stats.find({
-            "started_at": {"$gte": start_date, "$lte": end_date}
-        }))
-        
-        # Group by date
-        timeline_dict: Dict[str, Dict[str, int]] = {}
-        
-        for stat in stats_list:
-            date_key = stat["started_at"].date().isoformat()
-            if date_key not in timeline_dict:
-                timeline_dict[date_key] = {"crawl_count": 0, "documents_collected": 0}
-            timeline_dict[date_key]["crawl_count"] += 1
-            timeline_dict[date_key]["documents_collected"] += stat.get("pages_crawled", 0)
-            
-        # Convert to list
-        timeline = [
-            {
-                "date": date_key,
-                "crawl_count": data["crawl_count"],
-                "documents_collected": data["documents_collected"]
-            }
-            for date_key, data in sorted(timeline_dict.items())
-        ]
-        
-        return timeline
+        return _etag_response(request, await _crawl_timeline_data(days=days))
         
     except Exception as e:
         logger.error(f"Failed to generate crawl timeline: {e}")
@@ -193,7 +474,7 @@ async def get_crawl_timeline(
 
 
 @router.get("/content-type-distribution")
-async def get_content_type_distribution():
+async def get_content_type_distribution(request: Request):
     """
     Get distribution of documents by content type.
     
@@ -201,26 +482,7 @@ async def get_content_type_distribution():
         Content type distribution
     """
     try:
-        # Aggregate by content_type
-        pipeline = [
-            {"$group": {
-                "_id": "$content_type",
-                "count": {"$sum": 1}
-            }},
-            {"$sort": {"count": -1}}
-        ]
-        
-        results = list(db_manager.documents.aggregate(pipeline))
-        
-        distribution = [
-            {
-                "content_type": item["_id"],
-                "count": item["count"]
-            }
-            for item in results
-        ]
-        
-        return distribution
+        return _etag_response(request, await _content_type_distribution_data())
         
     except Exception as e:
         logger.error(f"Failed to get content type distribution: {e}")
@@ -231,7 +493,7 @@ async def get_content_type_distribution():
 
 
 @router.get("/blocking-stats")
-async def get_blocking_stats():
+async def get_blocking_stats(request: Request):
     """
     Get blocking statistics per source.
     
@@ -239,28 +501,7 @@ async def get_blocking_stats():
         Blocking statistics
     """
     try:
-        sources = db_manager.list_sources(limit=1000)
-        
-        blocked = [s for s in sources if s.status == "blocked"]
-        healthy = [s for s in sources if s.status in ["idle", "completed"]]
-        running = [s for s in sources if s.status == "running"]
-        failed = [s for s in sources if s.status == "failed"]
-        
-        return {
-            "total": len(sources),
-            "blocked": len(blocked),
-            "healthy": len(healthy),
-            "running": len(running),
-            "failed": len(failed),
-            "blocked_sources": [
-                {
-                    "name": s.name,
-                    "content_type": s.content_type.value,
-                    "error": s.last_error or "Unknown"
-                }
-                for s in blocked
-            ]
-        }
+        return _etag_response(request, await _blocking_stats_data())
         
     except Exception as e:
         logger.error(f"Failed to get blocking stats: {e}")
@@ -286,46 +527,38 @@ async def export_csv(
         CSV file
     """
     try:
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
         if report_type == "keywords":
             # Export keyword frequency
-            result = await get_keyword_frequency(top_n=100, source_id=source_id)
-            writer.writerow(["Keyword", "Frequency"])
-            for item in result:
-                writer.writerow([item["keyword"], item["frequency"]])
-                
+            result = await _keyword_frequency_data(
+                top_n=100,
+                source_id=source_id,
+                date_from=None,
+                date_to=None
+            )
+            header = ["Keyword", "Frequency"]
+            rows = ([item["keyword"], item["frequency"]] for item in result)
+            
         elif report_type == "sources":
             # Export source summary
-            result = await get_source_summary()
-            writer.writerow(["Source ID", "Source Name", "Document Count", "Last Crawl"])
-            for item in result:
-                writer.writerow([
+            result = await _source_summary_data()
+            header = ["Source ID", "Source Name", "Document Count", "Last Crawl"]
+            rows = (
+                [
                     item["source_id"],
                     item["source_name"],
                     item["document_count"],
                     item["last_crawl"] or "Never"
-                ])
-                
-        elif report_type == "documents":
-            # Export documents
-            documents = db_manager.list_documents(source_id=source_id, limit=1000)
-            writer.writerow(["URL", "Title", "Content Type", "Source ID", "Crawled At", "Word Count"])
-            for doc in documents:
-                writer.writerow([
-                    doc.url,
-                    doc.metadata.title or "Untitled",
-                    doc.content_type.value,
-                    doc.source_id,
-                    doc.crawled_at.isoformat(),
-                    doc.metadata.word_count
-                ])
-                
-        csv_content = output.getvalue()
-        
-        return Response(
-            content=csv_content,
+                ]
+                for item in result
+            )
+            
+        else:
+            # Export documents, read lazily from the cursor while streaming
+            header = ["URL", "Title", "Content Type", "Source ID", "Crawled At", "Word Count"]
+            rows = _document_rows(source_id, limit=1000)
+            
+        return StreamingResponse(
+            _iter_csv(header, rows),
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename={report_type}_export.csv"
@@ -340,6 +573,98 @@ async def export_csv(
         )
 
 
+def _iter_csv(header: List[str], rows: Iterable[List[Any]]) -> Iterator[str]:
+    """
+    Yield CSV text in batches of CSV_BATCH_ROWS rows.
+    
+    Args:
+        header: Column names
+        rows: Row values
+        
+    Yields:
+        CSV chunks
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % CSV_BATCH_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            
+    yield buffer.getvalue()
+
+
+def _document_rows(source_id: Optional[str], limit: int) -> Iterator[List[Any]]:
+    """Yield document export rows straight from a MongoDB cursor."""
+    query = {"source_id": source_id} if source_id else {}
+    cursor = db_manager.documents.find(
+        query, DOCUMENT_EXPORT_PROJECTION
+    ).sort("crawled_at", -1).limit(limit).batch_size(CSV_BATCH_ROWS)
+    
+    for doc in cursor:
+        metadata = doc.get("metadata") or {}
+        crawled_at = doc.get("crawled_at")
+        yield [
+            doc.get("url"),
+            metadata.get("title") or "Untitled",
+            doc.get("content_type"),
+            doc.get("source_id"),
+            crawled_at.isoformat() if crawled_at else "",
+            metadata.get("word_count", 0)
+        ]
+
+
+def _render_pdf(report_type: str, rows: Tuple[Tuple[str, ...], ...], generated_at: str) -> bytes:
+    """
+    Render a report table as PDF bytes.
+    
+    Args:
+        report_type: Type of report (keywords, sources)
+        rows: Table rows including the header row
+        generated_at: Timestamp printed under the title
+        
+    Returns:
+        PDF content
+    """
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    elements = []
+    
+    # Title
+    title_text = f"{report_type.capitalize()} Report"
+    elements.append(Paragraph(title_text, PDF_STYLES['Title']))
+    elements.append(Spacer(1, 0.3 * inch))
+    
+    # Timestamp
+    elements.append(Paragraph(f"Generated: {generated_at} UTC", PDF_STYLES['Normal']))
+    elements.append(Spacer(1, 0.3 * inch))
+    
+    table = Table([list(row) for row in rows])
+    table.setStyle(REPORT_TABLE_STYLE)
+    elements.append(table)
+    
+    # Build PDF
+    doc.build(elements)
+    pdf_content = buffer.getvalue()
+    buffer.close()
+    return pdf_content
+
+
+def _pdf_response(report_type: str, pdf_content: bytes) -> Response:
+    """Wrap rendered PDF bytes in a download response."""
+    return Response(
+        content=pdf_content,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename={report_type}_report.pdf"
+        }
+    )
+
+
 @router.get("/export/pdf")
 async def export_pdf(
     report_type: str = Query(..., pattern="^(keywords|sources)$"),
@@ -356,80 +681,43 @@ async def export_pdf(
         PDF file
     """
     try:
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
-        styles = getSampleStyleSheet()
-        elements = []
-        
-        # Title
-        title_text = f"{report_type.capitalize()} Report"
-        title = Paragraph(title_text, styles['Title'])
-        elements.append(title)
-        elements.append(Spacer(1, 0.3 * inch))
-        
-        # Timestamp
-        timestamp = Paragraph(f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC", styles['Normal'])
-        elements.append(timestamp)
-        elements.append(Spacer(1, 0.3 * inch))
-        
+        # Reuse the PDF rendered for this data version; its timestamp is at most REPORT_CACHE_TTL old
+        cache_key = (report_type, source_id, db_manager.data_version)
+        pdf_content = _pdf_cache.get(cache_key)
+        if pdf_content is not None:
+            return _pdf_response(report_type, pdf_content)
+            
         if report_type == "keywords":
             # Keyword frequency table
-            result = await get_keyword_frequency(top_n=50, source_id=source_id)
+            result = await _keyword_frequency_data(
+                top_n=50,
+                source_id=source_id,
+                date_from=None,
+                date_to=None
+            )
             
-            data = [["Keyword", "Frequency"]]
-            for item in result:
-                data.append([item["keyword"], str(item["frequency"])])
-                
-            table = Table(data)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            elements.append(table)
+            rows = (("Keyword", "Frequency"),) + tuple(
+                (item["keyword"], str(item["frequency"])) for item in result
+            )
             
-        elif report_type == "sources":
+        else:
             # Source summary table
-            result = await get_source_summary()
+            result = await _source_summary_data()
             
-            data = [["Source Name", "Documents", "Last Crawl"]]
-            for item in result:
-                data.append([
+            rows = (("Source Name", "Documents", "Last Crawl"),) + tuple(
+                (
                     item["source_name"],
                     str(item["document_count"]),
                     item["last_crawl"] or "Never"
-                ])
-                
-            table = Table(data)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            elements.append(table)
+                )
+                for item in result
+            )
             
-        # Build PDF
-        doc.build(elements)
-        pdf_content = buffer.getvalue()
-        buffer.close()
+        generated_at = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        pdf_content = await run_blocking(_render_pdf, report_type, rows, generated_at)
+        _pdf_cache[cache_key] = pdf_content
         
-        return Response(
-            content=pdf_content,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename={report_type}_report.pdf"
-            }
-        )
+        return _pdf_response(report_type, pdf_content)
         
     except Exception as e:
         logger.error(f"Failed to export PDF: {e}")
@@ -6,11 +6,13 @@ Provides keyword-based search functionality.
 from typing import List, Optional
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
-from ..storage import ContentType, SearchResult
+from ..storage import db_manager, ContentType, SearchResult
 from ..processing.search import search_engine
 from ..utils.logger import setup_logger
+from ..utils.async_utils import run_blocking
 
 logger = setup_logger(__name__)
 
@@ -70,7 +72,8 @@ async def search_documents(
     try:
         # Execute search
         if operator == "OR":
-            results = search_engine.search_with_boolean(
+            results, total = await run_blocking(
+                search_engine.search_with_boolean,
                 keywords=q,
                 operator="OR",
                 source_id=source_id,
@@ -81,7 +84,8 @@ async def search_documents(
                 offset=offset
             )
         else:
-            results = search_engine.search(
+            results, total = await run_blocking(
+                search_engine.search,
                 keywords=q,
                 source_id=source_id,
                 content_type=content_type,
@@ -91,28 +95,28 @@ async def search_documents(
                 offset=offset
             )
             
-        # Convert to response models
+        # Build plain dicts; SearchResponse stays as the documented schema only
         result_responses = [
-            SearchResultResponse(
-                document_id=r.document_id,
-                url=r.url,
-                title=r.title,
-                snippet=r.snippet,
-                relevance_score=r.relevance_score,
-                source_id=r.source_id,
-                content_type=r.content_type.value,
-                crawled_at=r.crawled_at.isoformat()
-            )
+            {
+                "document_id": r.document_id,
+                "url": r.url,
+                "title": r.title,
+                "snippet": r.snippet,
+                "relevance_score": r.relevance_score,
+                "source_id": r.source_id,
+                "content_type": r.content_type.value,
+                "crawled_at": r.crawled_at.isoformat()
+            }
             for r in results
         ]
         
-        return SearchResponse(
-            query=q,
-            total_results=len(result_responses),
-            results=result_responses,
-            limit=limit,
-            offset=offset
-        )
+        return ORJSONResponse({
+            "query": q,
+            "total_results": total,
+            "results": result_responses,
+            "limit": limit,
+            "offset": offset
+        })
         
     except Exception as e:
         logger.error(f"Search failed: {e}")
@@ -137,9 +141,17 @@ async def get_search_suggestions(
     Returns:
         List of suggestions
     """
-    # Simple implementation: return empty for now
-    # In production, this could use a keyword index or autocomplete
-    return {
-        "query": q,
-        "suggestions": []
-    }
+    try:
+        suggestions = await run_blocking(db_manager.get_keyword_suggestions, q.strip().lower(), limit)
+        
+        return {
+            "query": q,
+            "suggestions": suggestions
+        }
+        
+    except Exception as e:
+        logger.error(f"Search suggestions failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
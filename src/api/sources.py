@@ -4,12 +4,15 @@ Provides CRUD operations for crawl sources.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status
+from collections import Counter
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from ..storage import db_manager, Source, CrawlConfig, SourceType, ContentType, CrawlStatus
 from ..crawler.scheduler import crawl_scheduler
 from ..utils.logger import setup_logger
+from ..utils.async_utils import run_blocking
 
 logger = setup_logger(__name__)
 
@@ -35,6 +38,17 @@ class SourceUpdateRequest(BaseModel):
     config: Optional[CrawlConfig] = None
 
 
+class SourceBatchUpdateItem(BaseModel):
+    """A single source update within a batch."""
+    source_id: str
+    changes: SourceUpdateRequest
+
+
+class SourceBatchUpdateRequest(BaseModel):
+    """Request model for updating several sources at once."""
+    items: List[SourceBatchUpdateItem] = Field(..., min_length=1, max_length=500)
+
+
 class SourceResponse(BaseModel):
     """Response model for a source."""
     id: str
@@ -53,12 +67,13 @@ class SourceResponse(BaseModel):
 
 # Endpoints
 @router.post("/", response_model=SourceResponse, status_code=status.HTTP_201_CREATED)
-async def create_source(request: SourceCreateRequest):
+async def create_source(request: SourceCreateRequest, background_tasks: BackgroundTasks):
     """
     Create a new crawl source.
     
     Args:
         request: Source creation request
+        background_tasks: Runs scheduler updates after the response is sent
         
     Returns:
         Created source
@@ -74,14 +89,14 @@ async def create_source(request: SourceCreateRequest):
         )
         
         # Save to database
-        source_id = db_manager.create_source(source)
+        source_id = await run_blocking(db_manager.create_source, source)
         
-        # Schedule if enabled
+        # Schedule if enabled (after the response; the source is already stored)
         if source.config.enabled:
-            crawl_scheduler.add_source_job(source_id)
+            background_tasks.add_task(crawl_scheduler.add_source_job, source_id)
             
         # Get created source
-        created_source = db_manager.get_source(source_id)
+        created_source = await run_blocking(db_manager.get_source, source_id)
         
         logger.info(f"Created source: {created_source.name} (ID: {source_id})")
         
@@ -113,13 +128,15 @@ async def list_sources(
         List of sources
     """
     try:
-        sources = db_manager.list_sources(
+        sources = await run_blocking(
+            db_manager.list_sources,
             status=status_filter,
             limit=limit,
             offset=offset
         )
         
-        return [_source_to_response(source) for source in sources]
+        # Plain dicts skip per-row SourceResponse validation on this hot path
+        return ORJSONResponse([_source_to_dict(source) for source in sources])
         
     except Exception as e:
         logger.error(f"Failed to list sources: {e}")
@@ -129,6 +146,70 @@ async def list_sources(
         )
 
 
+@router.patch("/batch")
+async def batch_update_sources(request: SourceBatchUpdateRequest, background_tasks: BackgroundTasks):
+    """
+    Update several sources in one database round-trip.
+    
+    Args:
+        request: Batch of source updates
+        background_tasks: Runs scheduler updates after the response is sent
+        
+    Returns:
+        Counts of modified sources and scheduler changes
+    """
+    source_ids = [item.source_id for item in request.items]
+    duplicates = sorted(source_id for source_id, count in Counter(source_ids).items() if count > 1)
+    if duplicates:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Duplicate source IDs: {', '.join(duplicates)}"
+        )
+        
+    existing = await run_blocking(db_manager.find_existing_source_ids, source_ids)
+    missing = [source_id for source_id in source_ids if source_id not in existing]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Sources not found: {', '.join(missing)}"
+        )
+        
+    try:
+        updates = {item.source_id: _build_updates(item.changes) for item in request.items}
+        modified = await run_blocking(db_manager.bulk_update_sources, updates)
+        
+        # Apply the scheduler diff once for all existing sources whose config changed
+        configured = [
+            item for item in request.items
+            if item.source_id in existing and item.changes.config is not None
+        ]
+        to_schedule = [item.source_id for item in configured if item.changes.config.enabled]
+        to_unschedule = [item.source_id for item in configured if not item.changes.config.enabled]
+        
+        def apply_schedule_diff() -> None:
+            for source_id in to_schedule:
+                crawl_scheduler.add_source_job(source_id)
+            for source_id in to_unschedule:
+                crawl_scheduler.remove_source_job(source_id)
+                
+        background_tasks.add_task(apply_schedule_diff)
+        
+        logger.info(f"Batch updated {modified} sources")
+        
+        return {
+            "modified": modified,
+            "scheduled": len(to_schedule),
+            "unscheduled": len(to_unschedule)
+        }
+        
+    except Exception as e:
+        logger.error(f"Failed to batch update sources: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 @router.get("/{source_id}", response_model=SourceResponse)
 async def get_source(source_id: str):
     """
@@ -140,7 +221,7 @@ async def get_source(source_id: str):
     Returns:
         Source details
     """
-    source = db_manager.get_source(source_id)
+    source = await run_blocking(db_manager.get_source, source_id)
     
     if not source:
         raise HTTPException(
@@ -152,19 +233,24 @@ async def get_source(source_id: str):
 
 
 @router.put("/{source_id}", response_model=SourceResponse)
-async def update_source(source_id: str, request: SourceUpdateRequest):
+async def update_source(
+    source_id: str,
+    request: SourceUpdateRequest,
+    background_tasks: BackgroundTasks
+):
     """
     Update source configuration.
     
     Args:
         source_id: Source ID
         request: Update request
+        background_tasks: Runs scheduler updates after the response is sent
         
     Returns:
         Updated source
     """
     # Check if source exists
-    source = db_manager.get_source(source_id)
+    source = await run_blocking(db_manager.get_source, source_id)
     if not source:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -173,30 +259,20 @@ async def update_source(source_id: str, request: SourceUpdateRequest):
         
     try:
         # Build update dictionary
-        updates = {}
-        if request.name is not None:
-            updates["name"] = request.name
-        if request.url is not None:
-            updates["url"] = request.url
-        if request.source_type is not None:
-            updates["source_type"] = request.source_type.value
-        if request.content_type is not None:
-            updates["content_type"] = request.content_type.value
-        if request.config is not None:
-            updates["config"] = request.config.model_dump()
-            
+        updates = _build_updates(request)
+        
         # Update in database
-        db_manager.update_source(source_id, updates)
+        await run_blocking(db_manager.update_source, source_id, updates)
         
         # Update scheduler if config changed
         if request.config is not None:
             if request.config.enabled:
-                crawl_scheduler.add_source_job(source_id)
+                background_tasks.add_task(crawl_scheduler.add_source_job, source_id)
             else:
-                crawl_scheduler.remove_source_job(source_id)
+                background_tasks.add_task(crawl_scheduler.remove_source_job, source_id)
                 
         # Get updated source
-        updated_source = db_manager.get_source(source_id)
+        updated_source = await run_blocking(db_manager.get_source, source_id)
         
         logger.info(f"Updated source: {source_id}")
         
@@ -211,15 +287,16 @@ async def update_source(source_id: str, request: SourceUpdateRequest):
 
 
 @router.delete("/{source_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_source(source_id: str):
+async def delete_source(source_id: str, background_tasks: BackgroundTasks):
     """
     Delete source and all its documents.
     
     Args:
         source_id: Source ID
+        background_tasks: Runs scheduler updates after the response is sent
     """
     # Check if source exists
-    source = db_manager.get_source(source_id)
+    source = await run_blocking(db_manager.get_source, source_id)
     if not source:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -227,11 +304,11 @@ async def delete_source(source_id: str):
         )
         
     try:
-        # Remove from scheduler
-        crawl_scheduler.remove_source_job(source_id)
-        
         # Delete from database
-        db_manager.delete_source(source_id)
+        await run_blocking(db_manager.delete_source, source_id)
+        
+        # Remove from scheduler
+        background_tasks.add_task(crawl_scheduler.remove_source_job, source_id)
         
         logger.info(f"Deleted source: {source_id}")
         
@@ -244,6 +321,22 @@ async def delete_source(source_id: str):
 
 
 # Helper functions
+def _build_updates(request: SourceUpdateRequest) -> dict:
+    """Build the MongoDB $set fields from an update request."""
+    updates = {}
+    if request.name is not None:
+        updates["name"] = request.name
+    if request.url is not None:
+        updates["url"] = request.url
+    if request.source_type is not None:
+        updates["source_type"] = request.source_type.value
+    if request.content_type is not None:
+        updates["content_type"] = request.content_type.value
+    if request.config is not None:
+        updates["config"] = request.config.model_dump()
+    return updates
+
+
 def _source_to_response(source: Source) -> SourceResponse:
     """Convert Source model to response."""
     return SourceResponse(
@@ -260,3 +353,21 @@ def _source_to_response(source: Source) -> SourceResponse:
         created_at=source.created_at.isoformat(),
         updated_at=source.updated_at.isoformat()
     )
+
+
+def _source_to_dict(source: Source) -> dict:
+    """Convert Source model to a response dict without building SourceResponse."""
+    return {
+        "id": source.id,
+        "name": source.name,
+        "url": source.url,
+        "source_type": source.source_type.value,
+        "content_type": source.content_type.value,
+        "config": source.config.model_dump(mode="json"),
+        "status": source.status.value,
+        "last_crawl": source.last_crawl.isoformat() if source.last_crawl else None,
+        "last_error": source.last_error,
+        "total_documents": source.total_documents,
+        "created_at": source.created_at.isoformat(),
+        "updated_at": source.updated_at.isoformat()
+    }
@@ -3,19 +3,110 @@ Base crawler with politeness rules, robots.txt compliance, and retry logic.
 Provides foundation for crawling web sources responsibly.
 """
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
+from collections import OrderedDict, deque
+from functools import lru_cache
+import asyncio
+import json
+import os
+import random
+import tempfile
+import threading
 import time
 from urllib.parse import urlparse, urljoin
 from urllib.robotparser import RobotFileParser
+import aiohttp
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from ..utils.logger import setup_logger
 from ..utils.config import settings
+from ..utils.dns_cache import install_dns_cache
 
 logger = setup_logger(__name__)
 
+# urlparse is pure Python and runs several times per fetch on the same URL;
+# its ParseResult is an immutable tuple, so results can be shared
+_urlparse = lru_cache(maxsize=16384)(urlparse)
+
+# Connection pool sizing for the async fetch path
+FETCH_CONNECTION_LIMIT = 1024
+FETCH_LIMIT_PER_HOST = 64
+
+# robots.txt cache: entries expire after ROBOTS_TTL (never below ROBOTS_MIN_TTL),
+# failed fetches after ROBOTS_NEGATIVE_TTL, and at most ROBOTS_MAX domains are kept
+ROBOTS_TTL = 6 * 3600
+ROBOTS_MIN_TTL = 60
+ROBOTS_NEGATIVE_TTL = 300
+ROBOTS_MAX = 1024
+ROBOTS_MAX_BYTES = 500 * 1024
+
+# Persisted robots.txt bodies older than this are dropped when loading
+ROBOTS_PERSIST_TTL = 24 * 3600
+
+# Stored body equivalent to a 401/403 on robots.txt
+DISALLOW_ALL_ROBOTS = "User-agent: *\nDisallow: /"
+
+# Chunk size used when streaming response bodies
+READ_CHUNK_SIZE = 65536
+
+# Per-URL ETag/Last-Modified validators kept for conditional GETs
+VALIDATOR_CACHE_MAX = 10000
+
+# Returned by fetch() when the server answers 304 Not Modified
+NOT_MODIFIED = object()
+
+# Token bucket capacity per domain (1 = strict spacing, no bursts)
+RATE_LIMIT_BURST = 1
+
+# Circuit breaker: stop fetching from a domain whose failure rate over the
+# last CIRCUIT_WINDOW seconds exceeds CIRCUIT_FAILURE_RATIO. Only network
+# errors, 5xx and 429 count; broken links (404/410) are not domain failures.
+CIRCUIT_WINDOW = 60.0
+CIRCUIT_FAILURE_RATIO = 0.1
+CIRCUIT_MIN_REQUESTS = 10
+
+# Transient statuses retried by fetch_async (429/403 are left to blocking detection)
+RETRY_STATUS_CODES = {500, 502, 503, 504}
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_BACKOFF_JITTER = 0.5
+RETRY_AFTER_MAX = 120.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket; tokens go negative to reserve future slots."""
+    
+    def __init__(self, rate: float, capacity: float = RATE_LIMIT_BURST):
+        """
+        Initialize bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+        
+    def take(self) -> float:
+        """
+        Take one token.
+        
+        Returns:
+            Seconds the caller must wait before using the token (0 if available now)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
 
 class BaseCrawler:
     """Base crawler with politeness and retry logic."""
@@ -25,7 +116,8 @@ class BaseCrawler:
         user_agent: Optional[str] = None,
         delay: float = None,
         max_retries: int = None,
-        timeout: int = None
+        timeout: int = None,
+        robots_ttl: float = ROBOTS_TTL
     ):
         """
         Initialize crawler.
@@ -35,18 +127,34 @@ class BaseCrawler:
             delay: Delay between requests in seconds (defaults to settings)
             max_retries: Maximum retry attempts (defaults to settings)
             timeout: Request timeout in seconds (defaults to settings)
+            robots_ttl: Seconds before a cached robots.txt is refetched
         """
         self.user_agent = user_agent or settings.crawler_user_agent
         self.delay = delay if delay is not None else settings.crawler_delay
         self.max_retries = max_retries if max_retries is not None else settings.max_retries
         self.timeout = timeout if timeout is not None else settings.request_timeout
+        self.max_content_bytes = settings.max_content_bytes
         
+        if settings.dns_cache_enabled:
+            install_dns_cache(settings.dns_cache_ttl)
+            
         self.session = self._create_session()
-        self.robots_cache = {}  # Cache robots.txt parsers per domain
-        self.last_request_time = {}  # Track last request time per domain
+        self.robots_ttl = max(robots_ttl, ROBOTS_MIN_TTL)
+        self.robots_cache = OrderedDict()  # LRU of domain -> (parser, fetched_at)
+        self.robots_texts: Dict[str, Tuple[str, float]] = {}  # domain -> (robots.txt body, wall-clock fetch time), persisted
+        self.robots_cache_path = os.path.expanduser(settings.robots_cache_path) if settings.robots_cache_path else None
+        self.etag_cache = OrderedDict()  # LRU of url -> (ETag, Last-Modified)
+        self.buckets: Dict[str, TokenBucket] = {}  # Per-domain rate limiters
+        self.domain_delay = {}  # Effective per-domain delay, honoring robots.txt Crawl-delay
+        self.domain_results: Dict[str, deque] = {}  # Recent (time, ok) fetch outcomes per domain
+        self._rate_lock = threading.Lock()  # Guards buckets and domain_results across crawl threads
+        self._cache_lock = threading.Lock()  # Guards robots_cache, etag_cache and _robots_locks
+        self._robots_locks: Dict[str, threading.Lock] = {}  # One robots.txt fetch per domain at a time
         
         self.logger = setup_logger(self.__class__.__name__)
         
+        self._load_robots_cache()
+        
     def _create_session(self) -> requests.Session:
         """
         Create requests session with retry logic.
@@ -57,19 +165,33 @@ class BaseCrawler:
         session = requests.Session()
         
         # Configure retry strategy with exponential backoff
-        retry_strategy = Retry(
+        retry_options = dict(
             total=self.max_retries,
-            backoff_factor=1,  # Exponential backoff: {backoff factor} * (2 ** (retry_count - 1))
+            backoff_factor=RETRY_BACKOFF_FACTOR,  # Exponential backoff: {backoff factor} * (2 ** (retry_count - 1))
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
+            allowed_methods=frozenset(["HEAD", "GET", "OPTIONS"]),
+            respect_retry_after_header=True,  # Wait as long as the server asks on 429/503
+            raise_on_status=False
         )
+        try:
+            # Jitter keeps concurrent workers from retrying in lockstep (urllib3 >= 2.0)
+            retry_strategy = Retry(backoff_jitter=RETRY_BACKOFF_JITTER, **retry_options)
+        except TypeError:
+            retry_strategy = Retry(**retry_options)
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=128,
+            pool_block=False,
+            max_retries=retry_strategy
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         session.headers.update({
-            'User-Agent': self.user_agent
+            'User-Agent': self.user_agent,
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate'
         })
         
         return session
@@ -85,25 +207,10 @@ class BaseCrawler:
             True if fetching is allowed, False otherwise
         """
         try:
-            parsed = urlparse(url)
+            parsed = _urlparse(url)
             domain = f"{parsed.scheme}://{parsed.netloc}"
             
-            # Get or create robots.txt parser for this domain
-            if domain not in self.robots_cache:
-                robot_parser = RobotFileParser()
-                robot_url = urljoin(domain, '/robots.txt')
-                
-                try:
-                    robot_parser.set_url(robot_url)
-                    robot_parser.read()
-                    self.robots_cache[domain] = robot_parser
-                    self.logger.debug(f"Loaded robots.txt from {robot_url}")
-                except Exception as e:
-                    # If robots.txt cannot be fetched, assume crawling is allowed
-                    self.logger.warning(f"Failed to fetch robots.txt from {robot_url}: {e}")
-                    self.robots_cache[domain] = None
-                    
-            robot_parser = self.robots_cache.get(domain)
+            robot_parser = self._get_robots_parser(domain)
             
             if robot_parser is None:
                 # No robots.txt, allow crawling
@@ -116,6 +223,281 @@ class BaseCrawler:
             # On error, allow crawling
             return True
             
+    def _cached_robots_parser(self, domain: str) -> Tuple[bool, Optional[RobotFileParser]]:
+        """
+        Look up a fresh robots.txt parser in the cache.
+        
+        Args:
+            domain: Scheme and host, e.g. "https://example.com"
+            
+        Returns:
+            (hit, parser) where hit is False if the entry is missing or stale
+        """
+        with self._cache_lock:
+            entry = self.robots_cache.get(domain)
+            if entry is None:
+                return False, None
+                
+            robot_parser, fetched_at = entry
+            ttl = self.robots_ttl if robot_parser is not None else ROBOTS_NEGATIVE_TTL
+            if time.monotonic() - fetched_at > ttl:
+                return False, None
+                
+            self.robots_cache.move_to_end(domain)
+            return True, robot_parser
+            
+    def _get_robots_parser(self, domain: str) -> Optional[RobotFileParser]:
+        """
+        Return the cached robots.txt parser for a domain, refetching when stale.
+        
+        Concurrent callers for the same domain wait for a single fetch instead
+        of each downloading robots.txt.
+        
+        Args:
+            domain: Scheme and host, e.g. "https://example.com"
+            
+        Returns:
+            Parser, or None if robots.txt could not be fetched
+        """
+        hit, robot_parser = self._cached_robots_parser(domain)
+        if hit:
+            return robot_parser
+            
+        with self._cache_lock:
+            domain_lock = self._robots_locks.setdefault(domain, threading.Lock())
+            
+        with domain_lock:
+            hit, robot_parser = self._cached_robots_parser(domain)
+            if hit:
+                return robot_parser
+                
+            robot_parser, robots_text = self._fetch_robots(domain)
+            self._update_domain_delay(_urlparse(domain).netloc, robot_parser)
+            
+            with self._cache_lock:
+                self.robots_cache[domain] = (robot_parser, time.monotonic())
+                self.robots_cache.move_to_end(domain)
+                if robots_text is not None:
+                    self.robots_texts[domain] = (robots_text, time.time())
+                else:
+                    self.robots_texts.pop(domain, None)
+                while len(self.robots_cache) > ROBOTS_MAX:
+                    evicted, _ = self.robots_cache.popitem(last=False)
+                    self._robots_locks.pop(evicted, None)
+                    self.robots_texts.pop(evicted, None)
+                    
+        return robot_parser
+        
+    def _fetch_robots(self, domain: str) -> Tuple[Optional[RobotFileParser], Optional[str]]:
+        """
+        Download and parse robots.txt for a domain.
+        
+        Args:
+            domain: Scheme and host, e.g. "https://example.com"
+            
+        Returns:
+            (parser, body) where body is the robots.txt text to persist;
+            both are None if robots.txt could not be fetched
+        """
+        robot_url = urljoin(domain, '/robots.txt')
+        
+        try:
+            with self.session.get(robot_url, timeout=self.timeout, stream=True) as response:
+                if response.status_code in (401, 403):
+                    text = DISALLOW_ALL_ROBOTS
+                elif 400 <= response.status_code < 500:
+                    # Missing robots.txt means everything is allowed
+                    text = ""
+                else:
+                    response.raise_for_status()
+                    body = self._read_capped(response, ROBOTS_MAX_BYTES)
+                    text = body.decode(response.encoding or 'utf-8', errors='ignore')
+            self.logger.debug(f"Loaded robots.txt from {robot_url}")
+        except Exception as e:
+            # If robots.txt cannot be fetched, assume crawling is allowed
+            self.logger.warning(f"Failed to fetch robots.txt from {robot_url}: {e}")
+            return None, None
+            
+        return self._parse_robots(domain, text), text
+        
+    @staticmethod
+    def _parse_robots(domain: str, text: str) -> RobotFileParser:
+        """
+        Build a robots.txt parser from its body.
+        
+        Args:
+            domain: Scheme and host, e.g. "https://example.com"
+            text: robots.txt body (empty allows everything)
+            
+        Returns:
+            Parser
+        """
+        robot_parser = RobotFileParser(urljoin(domain, '/robots.txt'))
+        robot_parser.parse(text.splitlines())
+        return robot_parser
+        
+    def _load_robots_cache(self) -> None:
+        """Restore robots.txt entries persisted by a previous process."""
+        if not self.robots_cache_path:
+            return
+            
+        try:
+            with open(self.robots_cache_path, encoding='utf-8') as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable robots cache {self.robots_cache_path}: {e}")
+            return
+            
+        now = time.time()
+        now_monotonic = time.monotonic()
+        loaded = 0
+        
+        for domain, entry in sorted(stored.items(), key=lambda item: item[1].get('ts', 0)):
+            try:
+                text, fetched_at = entry['txt'], float(entry['ts'])
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+                
+            age = now - fetched_at
+            if not 0 <= age <= ROBOTS_PERSIST_TTL:
+                continue
+                
+            robot_parser = self._parse_robots(domain, text)
+            self.robots_cache[domain] = (robot_parser, now_monotonic - age)
+            self.robots_texts[domain] = (text, fetched_at)
+            self._update_domain_delay(_urlparse(domain).netloc, robot_parser)
+            loaded += 1
+            
+        while len(self.robots_cache) > ROBOTS_MAX:
+            evicted, _ = self.robots_cache.popitem(last=False)
+            self.robots_texts.pop(evicted, None)
+            
+        self.logger.debug(f"Restored {loaded} robots.txt entries from {self.robots_cache_path}")
+        
+    def _save_robots_cache(self) -> None:
+        """Atomically write cached robots.txt bodies for the next process."""
+        if not self.robots_cache_path:
+            return
+            
+        with self._cache_lock:
+            stored = {domain: {"txt": text, "ts": ts} for domain, (text, ts) in self.robots_texts.items()}
+            
+        directory = os.path.dirname(self.robots_cache_path) or '.'
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(stored, f)
+            os.replace(tmp_path, self.robots_cache_path)
+            self.logger.debug(f"Saved {len(stored)} robots.txt entries to {self.robots_cache_path}")
+        except OSError as e:
+            self.logger.warning(f"Failed to save robots cache to {self.robots_cache_path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+                
+    def _update_domain_delay(self, netloc: str, robot_parser: Optional[RobotFileParser]) -> None:
+        """
+        Record the delay a domain asks for via Crawl-delay / Request-rate.
+        
+        Args:
+            netloc: Domain host (key used by rate limiting)
+            robot_parser: Freshly loaded parser, or None if unavailable
+        """
+        if robot_parser is None:
+            self.domain_delay.pop(netloc, None)
+            return
+            
+        crawl_delay = robot_parser.crawl_delay(self.user_agent)
+        request_rate = robot_parser.request_rate(self.user_agent)
+        rate_delay = request_rate.seconds / request_rate.requests if request_rate and request_rate.requests else 0
+        
+        delay = max(self.delay, float(crawl_delay or 0), rate_delay)
+        if delay > self.delay:
+            self.logger.info(f"Using robots.txt delay of {delay:.2f}s for {netloc}")
+        self.domain_delay[netloc] = delay
+        
+    @staticmethod
+    def _read_capped(response: requests.Response, max_bytes: int) -> bytes:
+        """
+        Read a streamed response body, truncating it at max_bytes.
+        
+        Args:
+            response: Response opened with stream=True
+            max_bytes: Maximum number of bytes to keep
+            
+        Returns:
+            Body bytes
+        """
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=READ_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                break
+        return b''.join(chunks)[:max_bytes]
+        
+    def _take_token(self, domain: str, delay: float) -> float:
+        """
+        Take a token from the domain's bucket, creating or re-rating it as needed.
+        
+        Args:
+            domain: Domain host
+            delay: Minimum seconds between requests to the domain
+            
+        Returns:
+            Seconds to wait before sending the request
+        """
+        if delay <= 0:
+            return 0.0
+            
+        rate = 1.0 / delay
+        with self._rate_lock:
+            bucket = self.buckets.get(domain)
+            if bucket is None:
+                bucket = self.buckets[domain] = TokenBucket(rate)
+            elif bucket.rate != rate:
+                bucket.rate = rate
+        return bucket.take()
+        
+    @staticmethod
+    async def _read_capped_async(response: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+        """
+        Read an aiohttp response body, truncating it at max_bytes.
+        
+        Args:
+            response: Open aiohttp response
+            max_bytes: Maximum number of bytes to keep
+            
+        Returns:
+            Body bytes
+        """
+        buffer = bytearray()
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            buffer.extend(chunk)
+            if len(buffer) >= max_bytes:
+                break
+        return bytes(buffer[:max_bytes])
+        
+    def _too_large(self, url: str, content_length: Optional[str]) -> bool:
+        """
+        Check a declared Content-Length against max_content_bytes.
+        
+        Args:
+            url: Fetched URL (for logging)
+            content_length: Content-Length header value, if any
+            
+        Returns:
+            True if the body should not be downloaded
+        """
+        if content_length and content_length.isdigit() and int(content_length) > self.max_content_bytes:
+            self.logger.warning(f"Skipping {url}: Content-Length {content_length} exceeds {self.max_content_bytes} bytes")
+            return True
+        return False
+        
     def respect_rate_limit(self, url: str) -> None:
         """
         Enforce rate limiting by waiting if necessary.
@@ -124,21 +506,68 @@ class BaseCrawler:
             url: URL being requested (used to track per-domain delays)
         """
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc
-            
-            if domain in self.last_request_time:
-                elapsed = time.time() - self.last_request_time[domain]
-                if elapsed < self.delay:
-                    wait_time = self.delay - elapsed
-                    self.logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
-                    time.sleep(wait_time)
-                    
-            self.last_request_time[domain] = time.time()
+            domain = _urlparse(url).netloc
+            wait_time = self._take_token(domain, self.domain_delay.get(domain, self.delay))
             
+            if wait_time > 0:
+                self.logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
+                time.sleep(wait_time)
+                
         except Exception as e:
             self.logger.error(f"Error in rate limiting: {e}")
             
+    def record_result(self, url: str, ok: bool) -> None:
+        """
+        Record a fetch outcome for the domain circuit breaker.
+        
+        Args:
+            url: Fetched URL
+            ok: Whether the fetch succeeded
+        """
+        domain = _urlparse(url).netloc
+        now = time.monotonic()
+        with self._rate_lock:
+            results = self.domain_results.setdefault(domain, deque())
+            results.append((now, ok))
+            while results and now - results[0][0] > CIRCUIT_WINDOW:
+                results.popleft()
+                
+    @staticmethod
+    def is_domain_failure(status_code: Optional[int]) -> bool:
+        """
+        Check whether a response status counts against the domain circuit.
+        
+        Args:
+            status_code: HTTP status, or None for network errors and timeouts
+            
+        Returns:
+            True for network errors, 5xx and 429 responses
+        """
+        return status_code is None or status_code >= 500 or status_code == 429
+        
+    def is_circuit_open(self, url: str) -> bool:
+        """
+        Check whether a domain is failing too often to keep fetching.
+        
+        Args:
+            url: URL to check
+            
+        Returns:
+            True if more than CIRCUIT_FAILURE_RATIO of recent fetches failed
+        """
+        domain = _urlparse(url).netloc
+        now = time.monotonic()
+        with self._rate_lock:
+            results = self.domain_results.get(domain)
+            if not results:
+                return False
+            while results and now - results[0][0] > CIRCUIT_WINDOW:
+                results.popleft()
+            if len(results) < CIRCUIT_MIN_REQUESTS:
+                return False
+            failures = sum(1 for _, ok in results if not ok)
+            return failures / len(results) > CIRCUIT_FAILURE_RATIO
+            
     def fetch(self, url: str, respect_robots: bool = True) -> Optional[bytes]:
         """
         Fetch URL with politeness rules.
@@ -148,7 +577,8 @@ class BaseCrawler:
             respect_robots: Whether to respect robots.txt (default True)
             
         Returns:
-            Response content as bytes, or None if fetch failed
+            Response content as bytes, NOT_MODIFIED if unchanged since the
+            last fetch, or None if fetch failed
             
         Raises:
             ValueError: If robots.txt disallows fetching
@@ -164,18 +594,209 @@ class BaseCrawler:
         # Fetch URL
         try:
             self.logger.info(f"Fetching: {url}")
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            self.logger.debug(f"Successfully fetched {url} ({len(response.content)} bytes)")
-            return response.content
+            with self.session.get(
+                url,
+                timeout=self.timeout,
+                headers=self._conditional_headers(url),
+                stream=True
+            ) as response:
+                if response.status_code == 304:
+                    self.logger.debug(f"Not modified: {url}")
+                    self.record_result(url, True)
+                    return NOT_MODIFIED
+                response.raise_for_status()
+                
+                if self._too_large(url, response.headers.get('Content-Length')):
+                    return None
+                    
+                content = self._read_capped(response, self.max_content_bytes)
+                self.remember_validators(url, response.headers)
+                
+            self.logger.debug(f"Successfully fetched {url} ({len(content)} bytes)")
+            self.record_result(url, True)
+            return content
             
         except requests.RequestException as e:
             self.logger.error(f"Failed to fetch {url}: {e}")
+            status_code = e.response.status_code if e.response is not None else None
+            self.record_result(url, not self.is_domain_failure(status_code))
+            return None
+            
+    def create_async_session(self) -> aiohttp.ClientSession:
+        """
+        Create an aiohttp session for the async fetch path.
+        
+        The session is bound to the running event loop, so callers create one
+        per crawl and close it when the crawl finishes.
+        
+        Returns:
+            Configured aiohttp session
+        """
+        connector = aiohttp.TCPConnector(
+            limit=FETCH_CONNECTION_LIMIT,
+            limit_per_host=FETCH_LIMIT_PER_HOST,
+            use_dns_cache=True,
+            ttl_dns_cache=settings.dns_cache_ttl
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': self.user_agent},
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        
+    async def respect_rate_limit_async(self, url: str, min_delay: float = 0.0) -> None:
+        """
+        Enforce per-domain rate limiting without blocking the event loop.
+        
+        Args:
+            url: URL being requested (used to track per-domain delays)
+            min_delay: Minimum delay for this domain, on top of the crawler default
+        """
+        domain = _urlparse(url).netloc
+        delay = max(self.domain_delay.get(domain, self.delay), min_delay)
+        
+        wait_time = self._take_token(domain, delay)
+        if wait_time > 0:
+            self.logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
+            await asyncio.sleep(wait_time)
+            
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Build If-None-Match / If-Modified-Since headers from a previous fetch.
+        
+        Args:
+            url: URL about to be fetched
+            
+        Returns:
+            Headers dictionary (empty if the URL was never fetched)
+        """
+        with self._cache_lock:
+            validators = self.etag_cache.get(url)
+        if not validators:
+            return {}
+            
+        etag, last_modified = validators
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+        
+    def remember_validators(self, url: str, headers) -> None:
+        """
+        Store ETag / Last-Modified from a successful response.
+        
+        Args:
+            url: Fetched URL
+            headers: Response headers, or the validators returned by fetch_async()
+        """
+        etag = headers.get('ETag', '')
+        last_modified = headers.get('Last-Modified', '')
+        with self._cache_lock:
+            if not etag and not last_modified:
+                self.etag_cache.pop(url, None)
+                return
+                
+            self.etag_cache[url] = (etag, last_modified)
+            self.etag_cache.move_to_end(url)
+            while len(self.etag_cache) > VALIDATOR_CACHE_MAX:
+                self.etag_cache.popitem(last=False)
+                
+    @staticmethod
+    def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+        """
+        Seconds to wait before retrying, preferring the server's Retry-After.
+        
+        Args:
+            retry_after: Retry-After header value, if any
+            attempt: Zero-based attempt number
+            
+        Returns:
+            Delay in seconds
+        """
+        if retry_after and retry_after.strip().isdigit():
+            return min(float(retry_after), RETRY_AFTER_MAX)
+        return RETRY_BACKOFF_FACTOR * 2 ** attempt + random.uniform(0, RETRY_BACKOFF_JITTER)
+        
+    async def fetch_async(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        respect_robots: bool = True,
+        min_delay: float = 0.0
+    ) -> Optional[Tuple[bytes, int, Dict[str, str]]]:
+        """
+        Fetch URL asynchronously with politeness rules.
+        
+        Unlike fetch(), non-2xx responses are returned rather than swallowed so
+        that blocking detection can inspect 403/429 pages. A 304 status means
+        the page is unchanged since the last fetch. Validators are returned
+        rather than stored; pass them to remember_validators() once the
+        content has been processed so a failed parse is refetched in full.
+        
+        Args:
+            session: Session from create_async_session()
+            url: URL to fetch
+            respect_robots: Whether to respect robots.txt (default True)
+            min_delay: Minimum per-domain delay in seconds
+            
+        Returns:
+            Tuple of (content, status_code, validators), or None if fetch failed.
+            validators holds the ETag / Last-Modified headers of a 200 response.
+            
+        Raises:
+            ValueError: If robots.txt disallows fetching
+        """
+        if respect_robots and not await asyncio.to_thread(self.can_fetch, url):
+            self.logger.warning(f"Robots.txt disallows fetching: {url}")
+            raise ValueError(f"Robots.txt disallows fetching: {url}")
+            
+        if self.is_circuit_open(url):
+            self.logger.warning(f"Circuit open for {_urlparse(url).netloc}, skipping {url}")
             return None
             
+        for attempt in range(self.max_retries + 1):
+            await self.respect_rate_limit_async(url, min_delay)
+            
+            try:
+                self.logger.info(f"Fetching: {url}")
+                async with session.get(url, headers=self._conditional_headers(url)) as response:
+                    if self._too_large(url, response.headers.get('Content-Length')):
+                        return None
+                    content = await self._read_capped_async(response, self.max_content_bytes)
+                    status_code = response.status
+                    retry_after = response.headers.get('Retry-After')
+                    validators = {}
+                    if status_code == 200:
+                        validators = {
+                            name: response.headers[name]
+                            for name in ('ETag', 'Last-Modified')
+                            if name in response.headers
+                        }
+                        
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self._retry_delay(None, attempt))
+                    continue
+                self.logger.error(f"Failed to fetch {url}: {e}")
+                self.record_result(url, False)
+                return None
+                
+            if status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                await asyncio.sleep(self._retry_delay(retry_after, attempt))
+                continue
+                
+            self.record_result(url, not self.is_domain_failure(status_code))
+            self.logger.debug(f"Fetched {url} ({status_code}, {len(content)} bytes)")
+            return content, status_code, validators
+            
+        return None
+        
     def close(self) -> None:
-        """Close the session."""
+        """Persist the robots.txt cache and close the session."""
+        self._save_robots_cache()
+        
         if self.session:
             self.session.close()
             self.logger.debug("Crawler session closed")
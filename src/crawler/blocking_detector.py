@@ -3,7 +3,7 @@ Blocking detection module.
 Detects HTTP blocks (403, 429), CAPTCHAs, and IP bans.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 from bs4 import BeautifulSoup
 import re
 
@@ -11,10 +11,70 @@ from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Patterns made only of word characters and spaces can be matched as plain substrings
+_LITERAL_PATTERN_RE = re.compile(r'[\w ]+')
+_LITERAL_RUN_RE = re.compile(r'\w+')
+
+
+class PatternScanner:
+    """Case-insensitive matcher for a list of patterns, using substring search for literals."""
+    
+    def __init__(self, patterns: List[str]):
+        """
+        Initialize scanner.
+        
+        Args:
+            patterns: Lowercase patterns; literals use `in`, the rest compiled regexes
+        """
+        self.literals = tuple(p for p in patterns if _LITERAL_PATTERN_RE.fullmatch(p))
+        
+        # Each regex is paired with its longest literal run, which must be present
+        # in the text for the regex to match, so the regex only runs on candidates
+        self.regexes = tuple(
+            (max(_LITERAL_RUN_RE.findall(p), key=len, default=''), re.compile(p))
+            for p in patterns if not _LITERAL_PATTERN_RE.fullmatch(p)
+        )
+        
+    def search(self, text: str) -> Optional[str]:
+        """
+        Find the first pattern present in text.
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            Matched text, or None if no pattern matched
+        """
+        return self.search_lower(text.lower())
+        
+    def search_lower(self, lowered: str) -> Optional[str]:
+        """
+        Find the first pattern present in already-lowercased text.
+        
+        Args:
+            lowered: Lowercased text to scan
+            
+        Returns:
+            Matched text, or None if no pattern matched
+        """
+        for literal in self.literals:
+            if literal in lowered:
+                return literal
+                
+        for required, regex in self.regexes:
+            if required in lowered:
+                match = regex.search(lowered)
+                if match:
+                    return match.group(0)
+        return None
+
 
 class BlockingDetector:
     """Detects various types of blocking mechanisms."""
     
+    # Bodies larger than this are only scanned for patterns, never parsed
+    MAX_SOUP_BYTES = 2_000_000
+    
     # HTTP status codes indicating blocking
     BLOCK_STATUS_CODES = {403, 429, 503}
     
@@ -43,9 +103,14 @@ class BlockingDetector:
         r'temporarily blocked',
     ]
     
+    # Attribute patterns for CAPTCHA elements, compiled once for soup.find()
+    _IFRAME_RE = re.compile(r'recaptcha|hcaptcha', re.I)
+    _DIV_CLASS_RE = re.compile(r'captcha|recaptcha|hcaptcha', re.I)
+    _FORM_RE = re.compile(r'captcha', re.I)
+    
     def __init__(self):
-        self.captcha_regex = re.compile('|'.join(self.CAPTCHA_PATTERNS), re.IGNORECASE)
-        self.ip_ban_regex = re.compile('|'.join(self.IP_BAN_PATTERNS), re.IGNORECASE)
+        self.captcha_scanner = PatternScanner(self.CAPTCHA_PATTERNS)
+        self.ip_ban_scanner = PatternScanner(self.IP_BAN_PATTERNS)
         
     def detect_http_block(self, status_code: int) -> Optional[str]:
         """
@@ -67,34 +132,55 @@ class BlockingDetector:
             return f"HTTP_{status_code}_BLOCKED"
         return None
         
-    def detect_captcha(self, content: bytes, url: str) -> bool:
+    def detect_captcha(
+        self,
+        html: Union[str, bytes],
+        url: str,
+        is_html: bool = True,
+        html_lower: Optional[str] = None,
+        soup: Optional[BeautifulSoup] = None
+    ) -> bool:
         """
         Detect CAPTCHA challenges in HTML content.
         
+        The text pattern scan runs first and already covers every CAPTCHA element
+        attribute, so BeautifulSoup is only used to confirm a Cloudflare
+        challenge wrapper on small HTML pages.
+        
         Args:
-            content: HTML content
+            html: Decoded HTML (raw bytes are decoded as UTF-8)
             url: Page URL
+            is_html: Whether the response is HTML (enables element checks)
+            html_lower: Precomputed html.lower(), shared with other checks
+            soup: Already parsed document to reuse for element checks
             
         Returns:
             True if CAPTCHA detected
         """
         try:
-            html = content.decode('utf-8', errors='ignore')
-            
+            if isinstance(html, bytes):
+                html = html.decode('utf-8', errors='ignore')
+            if html_lower is None:
+                html_lower = html.lower()
+                
             # Check for CAPTCHA patterns in text
-            if self.captcha_regex.search(html):
+            if self.captcha_scanner.search_lower(html_lower):
                 logger.warning(f"CAPTCHA detected in content from {url}")
                 return True
                 
+            if not is_html or len(html) > self.MAX_SOUP_BYTES or 'cf-wrapper' not in html:
+                return False
+                
             # Parse HTML
-            soup = BeautifulSoup(html, 'html.parser')
+            if soup is None:
+                soup = BeautifulSoup(html, 'lxml')
             
             # Check for CAPTCHA-specific elements
             captcha_indicators = [
-                soup.find('iframe', src=re.compile(r'recaptcha|hcaptcha', re.I)),
-                soup.find('div', {'class': re.compile(r'captcha|recaptcha|hcaptcha', re.I)}),
-                soup.find('div', {'id': re.compile(r'captcha|recaptcha|hcaptcha', re.I)}),
-                soup.find('form', action=re.compile(r'captcha', re.I)),
+                soup.find('iframe', src=self._IFRAME_RE),
+                soup.find('div', {'class': self._DIV_CLASS_RE}),
+                soup.find('div', {'id': self._DIV_CLASS_RE}),
+                soup.find('form', action=self._FORM_RE),
             ]
             
             if any(captcha_indicators):
@@ -111,13 +197,19 @@ class BlockingDetector:
             
         return False
         
-    def detect_ip_ban(self, content: bytes, status_code: int) -> bool:
+    def detect_ip_ban(
+        self,
+        content: Union[str, bytes],
+        status_code: int,
+        text_lower: Optional[str] = None
+    ) -> bool:
         """
         Detect IP ban or rate limiting.
         
         Args:
-            content: Response content
+            content: Decoded response text (raw bytes are decoded as UTF-8)
             status_code: HTTP status code
+            text_lower: Precomputed lowercased text, shared with other checks
             
         Returns:
             True if IP ban detected
@@ -128,10 +220,12 @@ class BlockingDetector:
             return True
             
         try:
-            text = content.decode('utf-8', errors='ignore')
-            
+            if text_lower is None:
+                text = content.decode('utf-8', errors='ignore') if isinstance(content, bytes) else content
+                text_lower = text.lower()
+                
             # Check for IP ban patterns
-            if self.ip_ban_regex.search(text):
+            if self.ip_ban_scanner.search_lower(text_lower):
                 logger.warning("IP ban pattern detected in response")
                 return True
                 
@@ -144,7 +238,9 @@ class BlockingDetector:
         self,
         content: bytes,
         status_code: int,
-        url: str
+        url: str,
+        content_type: Optional[str] = None,
+        soup: Optional[BeautifulSoup] = None
     ) -> Dict[str, Any]:
         """
         Run all blocking detection checks.
@@ -153,6 +249,8 @@ class BlockingDetector:
             content: Response content
             status_code: HTTP status code
             url: Request URL
+            content_type: Response Content-Type header, if known
+            soup: Already parsed document, reused instead of parsing again
             
         Returns:
             Dictionary with detection results
@@ -166,6 +264,14 @@ class BlockingDetector:
             "status_code": status_code
         }
         
+        # Decode once for all text checks
+        text = content.decode('utf-8', errors='ignore')
+        text_lower = text.lower()
+        if content_type:
+            is_html = 'html' in content_type.lower()
+        else:
+            is_html = '<html' in text_lower[:2048]
+            
         # HTTP blocking
         http_block = self.detect_http_block(status_code)
         if http_block:
@@ -174,13 +280,13 @@ class BlockingDetector:
             results["block_type"] = http_block
             
         # CAPTCHA detection
-        if self.detect_captcha(content, url):
+        if self.detect_captcha(text, url, is_html=is_html, html_lower=text_lower, soup=soup):
             results["blocked"] = True
             results["captcha_detected"] = True
             results["block_type"] = results["block_type"] or "CAPTCHA"
             
         # IP ban detection
-        if self.detect_ip_ban(content, status_code):
+        if self.detect_ip_ban(text, status_code, text_lower=text_lower):
             results["blocked"] = True
             results["ip_ban_detected"] = True
             results["block_type"] = results["block_type"] or "IP_BAN"
@@ -3,38 +3,69 @@ Crawl orchestration manager.
 Manages crawling workflow for individual sources with blocking detection and rate limiting.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Union, Dict
 from datetime import datetime
-import time
+from functools import lru_cache
+import asyncio
+import aiohttp
+from bs4 import BeautifulSoup
 from bson import ObjectId
 
 from ..storage import db_manager, Source, Document, CrawlStatus, ContentType, CrawlStats, DocumentMetadata
 from ..utils.logger import setup_logger
-from .base_crawler import BaseCrawler
-from .parsers import (
-    HTMLParser, RSSParser, PDFParser, TXTParser, ParserResult,
-    TwitterParser, RedditParser, YouTubeParser, LinkedInParser
-)
+from ..utils.async_utils import run_blocking
+from ..processing.text_cleaner import text_cleaner
+from .base_crawler import BaseCrawler, NOT_MODIFIED
+from . import parsers
+from .parsers import BaseParser, ParserResult
 from .blocking_detector import blocking_detector
 
 logger = setup_logger(__name__)
 
+# Concurrent fetch workers per traditional crawl
+CRAWL_WORKERS = 16
+
+# Documents per MongoDB bulk insert
+DOCUMENT_BATCH_SIZE = 500
+
+# Sources crawled at once by crawl_sources()
+MAX_CONCURRENT_SOURCES = 8
+
+# Parser class name per content type, resolved lazily by get_parser()
+PARSER_CLASSES = {
+    ContentType.HTML: 'HTMLParser',
+    ContentType.RSS: 'RSSParser',
+    ContentType.PDF: 'PDFParser',
+    ContentType.TXT: 'TXTParser',
+    ContentType.TWITTER: 'TwitterParser',
+    ContentType.REDDIT: 'RedditParser',
+    ContentType.YOUTUBE: 'YouTubeParser',
+    ContentType.LINKEDIN: 'LinkedInParser',
+}
+
+
+@lru_cache(maxsize=None)
+def get_parser(content_type: ContentType) -> Optional[BaseParser]:
+    """
+    Get the shared parser instance for a content type, importing it on first use.
+    
+    Args:
+        content_type: Source content type
+        
+    Returns:
+        Parser instance, or None if the content type has no parser
+    """
+    class_name = PARSER_CLASSES.get(content_type)
+    if class_name is None:
+        return None
+    return getattr(parsers, class_name)()
+
 
 class CrawlManager:
     """Manages the crawling process for a source with advanced features."""
     
     def __init__(self):
         self.crawler = BaseCrawler()
-        self.parsers = {
-            ContentType.HTML: HTMLParser(),
-            ContentType.RSS: RSSParser(),
-            ContentType.PDF: PDFParser(),
-            ContentType.TXT: TXTParser(),
-            ContentType.TWITTER: TwitterParser(),
-            ContentType.REDDIT: RedditParser(),
-            ContentType.YOUTUBE: YouTubeParser(),
-            ContentType.LINKEDIN: LinkedInParser(),
-        }
         
     async def crawl_source(self, source_id: str) -> CrawlStats:
         """
@@ -47,7 +78,7 @@ class CrawlManager:
             CrawlStats object
         """
         # Get source
-        source = db_manager.get_source(source_id)
+        source = await run_blocking(db_manager.get_source, source_id)
         if not source:
             raise ValueError(f"Source not found: {source_id}")
             
@@ -61,7 +92,7 @@ class CrawlManager:
         )
         
         # Update source status
-        db_manager.update_source(source_id, {
+        await run_blocking(db_manager.update_source, source_id, {
             "status": CrawlStatus.RUNNING.value,
             "last_crawl": datetime.utcnow()
         })
@@ -70,47 +101,38 @@ class CrawlManager:
             # Calculate rate limit delay (convert requests/minute to delay in seconds)
             rate_limit_delay = 60.0 / source.config.rate_limit_per_minute
             
+            # ETag / Last-Modified per fetched URL, remembered only once stored
+            validators: Dict[str, Dict[str, str]] = {}
+            
             # Crawl based on content type
-            if source.content_type in [ContentType.TWITTER, ContentType.REDDIT, ContentType.YOUTUBE]:
-                # Social media sources use API methods
-                results = self._crawl_social_media(source, stats)
-            else:
-                # Traditional web crawling
-                results = self._crawl_traditional(source, stats, rate_limit_delay)
+            is_social = source.content_type in [ContentType.TWITTER, ContentType.REDDIT, ContentType.YOUTUBE]
+            async with self.crawler.create_async_session() as session:
+                if is_social:
+                    # Social media sources use API methods
+                    results = await self._crawl_social_media(source, stats, session, validators)
+                else:
+                    # Traditional web crawling
+                    results = await self._crawl_traditional(source, stats, session, rate_limit_delay, validators)
                 
             # Store results
-            documents_stored = 0
-            for result in results:
-                if stats.pages_crawled >= source.config.max_hits:
-                    logger.info(f"Reached max_hits limit ({source.config.max_hits})")
-                    break
-                    
-                try:
-                    self._store_document(source, result)
-                    documents_stored += 1
-                    stats.pages_crawled += 1
-                    
-                    # Rate limiting
-                    time.sleep(rate_limit_delay)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to store document: {e}")
-                    stats.pages_failed += 1
-                    stats.errors.append(str(e))
-                    
+            documents_stored = await run_blocking(self._store_documents, source, results, stats, validators)
+            if is_social and source.url in validators:
+                # Social items have their own URLs; the feed itself is stored once all batches succeed
+                self.crawler.remember_validators(source.url, validators.pop(source.url))
+            
             # Update stats
             stats.completed_at = datetime.utcnow()
             stats.duration_seconds = (stats.completed_at - stats.started_at).total_seconds()
             
             # Update source
-            db_manager.update_source(source_id, {
+            await run_blocking(db_manager.update_source, source_id, {
                 "status": CrawlStatus.COMPLETED.value,
                 "total_documents": source.total_documents + documents_stored,
                 "last_error": None
             })
             
             # Save stats
-            db_manager.save_crawl_stats(stats)
+            await run_blocking(db_manager.save_crawl_stats, stats)
             
             logger.info(
                 f"Crawl completed for {source.name}: "
@@ -124,88 +146,171 @@ class CrawlManager:
             stats.errors.append(str(e))
             
             # Update source status
-            db_manager.update_source(source_id, {
+            await run_blocking(db_manager.update_source, source_id, {
                 "status": CrawlStatus.FAILED.value,
                 "last_error": str(e)
             })
             
         return stats
         
-    def _crawl_traditional(self, source: Source, stats: CrawlStats, rate_limit_delay: float) -> List[ParserResult]:
-        """Crawl traditional web sources with blocking detection."""
-        results = []
-        urls_to_crawl = [source.url]
-        crawled_urls = set()
+    async def crawl_sources(
+        self,
+        source_ids: List[str],
+        max_concurrency: int = MAX_CONCURRENT_SOURCES
+    ) -> List[Union[CrawlStats, BaseException]]:
+        """
+        Crawl several sources concurrently.
         
-        while urls_to_crawl and len(results) < source.config.max_hits:
-            url = urls_to_crawl.pop(0)
+        Args:
+            source_ids: Source IDs to crawl
+            max_concurrency: Maximum number of sources crawled at once
             
-            if url in crawled_urls:
-                continue
-                
-            try:
-                # Fetch content
-                response = self.crawler.fetch(url)
+        Returns:
+            CrawlStats per source, or the exception that source raised, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def crawl_one(source_id: str) -> CrawlStats:
+            async with semaphore:
+                return await self.crawl_source(source_id)
                 
-                if not response:
-                    stats.pages_failed += 1
-                    continue
+        return await asyncio.gather(
+            *(crawl_one(source_id) for source_id in source_ids),
+            return_exceptions=True
+        )
+        
+    async def _crawl_traditional(
+        self,
+        source: Source,
+        stats: CrawlStats,
+        session: aiohttp.ClientSession,
+        rate_limit_delay: float,
+        validators: Dict[str, Dict[str, str]]
+    ) -> List[ParserResult]:
+        """
+        Crawl traditional web sources with blocking detection.
+        
+        URLs are drained from a queue by concurrent workers; per-domain rate
+        limiting happens inside the crawler, so workers only overlap on I/O.
+        
+        Args:
+            source: Source configuration
+            stats: Statistics tracker
+            session: Async HTTP session for this crawl
+            rate_limit_delay: Minimum delay between requests to the source host
+            validators: Filled with the validators of each successfully parsed URL
+            
+        Returns:
+            List of parser results
+        """
+        parser = get_parser(source.content_type)
+        if not parser:
+            raise ValueError(f"No parser for content type: {source.content_type}")
+            
+        results = []
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.put_nowait(source.url)
+        seen_urls = {source.url}
+        blocked = asyncio.Event()
+        
+        async def worker() -> None:
+            while True:
+                url = await queue.get()
+                try:
+                    if blocked.is_set() or len(results) >= source.config.max_hits:
+                        continue
+                        
+                    # Fetch content
+                    response = await self.crawler.fetch_async(session, url, min_delay=rate_limit_delay)
                     
-                # Blocking detection
-                block_result = blocking_detector.detect_all(
-                    response.content,
-                    response.status_code,
-                    url
-                )
-                
-                if block_result["blocked"]:
-                    logger.error(
-                        f"Blocking detected: {block_result['block_type']} - "
-                        f"Pausing source {source.name}"
-                    )
+                    if not response:
+                        stats.pages_failed += 1
+                        continue
+                        
+                    content, status_code, page_validators = response
                     
-                    # Update to BLOCKED status
-                    db_manager.update_source(source.id, {
-                        "status": CrawlStatus.BLOCKED.value,
-                        "last_error": f"Blocked: {block_result['block_type']}"
-                    })
+                    if status_code == 304:
+                        logger.debug(f"Skipping unchanged page: {url}")
+                        continue
+                        
+                    # Parse HTML once and share the tree with blocking detection
+                    tree = None
+                    if hasattr(parser, 'parse_tree'):
+                        html_text = parser.decode_content(content)
+                        tree = parser.build_tree(html_text)
+                        
+                    # Blocking detection (reuses the tree only when it is a BeautifulSoup document)
+                    soup = tree if isinstance(tree, BeautifulSoup) else None
+                    block_result = blocking_detector.detect_all(content, status_code, url, soup=soup)
                     
-                    stats.errors.append(f"Blocked: {block_result['block_type']}")
-                    break
+                    if block_result["blocked"]:
+                        if blocked.is_set():
+                            continue
+                        blocked.set()
+                        logger.error(
+                            f"Blocking detected: {block_result['block_type']} - "
+                            f"Pausing source {source.name}"
+                        )
+                        
+                        # Update to BLOCKED status
+                        await run_blocking(db_manager.update_source, source.id, {
+                            "status": CrawlStatus.BLOCKED.value,
+                            "last_error": f"Blocked: {block_result['block_type']}"
+                        })
+                        
+                        stats.errors.append(f"Blocked: {block_result['block_type']}")
+                        continue
+                        
+                    # Parse content
+                    if tree is not None:
+                        result = parser.parse_tree(tree, html_text, url)
+                    else:
+                        # PDF/TXT parsing is CPU-bound (and may wait on worker processes)
+                        result = await run_blocking(parser.parse, content, url)
+                    results.append(result)
+                    validators[result.url] = page_validators
                     
-                # Parse content
-                parser = self.parsers.get(source.content_type)
-                if not parser:
-                    raise ValueError(f"No parser for content type: {source.content_type}")
+                    stats.bytes_downloaded += len(content)
                     
-                result = parser.parse(response.content, url)
-                results.append(result)
-                crawled_urls.add(url)
-                
-                stats.bytes_downloaded += len(response.content)
-                
-                # Follow links if enabled
-                if source.config.follow_links and hasattr(result, 'next_page') and result.next_page:
-                    if result.next_page not in crawled_urls:
-                        urls_to_crawl.append(result.next_page)
+                    # Follow links if enabled
+                    next_page = getattr(result, 'next_page', None)
+                    if source.config.follow_links and next_page and next_page not in seen_urls:
+                        seen_urls.add(next_page)
+                        queue.put_nowait(next_page)
                         
-                # Rate limiting
-                time.sleep(rate_limit_delay)
-                
-            except Exception as e:
-                logger.error(f"Failed to crawl {url}: {e}")
-                stats.pages_failed += 1
-                stats.errors.append(f"{url}: {str(e)}")
-                
-        return results
+                except Exception as e:
+                    logger.error(f"Failed to crawl {url}: {e}")
+                    stats.pages_failed += 1
+                    stats.errors.append(f"{url}: {str(e)}")
+                    
+                finally:
+                    queue.task_done()
+                    
+        workers = [asyncio.create_task(worker()) for _ in range(CRAWL_WORKERS)]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            
+        return results[:source.config.max_hits]
         
-    def _crawl_social_media(self, source: Source, stats: CrawlStats) -> List[ParserResult]:
+    async def _crawl_social_media(
+        self,
+        source: Source,
+        stats: CrawlStats,
+        session: aiohttp.ClientSession,
+        validators: Dict[str, Dict[str, str]]
+    ) -> List[ParserResult]:
         """
         Crawl social media sources (Twitter, Reddit, YouTube, LinkedIn).
         
         Args:
             source: Source configuration
             stats: Statistics tracker
+            session: Async HTTP session for this crawl
+            validators: Filled with the source URL's validators if parsing succeeds
             
         Returns:
             List of parser results
@@ -214,25 +319,30 @@ class CrawlManager:
         
         try:
             # Get appropriate parser
-            parser = self.parsers.get(source.content_type)
+            parser = get_parser(source.content_type)
             if not parser:
                 raise ValueError(f"No parser for social platform: {source.content_type}")
                 
             logger.info(f"Crawling social media: {source.content_type.value} - {source.url}")
             
             # Fetch content (social parsers handle API calls internally)
-            response = self.crawler.fetch(source.url)
+            response = await self.crawler.fetch_async(session, source.url)
             
             if not response:
                 stats.pages_failed += 1
                 return results
                 
-            stats.bytes_downloaded += len(response.content) if response.content else 0
+            content, status_code, page_validators = response
+            if status_code == 304:
+                logger.info(f"Social media source unchanged since last crawl: {source.url}")
+                return results
+                
+            stats.bytes_downloaded += len(content)
             
             # Parse based on platform
             if source.content_type == ContentType.TWITTER:
                 # Twitter parser extracts tweets
-                result = parser.parse(response.content, source.url)
+                result = parser.parse(content, source.url)
                 if result:
                     results.append(result)
                     
@@ -246,7 +356,7 @@ class CrawlManager:
                     
             elif source.content_type == ContentType.YOUTUBE:
                 # YouTube parser extracts videos from RSS
-                result = parser.parse(response.content, source.url)
+                result = parser.parse(content, source.url)
                 if result and hasattr(result, 'items'):
                     results.extend(result.items[:source.config.max_hits])
                 elif result:
@@ -254,10 +364,11 @@ class CrawlManager:
                     
             elif source.content_type == ContentType.LINKEDIN:
                 # LinkedIn parser extracts company posts
-                result = parser.parse(response.content, source.url)
+                result = parser.parse(content, source.url)
                 if result:
                     results.append(result)
                     
+            validators[source.url] = page_validators
             logger.info(f"Social media crawl extracted {len(results)} items")
             
         except Exception as e:
@@ -267,45 +378,106 @@ class CrawlManager:
             
         return results[:source.config.max_hits]
         
-    def _store_document(self, source: Source, result: ParserResult) -> None:
+    def _build_document(self, source: Source, result: ParserResult) -> Document:
         """
-        Store a single document from parser result.
+        Convert a parser result into a Document.
         
         Args:
             source: Source configuration
             result: Parser result
+            
+        Returns:
+            Document model
         """
-        try:
-            # Convert ParserResult to Document
-            result_dict = result.to_dict() if hasattr(result, 'to_dict') else {
-                'url': result.url if hasattr(result, 'url') else source.url,
-                'content_type': source.content_type.value,
-                'raw_content': result.raw_content if hasattr(result, 'raw_content') else '',
-                'cleaned_text': result.cleaned_text if hasattr(result, 'cleaned_text') else result.text,
-                'metadata': result.metadata if hasattr(result, 'metadata') else {}
-            }
-            
-            # Create document
-            document = Document(
-                url=result_dict.get('url', source.url),
-                source_id=source.id,
-                content_type=source.content_type,
-                raw_content=result_dict.get('raw_content', ''),
-                cleaned_text=result_dict.get('cleaned_text', ''),
-                metadata=DocumentMetadata(**result_dict.get('metadata', {})),
-                crawl_config_snapshot=source.config.dict()
-            )
+        result_dict = result.to_dict() if hasattr(result, 'to_dict') else {
+            'url': result.url if hasattr(result, 'url') else source.url,
+            'content_type': source.content_type.value,
+            'raw_content': result.raw_content if hasattr(result, 'raw_content') else '',
+            'cleaned_text': result.cleaned_text if hasattr(result, 'cleaned_text') else result.text,
+            'metadata': result.metadata if hasattr(result, 'metadata') else {}
+        }
+        
+        cleaned_text = result_dict.get('cleaned_text', '')
+        return Document(
+            url=result_dict.get('url', source.url),
+            source_id=source.id,
+            content_type=source.content_type,
+            raw_content=result_dict.get('raw_content', ''),
+            cleaned_text=cleaned_text,
+            metadata=DocumentMetadata(**result_dict.get('metadata', {})),
+            keywords=text_cleaner.extract_keywords(cleaned_text, top_n=50),
+            crawl_config_snapshot=source.config.dict()
+        )
+        
+    def _store_documents(
+        self,
+        source: Source,
+        results: List[ParserResult],
+        stats: CrawlStats,
+        validators: Optional[Dict[str, Dict[str, str]]] = None
+    ) -> int:
+        """
+        Store parser results in bulk batches of DOCUMENT_BATCH_SIZE.
+        
+        Validators of a page are remembered only after its batch is inserted,
+        so pages that fail to build or store are refetched in full next crawl.
+        
+        Args:
+            source: Source configuration
+            results: Parser results
+            stats: Statistics tracker
+            validators: Validators per fetched URL; stored entries are popped
             
-            # Store in database
-            doc_id = db_manager.create_document(document)
-            if doc_id:
-                logger.debug(f"Stored document: {document.url}")
-            else:
-                logger.debug(f"Document already exists: {document.url}")
+        Returns:
+            Number of new documents inserted
+        """
+        documents_stored = 0
+        pending: List[Document] = []
+        
+        for result in results:
+            if stats.pages_crawled >= source.config.max_hits:
+                logger.info(f"Reached max_hits limit ({source.config.max_hits})")
+                break
                 
-        except Exception as e:
-            logger.error(f"Failed to store document: {e}")
-            raise
+            try:
+                pending.append(self._build_document(source, result))
+                stats.pages_crawled += 1
+            except Exception as e:
+                logger.error(f"Failed to build document: {e}")
+                stats.pages_failed += 1
+                stats.errors.append(str(e))
+                
+            if len(pending) >= DOCUMENT_BATCH_SIZE:
+                documents_stored += self._insert_batch(pending, validators)
+                pending = []
+                
+        if pending:
+            documents_stored += self._insert_batch(pending, validators)
+            
+        return documents_stored
+        
+    def _insert_batch(
+        self,
+        documents: List[Document],
+        validators: Optional[Dict[str, Dict[str, str]]]
+    ) -> int:
+        """
+        Insert one batch of documents and remember the validators of their pages.
+        
+        Args:
+            documents: Documents to insert
+            validators: Validators per fetched URL; stored entries are popped
+            
+        Returns:
+            Number of new documents inserted
+        """
+        inserted = db_manager.create_documents_many(documents)
+        if validators:
+            for document in documents:
+                page_validators = validators.pop(document.url, None)
+                if page_validators is not None:
+                    self.crawler.remember_validators(document.url, page_validators)
+        return inserted
         
     def _crawl_rss(self, source: Source, stats: CrawlStats) -> List[ParserResult]:
         """
@@ -321,6 +493,8 @@ class CrawlManager:
         try:
             # Fetch feed
             content = self.crawler.fetch(source.url)
+            if content is NOT_MODIFIED:
+                return []
             if not content:
                 stats.pages_failed += 1
                 raise ValueError("Failed to fetch RSS feed")
@@ -328,7 +502,7 @@ class CrawlManager:
             stats.bytes_downloaded += len(content)
             
             # Parse feed entries
-            parser = self.parsers[ContentType.RSS]
+            parser = get_parser(ContentType.RSS)
             results = parser.parse_entries(content, source.url)
             
             # Limit to max_hits
@@ -373,6 +547,7 @@ class CrawlManager:
                     raw_content=result_dict["raw_content"],
                     cleaned_text=result_dict["cleaned_text"],
                     metadata=DocumentMetadata(**result_dict["metadata"]),
+                    keywords=text_cleaner.extract_keywords(result_dict["cleaned_text"], top_n=50),
                     crawl_config_snapshot=config_snapshot
                 )
                 
@@ -1,17 +1,37 @@
 """
 Content parsers package.
 Exports all parser classes for different content types.
+
+Parser modules are imported lazily on first attribute access, so importing
+the package does not pull in PDF/feed/social dependencies that go unused.
 """
 
+import importlib
+
 from .base_parser import BaseParser, ParserResult
-from .html_parser import HTMLParser
-from .rss_parser import RSSParser
-from .pdf_parser import PDFParser
-from .txt_parser import TXTParser
-from .twitter_parser import TwitterParser
-from .reddit_parser import RedditParser
-from .youtube_parser import YouTubeParser
-from .linkedin_parser import LinkedInParser
+
+# Lazily imported parser classes and the submodule that defines each
+_LAZY_PARSERS = {
+    'HTMLParser': '.html_parser',
+    'RSSParser': '.rss_parser',
+    'PDFParser': '.pdf_parser',
+    'TXTParser': '.txt_parser',
+    'TwitterParser': '.twitter_parser',
+    'RedditParser': '.reddit_parser',
+    'YouTubeParser': '.youtube_parser',
+    'LinkedInParser': '.linkedin_parser',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_PARSERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        
+    parser_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = parser_class
+    return parser_class
+
 
 __all__ = [
     'BaseParser',
@@ -4,33 +4,69 @@ Defines the contract that all parsers must follow.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+import copy
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
-import chardet
+from chardet.universaldetector import UniversalDetector
+from bs4 import BeautifulSoup
 from ...utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# selectolax parses and queries HTML in C; BeautifulSoup is the fallback
+try:
+    from selectolax.parser import HTMLParser as SelectolaxTree
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    logger.warning("selectolax not available, using BeautifulSoup for HTML parsing")
+
+# Encoding detectors, fastest first: cchardet (C++), charset-normalizer
+# (installed with requests), then pure-Python chardet
+try:
+    import cchardet
+    CCHARDET_AVAILABLE = True
+except ImportError:
+    CCHARDET_AVAILABLE = False
+    
+try:
+    import charset_normalizer
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:
+    CHARSET_NORMALIZER_AVAILABLE = False
+
+# Bytes inspected when guessing an encoding; detection stops earlier once confident
+ENCODING_SAMPLE_BYTES = 65536
+
 
 class ParserResult:
     """Standardized parser output."""
     
+    # One instance per crawled document; slots keep them small
+    __slots__ = (
+        'url', 'content_type', '_raw_content', '_raw_encoding', 'cleaned_text', 'title',
+        'author', 'publish_date', 'language', 'word_count', 'custom_metadata'
+    )
+    
     def __init__(
         self,
         url: str,
         content_type: str,
-        raw_content: str,
+        raw_content: Union[str, bytes],
         cleaned_text: str,
         title: Optional[str] = None,
         author: Optional[str] = None,
         publish_date: Optional[datetime] = None,
         language: Optional[str] = None,
         word_count: int = 0,
-        custom_metadata: Optional[Dict[str, Any]] = None
+        custom_metadata: Optional[Dict[str, Any]] = None,
+        raw_encoding: Optional[str] = None
     ):
         self.url = url
         self.content_type = content_type
-        self.raw_content = raw_content
+        # Bytes are kept as-is and only decoded if raw_content is read
+        self._raw_content = raw_content
+        self._raw_encoding = raw_encoding
         self.cleaned_text = cleaned_text
         self.title = title
         self.author = author
@@ -39,6 +75,28 @@ class ParserResult:
         self.word_count = word_count or self._count_words(cleaned_text)
         self.custom_metadata = custom_metadata or {}
         
+    @property
+    def raw_content(self) -> str:
+        """Raw content as text, decoding (and caching) bytes on first access."""
+        if isinstance(self._raw_content, bytes):
+            self._raw_content = BaseParser.decode_content(self._raw_content, self._raw_encoding)
+        return self._raw_content
+        
+    @raw_content.setter
+    def raw_content(self, value: Union[str, bytes]) -> None:
+        self._raw_content = value
+        
+    def copy(self) -> 'ParserResult':
+        """
+        Copy the result so callers can modify it without touching the original.
+        
+        Returns:
+            New ParserResult with its own custom_metadata
+        """
+        result = copy.copy(self)
+        result.custom_metadata = copy.deepcopy(self.custom_metadata)
+        return result
+        
     @staticmethod
     def _count_words(text: str) -> int:
         """Count words in text."""
@@ -77,13 +135,14 @@ class BaseParser(ABC):
         self.logger = setup_logger(self.__class__.__name__)
         
     @abstractmethod
-    def parse(self, content: bytes, url: str) -> ParserResult:
+    def parse(self, content: bytes, url: str, encoding: Optional[str] = None) -> ParserResult:
         """
         Parse content and return standardized result.
         
         Args:
             content: Raw content as bytes
             url: Source URL
+            encoding: Charset declared by the response (detected if not given)
             
         Returns:
             ParserResult object
@@ -105,9 +164,20 @@ class BaseParser(ABC):
             Detected encoding string (defaults to 'utf-8')
         """
         try:
-            result = chardet.detect(content)
-            encoding = result.get('encoding', 'utf-8')
-            confidence = result.get('confidence', 0)
+            sample = content[:ENCODING_SAMPLE_BYTES]
+            
+            # Pure ASCII prefix: UTF-8 decodes it and anything non-ASCII further on
+            if sample.isascii():
+                return 'utf-8'
+                
+            if CCHARDET_AVAILABLE:
+                result = cchardet.detect(sample)
+            elif CHARSET_NORMALIZER_AVAILABLE:
+                result = charset_normalizer.detect(sample)
+            else:
+                result = BaseParser._detect_incremental(sample)
+            encoding = result.get('encoding') or 'utf-8'
+            confidence = result.get('confidence') or 0
             
             if confidence > 0.7 and encoding:
                 return encoding
@@ -115,6 +185,25 @@ class BaseParser(ABC):
         except Exception:
             return 'utf-8'
             
+    @staticmethod
+    def _detect_incremental(sample: bytes) -> Dict[str, Any]:
+        """
+        Run chardet line by line, stopping as soon as it is confident.
+        
+        Args:
+            sample: Bytes to inspect
+            
+        Returns:
+            chardet result dictionary (encoding, confidence)
+        """
+        detector = UniversalDetector()
+        for line in sample.splitlines(keepends=True):
+            detector.feed(line)
+            if detector.done:
+                break
+        detector.close()
+        return detector.result
+        
     @staticmethod
     def decode_content(content: bytes, encoding: Optional[str] = None) -> str:
         """
@@ -122,7 +211,7 @@ class BaseParser(ABC):
         
         Args:
             content: Raw bytes
-            encoding: Optional encoding (will auto-detect if not provided)
+            encoding: Optional encoding, e.g. the response charset (will auto-detect if not provided)
             
         Returns:
             Decoded string
@@ -140,6 +229,137 @@ class BaseParser(ABC):
                 # Last resort: latin-1 (never fails)
                 return content.decode('latin-1', errors='replace')
                 
+    @staticmethod
+    def build_tree(html: str):
+        """
+        Parse HTML into a queryable document.
+        
+        Args:
+            html: Decoded HTML
+            
+        Returns:
+            selectolax tree if available, otherwise a BeautifulSoup document
+        """
+        if SELECTOLAX_AVAILABLE:
+            return SelectolaxTree(html)
+        return BeautifulSoup(html, 'lxml')
+        
+    @staticmethod
+    def _is_soup(node) -> bool:
+        """Whether a node comes from BeautifulSoup rather than selectolax."""
+        return hasattr(node, 'select_one')
+        
+    @staticmethod
+    def select_first(doc, selector: str):
+        """
+        Find the first node matching a CSS selector.
+        
+        Args:
+            doc: Tree from build_tree() (or a BeautifulSoup document)
+            selector: CSS selector
+            
+        Returns:
+            Matching node or None
+        """
+        if BaseParser._is_soup(doc):
+            return doc.select_one(selector)
+        return doc.css_first(selector)
+        
+    @staticmethod
+    def select_all(doc, selector: str) -> list:
+        """
+        Find all nodes matching a CSS selector.
+        
+        Args:
+            doc: Tree from build_tree() (or a BeautifulSoup document)
+            selector: CSS selector
+            
+        Returns:
+            List of matching nodes
+        """
+        if BaseParser._is_soup(doc):
+            return doc.select(selector)
+        return doc.css(selector)
+        
+    @staticmethod
+    def node_text(node, separator: str = '') -> str:
+        """
+        Get the stripped text of a node.
+        
+        Args:
+            node: selectolax or BeautifulSoup node
+            separator: String placed between text fragments
+            
+        Returns:
+            Node text
+        """
+        if BaseParser._is_soup(node):
+            return node.get_text(separator=separator, strip=True)
+        return node.text(separator=separator, strip=True)
+        
+    @staticmethod
+    def node_attr(node, name: str) -> Optional[str]:
+        """
+        Get an attribute value of a node (multi-valued attributes are space-joined).
+        
+        Args:
+            node: selectolax or BeautifulSoup node
+            name: Attribute name
+            
+        Returns:
+            Attribute value or None
+        """
+        if BaseParser._is_soup(node):
+            value = node.get(name)
+            return ' '.join(value) if isinstance(value, list) else value
+        return node.attributes.get(name)
+        
+    @staticmethod
+    def select_text(doc, selector: str, separator: str = '') -> Optional[str]:
+        """
+        Get the text of the first node matching a selector.
+        
+        Args:
+            doc: Parsed document
+            selector: CSS selector
+            separator: String placed between text fragments
+            
+        Returns:
+            Node text, or None if nothing matched
+        """
+        node = BaseParser.select_first(doc, selector)
+        return BaseParser.node_text(node, separator) if node is not None else None
+        
+    @staticmethod
+    def select_texts(doc, selector: str) -> List[str]:
+        """
+        Get the text of every node matching a selector.
+        
+        Args:
+            doc: Parsed document
+            selector: CSS selector
+            
+        Returns:
+            List of node texts
+        """
+        return [BaseParser.node_text(node) for node in BaseParser.select_all(doc, selector)]
+        
+    @staticmethod
+    def select_attr(doc, selector: str, name: str) -> Optional[str]:
+        """
+        Get an attribute of the first node matching a selector.
+        
+        Args:
+            doc: Parsed document
+            selector: CSS selector
+            name: Attribute name
+            
+        Returns:
+            Attribute value, or None if nothing matched
+        """
+        node = BaseParser.select_first(doc, selector)
+        return BaseParser.node_attr(node, name) if node is not None else None
+        
     @staticmethod
     def clean_text(text: str) -> str:
         """
@@ -154,13 +374,5 @@ class BaseParser(ABC):
         if not text:
             return ""
             
-        # Normalize whitespace
-        lines = [line.strip() for line in text.split('\n')]
-        lines = [line for line in lines if line]
-        cleaned = ' '.join(lines)
-        
-        # Remove excessive whitespace
-        import re
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        
-        return cleaned.strip()
+        # Collapse every whitespace run (newlines included) to a single space
+        return ' '.join(text.split())
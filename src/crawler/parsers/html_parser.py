@@ -1,13 +1,12 @@
 """
-HTML parser using BeautifulSoup4.
+HTML parser using selectolax (BeautifulSoup4 fallback).
 Extracts visible text content, title, and metadata from HTML pages.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
+from urllib.parse import urljoin
 import requests
-from bs4 import BeautifulSoup, Tag
-import re
 
 from .base_parser import BaseParser, ParserResult
 from ...utils.logger import setup_logger
@@ -15,6 +14,12 @@ from ...utils.config import settings
 
 logger = setup_logger(__name__)
 
+# Elements whose text is never part of the page content
+HIDDEN_TAGS = ['script', 'style', 'nav', 'header', 'footer', 'aside', 'noscript']
+
+# Substring marking a pagination link's class or id (matched case-insensitively)
+NEXT_MARKER = 'next'
+
 
 class HTMLParser(BaseParser):
     """Parser for HTML content."""
@@ -47,19 +52,25 @@ class HTMLParser(BaseParser):
             )
             response.raise_for_status()
             
-            return self.parse(response.content, url)
+            # Trust an explicit Content-Type charset rather than re-detecting it;
+            # without one requests assumes ISO-8859-1 for text/*, so detect instead
+            content_type = response.headers.get('Content-Type', '').lower()
+            encoding = response.encoding if 'charset=' in content_type else None
+            
+            return self.parse(response.content, url, encoding=encoding)
             
         except requests.RequestException as e:
             self.logger.error(f"Failed to fetch {url}: {e}")
             raise ValueError(f"Failed to fetch URL: {e}")
             
-    def parse(self, content: bytes, url: str) -> ParserResult:
+    def parse(self, content: bytes, url: str, encoding: Optional[str] = None) -> ParserResult:
         """
         Parse HTML content.
         
         Args:
             content: Raw HTML content as bytes
             url: Source URL
+            encoding: Charset declared by the response (detected if not given)
             
         Returns:
             ParserResult object
@@ -69,23 +80,49 @@ class HTMLParser(BaseParser):
         """
         try:
             # Decode content
-            html_text = self.decode_content(content)
+            html_text = self.decode_content(content, encoding)
             
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(html_text, 'lxml')
+            # Parse with selectolax (BeautifulSoup fallback)
+            tree = self.build_tree(html_text)
             
-            # Extract metadata
-            title = self._extract_title(soup)
-            author = self._extract_author(soup)
-            publish_date = self._extract_publish_date(soup)
-            language = self._extract_language(soup)
+        except Exception as e:
+            self.logger.error(f"Failed to parse HTML from {url}: {e}")
+            raise ValueError(f"HTML parsing failed: {e}")
+            
+        return self.parse_tree(tree, html_text, url)
+        
+    def parse_tree(self, tree, html_text: str, url: str) -> ParserResult:
+        """
+        Build a result from an already parsed document.
+        
+        Lets callers that parsed the page for other checks reuse the tree.
+        The tree is modified (non-content elements are removed).
+        
+        Args:
+            tree: Document from build_tree() or a BeautifulSoup document
+            html_text: Decoded HTML the tree was built from
+            url: Source URL
+            
+        Returns:
+            ParserResult object
+            
+        Raises:
+            ValueError: If HTML cannot be parsed
+        """
+        try:
+            # Extract metadata (all <meta> tags are read in one sweep)
+            metas = self._collect_meta(tree)
+            title = self._extract_title(tree, metas)
+            author = self._extract_author(metas)
+            publish_date = self._extract_publish_date(metas)
+            language = self._extract_language(tree)
             
             # Extract and clean text content
-            visible_text = self._extract_visible_text(soup)
+            visible_text = self._extract_visible_text(tree)
             cleaned_text = self.clean_text(visible_text)
             
             # Detect pagination
-            next_page = self._detect_next_page(soup, url)
+            next_page = self._detect_next_page(tree, url)
             custom_metadata = {"next_page": next_page} if next_page else {}
             
             return ParserResult(
@@ -104,49 +141,64 @@ class HTMLParser(BaseParser):
             self.logger.error(f"Failed to parse HTML from {url}: {e}")
             raise ValueError(f"HTML parsing failed: {e}")
             
-    def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
+    def _collect_meta(self, tree) -> Dict[str, str]:
+        """
+        Index <meta> content by lowercased name and property.
+        
+        Args:
+            tree: Parsed document
+            
+        Returns:
+            Mapping of name/property to content (first occurrence wins)
+        """
+        metas = {}
+        for meta in self.select_all(tree, 'meta'):
+            content = self.node_attr(meta, 'content')
+            if content is None:
+                continue
+            for attr in ('name', 'property'):
+                key = self.node_attr(meta, attr)
+                if key:
+                    metas.setdefault(key.lower(), content)
+        return metas
+        
+    def _extract_title(self, tree, metas: Dict[str, str]) -> Optional[str]:
         """Extract page title."""
         # Try <title> tag first
-        if soup.title and soup.title.string:
-            return soup.title.string.strip()
+        title = self.select_text(tree, 'title')
+        if title:
+            return title
             
         # Try meta og:title
-        meta_title = soup.find('meta', property='og:title')
-        if meta_title and meta_title.get('content'):
-            return meta_title['content'].strip()
+        meta_title = metas.get('og:title')
+        if meta_title:
+            return meta_title.strip()
             
         # Try h1
-        h1 = soup.find('h1')
-        if h1:
-            return h1.get_text().strip()
+        h1 = self.select_text(tree, 'h1')
+        if h1 is not None:
+            return h1
             
         return None
         
-    def _extract_author(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_author(self, metas: Dict[str, str]) -> Optional[str]:
         """Extract author from metadata."""
-        # Try meta author tag
-        meta_author = soup.find('meta', attrs={'name': 'author'})
-        if meta_author and meta_author.get('content'):
-            return meta_author['content'].strip()
-            
-        # Try meta article:author
-        meta_author = soup.find('meta', property='article:author')
-        if meta_author and meta_author.get('content'):
-            return meta_author['content'].strip()
+        # Try meta author tag, then meta article:author
+        meta_author = metas.get('author') or metas.get('article:author')
+        if meta_author:
+            return meta_author.strip()
             
         return None
         
-    def _extract_publish_date(self, soup: BeautifulSoup) -> Optional[datetime]:
+    def _extract_publish_date(self, metas: Dict[str, str]) -> Optional[datetime]:
         """Extract publication date from metadata."""
-        # Try meta article:published_time
-        meta_date = soup.find('meta', property='article:published_time')
-        if not meta_date:
-            meta_date = soup.find('meta', attrs={'name': 'publication_date'})
-        if not meta_date:
-            meta_date = soup.find('meta', attrs={'name': 'date'})
-            
-        if meta_date and meta_date.get('content'):
-            date_str = meta_date['content']
+        # Try meta article:published_time, then common date meta names
+        date_str = (
+            metas.get('article:published_time')
+            or metas.get('publication_date')
+            or metas.get('date')
+        )
+        if date_str:
             try:
                 # Try parsing ISO format
                 return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
@@ -155,56 +207,59 @@ class HTMLParser(BaseParser):
                 
         return None
         
-    def _extract_language(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_language(self, tree) -> Optional[str]:
         """Extract language from HTML lang attribute."""
-        html_tag = soup.find('html')
-        if html_tag and html_tag.get('lang'):
-            return html_tag['lang'].strip()
+        lang = self.select_attr(tree, 'html', 'lang')
+        if lang:
+            return lang.strip()
         return None
         
-    def _extract_visible_text(self, soup: BeautifulSoup) -> str:
+    def _extract_visible_text(self, tree) -> str:
         """
         Extract visible text content, excluding scripts, styles, and navigation.
         """
         # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'noscript']):
-            element.decompose()
+        if self._is_soup(tree):
+            for element in tree(HIDDEN_TAGS):
+                element.decompose()
+        else:
+            tree.strip_tags(HIDDEN_TAGS)
             
         # Get text from main content areas (prefer article, main, or body)
-        main_content = soup.find('article') or soup.find('main') or soup.find('body')
+        main_content = (
+            self.select_first(tree, 'article')
+            or self.select_first(tree, 'main')
+            or self.select_first(tree, 'body')
+        )
         
-        if main_content:
-            text = main_content.get_text(separator='\n', strip=True)
-        else:
-            text = soup.get_text(separator='\n', strip=True)
-            
-        return text
+        return self.node_text(main_content or tree, '\n')
         
-    def _detect_next_page(self, soup: BeautifulSoup, current_url: str) -> Optional[str]:
+    def _detect_next_page(self, tree, current_url: str) -> Optional[str]:
         """
         Detect pagination link (next page).
         
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed document
             current_url: Current page URL
             
         Returns:
             Next page URL or None
         """
-        # Common pagination patterns
+        links = self.select_all(tree, 'a')
+        
+        # Common pagination patterns: rel="next", then class or id containing "next"
         next_patterns = [
-            {'rel': 'next'},
-            {'class': re.compile(r'next', re.I)},
-            {'id': re.compile(r'next', re.I)}
+            lambda link: 'next' in (self.node_attr(link, 'rel') or '').split(),
+            lambda link: NEXT_MARKER in (self.node_attr(link, 'class') or '').lower(),
+            lambda link: NEXT_MARKER in (self.node_attr(link, 'id') or '').lower(),
         ]
         
         for pattern in next_patterns:
-            next_link = soup.find('a', pattern)
-            if next_link and next_link.get('href'):
-                href = next_link['href']
+            next_link = next((link for link in links if pattern(link)), None)
+            href = self.node_attr(next_link, 'href') if next_link is not None else None
+            if href:
                 # Convert relative URLs to absolute
                 if href.startswith('/'):
-                    from urllib.parse import urljoin
                     return urljoin(current_url, href)
                 elif href.startswith('http'):
                     return href
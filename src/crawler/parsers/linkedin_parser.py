@@ -5,13 +5,29 @@ Uses web scraping for publicly accessible content.
 
 from typing import Optional
 from datetime import datetime
-from bs4 import BeautifulSoup
 
 from .base_parser import BaseParser, ParserResult
 from ...utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Selectors tried in order; the first one that matches wins
+TITLE_SELECTORS = (
+    'h1.top-card-layout__title',
+    'h1.org-top-card-summary__title',
+    'h1'
+)
+DESCRIPTION_SELECTORS = (
+    'p.top-card-layout__headline',
+    'p.org-top-card-summary__tagline',
+    'div.about-us__description'
+)
+POST_SELECTORS = (
+    'div.feed-shared-update-v2__description',
+    'article.feed-shared-update-v2',
+    'div.occludable-update'
+)
+
 
 class LinkedInParser(BaseParser):
     """Parser for LinkedIn public content."""
@@ -19,25 +35,26 @@ class LinkedInParser(BaseParser):
     def __init__(self):
         super().__init__()
         
-    def parse(self, content: bytes, url: str) -> ParserResult:
+    def parse(self, content: bytes, url: str, encoding: Optional[str] = None) -> ParserResult:
         """
         Parse LinkedIn page content.
         
         Args:
             content: Raw HTML content
             url: Source URL
+            encoding: Charset declared by the response (detected if not given)
             
         Returns:
             ParserResult object
         """
         try:
-            html = self.decode_content(content)
-            soup = BeautifulSoup(html, 'html.parser')
+            html = self.decode_content(content, encoding)
+            tree = self.build_tree(html)
             
             # Extract company/profile info
-            title = self._extract_title(soup)
-            description = self._extract_description(soup)
-            posts = self._extract_posts(soup)
+            title = self._extract_title(tree)
+            description = self._extract_description(tree)
+            posts = self._extract_posts(tree)
             
             # Combine text
             all_text = f"{title}\n\n{description}\n\n" + "\n\n".join(posts)
@@ -59,56 +76,33 @@ class LinkedInParser(BaseParser):
             logger.error(f"Failed to parse LinkedIn content from {url}: {e}")
             raise ValueError(f"LinkedIn parsing failed: {e}")
             
-    def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_title(self, tree) -> Optional[str]:
         """Extract page/company title."""
-        # Try multiple selectors
-        selectors = [
-            'h1.top-card-layout__title',
-            'h1.org-top-card-summary__title',
-            'h1'
-        ]
-        
-        for selector in selectors:
-            title_elem = soup.select_one(selector)
-            if title_elem:
-                return title_elem.get_text(strip=True)
+        for selector in TITLE_SELECTORS:
+            title = self.select_text(tree, selector)
+            if title is not None:
+                return title
                 
         return None
         
-    def _extract_description(self, soup: BeautifulSoup) -> str:
+    def _extract_description(self, tree) -> str:
         """Extract page/company description."""
-        # Try description selectors
-        selectors = [
-            'p.top-card-layout__headline',
-            'p.org-top-card-summary__tagline',
-            'div.about-us__description'
-        ]
-        
-        for selector in selectors:
-            desc_elem = soup.select_one(selector)
-            if desc_elem:
-                return desc_elem.get_text(strip=True)
+        for selector in DESCRIPTION_SELECTORS:
+            description = self.select_text(tree, selector)
+            if description is not None:
+                return description
                 
         return ""
         
-    def _extract_posts(self, soup: BeautifulSoup) -> list:
+    def _extract_posts(self, tree) -> list:
         """Extract posts/updates from page."""
         posts = []
         
         # Look for feed items
-        post_selectors = [
-            'div.feed-shared-update-v2__description',
-            'article.feed-shared-update-v2',
-            'div.occludable-update'
-        ]
-        
-        for selector in post_selectors:
-            elements = soup.select(selector)
-            if elements:
-                for elem in elements:
-                    text = elem.get_text(strip=True)
-                    if text and len(text) > 20:
-                        posts.append(text)
+        for selector in POST_SELECTORS:
+            texts = self.select_texts(tree, selector)
+            if texts:
+                posts.extend(text for text in texts if len(text) > 20)
                 break
                 
         return posts
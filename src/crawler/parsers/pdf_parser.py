@@ -1,11 +1,16 @@
 """
-PDF parser using PyPDF2.
+PDF parser using pypdfium2 (PyPDF2 fallback).
 Extracts text and metadata from PDF documents.
 """
 
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import io
+import multiprocessing
+import os
+import tempfile
+import threading
 from PyPDF2 import PdfReader
 from PyPDF2.errors import PdfReadError
 
@@ -14,17 +19,93 @@ from ...utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# pypdfium2 wraps Google's PDFium and extracts text in C; PyPDF2 is pure Python
+try:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+    logger.warning("pypdfium2 not available, using PyPDF2 for PDF parsing")
+
+PAGE_SEPARATOR = "\n\n"
+# Leading YYYYMMDDHHmmSS part of a PDF date string
+PDF_DATE_FORMAT = "%Y%m%d%H%M%S"
+
+# Documents with more pages than this are extracted in worker processes
+PARALLEL_PAGE_THRESHOLD = 32
+PDF_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# PDFium is not thread-safe, even across documents; serialize every call in a process
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _pdfium_page_texts(pdf, start: int, stop: int) -> Iterable[str]:
+    """Yield the text of pages [start, stop) of an open pypdfium2 document."""
+    for page_num in range(start, stop):
+        try:
+            page = pdf[page_num]
+            textpage = page.get_textpage()
+            text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+        except Exception as e:
+            logger.warning(f"Failed to extract text from page {page_num + 1}: {e}")
+            text = ""
+        yield text
+        
+        
+def _pypdf2_page_texts(reader: PdfReader, start: int, stop: int) -> Iterable[str]:
+    """Yield the text of pages [start, stop) of an open PyPDF2 reader."""
+    for page_num in range(start, stop):
+        try:
+            text = reader.pages[page_num].extract_text()
+        except Exception as e:
+            logger.warning(f"Failed to extract text from page {page_num + 1}: {e}")
+            text = ""
+        yield text
+        
+        
+def _extract_page_range(path: str, start: int, stop: int) -> List[str]:
+    """
+    Open a PDF and extract pages [start, stop). Runs in a worker process.
+    
+    Args:
+        path: Path of a temporary file holding the PDF
+        start: First page index
+        stop: Page index to stop before
+        
+    Returns:
+        Page texts in order
+    """
+    if PDFIUM_AVAILABLE:
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(path)
+            try:
+                return list(_pdfium_page_texts(pdf, start, stop))
+            finally:
+                pdf.close()
+            
+    reader = PdfReader(path)
+    if reader.is_encrypted:
+        reader.decrypt('')
+    return list(_pypdf2_page_texts(reader, start, stop))
+
 
 class PDFParser(BaseParser):
     """Parser for PDF documents."""
     
-    def parse(self, content: bytes, url: str) -> ParserResult:
+    _executor: Optional[ProcessPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    
+    def parse(self, content: bytes, url: str, encoding: Optional[str] = None) -> ParserResult:
         """
         Parse PDF content.
         
         Args:
             content: Raw PDF content as bytes
             url: Source URL
+            encoding: Unused, accepted for interface compatibility
             
         Returns:
             ParserResult object
@@ -33,45 +114,20 @@ class PDFParser(BaseParser):
             ValueError: If PDF cannot be parsed
         """
         try:
-            # Create PDF reader from bytes
-            pdf_file = io.BytesIO(content)
-            reader = PdfReader(pdf_file)
-            
-            # Check if encrypted
-            if reader.is_encrypted:
-                self.logger.warning(f"PDF is encrypted: {url}")
-                try:
-                    # Try to decrypt with empty password
-                    reader.decrypt('')
-                except Exception:
-                    raise ValueError("PDF is encrypted and cannot be decrypted")
-                    
+            if PDFIUM_AVAILABLE:
+                raw_text, metadata, num_pages, is_encrypted = self._read_pdfium(content, url)
+            else:
+                raw_text, metadata, num_pages, is_encrypted = self._read_pypdf2(content, url)
+                
             # Extract metadata
-            metadata = reader.metadata
             title = self._extract_title(metadata)
             author = self._extract_author(metadata)
             creation_date = self._extract_creation_date(metadata)
             
-            # Extract text from all pages
-            text_parts = []
-            num_pages = len(reader.pages)
-            
-            for page_num in range(num_pages):
-                try:
-                    page = reader.pages[page_num]
-                    text = page.extract_text()
-                    if text:
-                        text_parts.append(text)
-                except Exception as e:
-                    self.logger.warning(f"Failed to extract text from page {page_num + 1}: {e}")
-                    continue
-                    
-            if not text_parts:
+            if not raw_text:
                 self.logger.warning(f"No text extracted from PDF: {url}")
-                raw_text = ""
                 cleaned_text = ""
             else:
-                raw_text = "\n\n".join(text_parts)
                 cleaned_text = self.clean_text(raw_text)
                 
             return ParserResult(
@@ -84,7 +140,7 @@ class PDFParser(BaseParser):
                 publish_date=creation_date,
                 custom_metadata={
                     "num_pages": num_pages,
-                    "is_encrypted": reader.is_encrypted
+                    "is_encrypted": is_encrypted
                 }
             )
             
@@ -95,6 +151,124 @@ class PDFParser(BaseParser):
             self.logger.error(f"Failed to parse PDF from {url}: {e}")
             raise ValueError(f"PDF parsing failed: {e}")
             
+    def _read_pdfium(self, content: bytes, url: str) -> Tuple[str, Dict[str, Any], int, bool]:
+        """
+        Extract text and metadata with pypdfium2, streaming pages into one buffer.
+        
+        In-process PDFium calls hold _PDFIUM_LOCK; large documents release it
+        before their pages are extracted in worker processes.
+        
+        Args:
+            content: Raw PDF content as bytes
+            url: Source URL (for logging)
+            
+        Returns:
+            Tuple of (text, metadata with PyPDF2-style keys, page count, encrypted flag)
+        """
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(content)
+            try:
+                is_encrypted = pdfium_c.FPDF_GetSecurityHandlerRevision(pdf.raw) != -1
+                metadata = {f"/{key}": value for key, value in pdf.get_metadata_dict().items()}
+                num_pages = len(pdf)
+                
+                if num_pages <= PARALLEL_PAGE_THRESHOLD:
+                    text = self._join_pages(_pdfium_page_texts(pdf, 0, num_pages))
+                    return text, metadata, num_pages, is_encrypted
+            finally:
+                pdf.close()
+                
+        texts = self._extract_parallel(content, num_pages)
+        return self._join_pages(texts), metadata, num_pages, is_encrypted
+            
+    def _read_pypdf2(self, content: bytes, url: str) -> Tuple[str, Any, int, bool]:
+        """
+        Extract text and metadata with PyPDF2.
+        
+        Args:
+            content: Raw PDF content as bytes
+            url: Source URL (for logging)
+            
+        Returns:
+            Tuple of (text, metadata, page count, encrypted flag)
+        """
+        # Create PDF reader from bytes
+        reader = PdfReader(io.BytesIO(content))
+        
+        # Check if encrypted
+        if reader.is_encrypted:
+            self.logger.warning(f"PDF is encrypted: {url}")
+            try:
+                # Try to decrypt with empty password
+                reader.decrypt('')
+            except Exception:
+                raise ValueError("PDF is encrypted and cannot be decrypted")
+                
+        # Extract text from all pages
+        num_pages = len(reader.pages)
+        
+        if num_pages > PARALLEL_PAGE_THRESHOLD:
+            texts = self._extract_parallel(content, num_pages)
+        else:
+            texts = _pypdf2_page_texts(reader, 0, num_pages)
+            
+        return self._join_pages(texts), reader.metadata, num_pages, reader.is_encrypted
+        
+    @staticmethod
+    def _join_pages(texts: Iterable[str]) -> str:
+        """Join non-empty page texts into one string through a single buffer."""
+        buf = io.StringIO()
+        for text in texts:
+            if text:
+                if buf.tell():
+                    buf.write(PAGE_SEPARATOR)
+                buf.write(text)
+        return buf.getvalue()
+        
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        """
+        Create the shared page-extraction process pool on first use.
+        
+        Workers are spawned rather than forked, since the crawler process runs
+        scheduler and HTTP threads whose locks a forked child would inherit.
+        """
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=PDF_MAX_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return cls._executor
+            
+    def _extract_parallel(self, content: bytes, num_pages: int) -> List[str]:
+        """
+        Extract page text across worker processes, one contiguous page range each.
+        
+        The PDF is written to a temporary file once and workers open it by
+        path, instead of each range pickling the whole document.
+        
+        Args:
+            content: Raw PDF content as bytes
+            num_pages: Number of pages in the document
+            
+        Returns:
+            Page texts in document order
+        """
+        executor = self._get_executor()
+        step = -(-num_pages // PDF_MAX_WORKERS)
+        
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            tmp.write(content)
+        try:
+            futures = [
+                executor.submit(_extract_page_range, tmp.name, start, min(start + step, num_pages))
+                for start in range(0, num_pages, step)
+            ]
+            return [text for future in futures for text in future.result()]
+        finally:
+            os.unlink(tmp.name)
+        
     def _extract_title(self, metadata) -> Optional[str]:
         """Extract title from PDF metadata."""
         if not metadata:
@@ -146,14 +320,7 @@ class PDFParser(BaseParser):
                     
                 # Extract date components (YYYYMMDDHHMMSS)
                 if len(date_str) >= 14:
-                    year = int(date_str[0:4])
-                    month = int(date_str[4:6])
-                    day = int(date_str[6:8])
-                    hour = int(date_str[8:10])
-                    minute = int(date_str[10:12])
-                    second = int(date_str[12:14])
-                    
-                    return datetime(year, month, day, hour, minute, second)
+                    return datetime.strptime(date_str[:14], PDF_DATE_FORMAT)
         except (ValueError, IndexError, AttributeError) as e:
             self.logger.debug(f"Failed to parse PDF date: {e}")
             pass
@@ -5,14 +5,30 @@ Uses Reddit JSON API (no authentication required for public content).
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import asyncio
+import aiohttp
+import orjson
+import re
 import requests
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .base_parser import BaseParser, ParserResult
+from ..base_crawler import TokenBucket
 from ...utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+_SUBREDDIT_RE = re.compile(r'/r/([^/]+)')
+
+# Keep-alive pool shared by all requests to reddit.com
+REDDIT_POOL_SIZE = 32
+# Requests per second allowed against reddit.com across all threads
+REDDIT_REQUESTS_PER_SECOND = 1.0
+# Request timeout in seconds
+REDDIT_TIMEOUT = 10
+
 
 class RedditParser(BaseParser):
     """Parser for Reddit content via JSON API."""
@@ -22,23 +38,41 @@ class RedditParser(BaseParser):
         self.base_url = "https://www.reddit.com"
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
         })
+        adapter = HTTPAdapter(
+            pool_connections=REDDIT_POOL_SIZE,
+            pool_maxsize=REDDIT_POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        self.session.mount("https://", adapter)
+        
+        # One bucket for the single host, shared by concurrent fetches
+        self.bucket = TokenBucket(REDDIT_REQUESTS_PER_SECOND)
         
-    def parse(self, content: bytes, url: str) -> ParserResult:
+    def _throttle(self) -> None:
+        """Wait for a request slot on reddit.com."""
+        wait = self.bucket.take()
+        if wait > 0:
+            time.sleep(wait)
+        
+    def parse(self, content: bytes, url: str, encoding: Optional[str] = None) -> ParserResult:
         """
         Parse Reddit content.
         
         Args:
             content: Raw JSON content
             url: Source URL
+            encoding: Unused, Reddit JSON is always UTF-8
             
         Returns:
             ParserResult object
         """
         try:
-            import json
-            data = json.loads(content)
+            # JSON is UTF-8 by spec; orjson decodes the bytes itself
+            data = orjson.loads(content)
             
             # Extract posts from JSON
             posts = self._extract_posts(data)
@@ -56,14 +90,15 @@ class RedditParser(BaseParser):
             return ParserResult(
                 url=url,
                 content_type="reddit",
-                raw_content=content.decode('utf-8'),
+                raw_content=content,
                 cleaned_text=cleaned_text,
                 title=f"r/{subreddit}" if subreddit else "Reddit Feed",
                 custom_metadata={
                     "post_count": len(posts),
                     "platform": "reddit",
                     "subreddit": subreddit
-                }
+                },
+                raw_encoding='utf-8'
             )
             
         except Exception as e:
@@ -94,53 +129,144 @@ class RedditParser(BaseParser):
             url = f"{self.base_url}/r/{subreddit}/{sort}.json"
             params = {'limit': min(limit, 100)}
             
-            response = self.session.get(url, params=params, timeout=10)
+            self._throttle()
+            response = self.session.get(url, params=params, timeout=REDDIT_TIMEOUT)
             response.raise_for_status()
             
-            data = response.json()
-            posts = data.get('data', {}).get('children', [])
+            data = orjson.loads(response.content)
+            results = self._build_post_results(data, subreddit, limit)
+            logger.info(f"Fetched {len(results)} posts from r/{subreddit}")
             
-            for post_data in posts[:limit]:
-                post = post_data.get('data', {})
-                
-                # Create result for each post
-                title = post.get('title', '')
-                selftext = post.get('selftext', '')
-                author = post.get('author', '')
-                created = post.get('created_utc', 0)
-                
-                text = f"{title}\n\n{selftext}"
-                cleaned = self.clean_text(text)
-                
-                result = ParserResult(
-                    url=post.get('url', ''),
-                    content_type="reddit",
-                    raw_content=text,
-                    cleaned_text=cleaned,
-                    title=title,
-                    author=author,
-                    publish_date=datetime.fromtimestamp(created) if created else None,
-                    custom_metadata={
-                        "platform": "reddit",
-                        "subreddit": subreddit,
-                        "score": post.get('score', 0),
-                        "num_comments": post.get('num_comments', 0),
-                        "post_id": post.get('id', '')
-                    }
-                )
+        except Exception as e:
+            logger.error(f"Failed to fetch r/{subreddit}: {e}")
+            
+        return results
+        
+    async def afetch_subreddit(
+        self,
+        session: aiohttp.ClientSession,
+        subreddit: str,
+        sort: str = "hot",
+        limit: int = 100
+    ) -> List[ParserResult]:
+        """
+        Fetch posts from a subreddit without blocking the event loop.
+        
+        Shares the per-host token bucket with fetch_subreddit, so concurrent
+        fetches stay within the same reddit.com budget.
+        
+        Args:
+            session: aiohttp session to fetch with
+            subreddit: Subreddit name (without r/)
+            sort: Sort type (hot, new, top, rising)
+            limit: Maximum posts to fetch
+            
+        Returns:
+            List of ParserResult objects
+        """
+        results = []
+        
+        try:
+            url = f"{self.base_url}/r/{subreddit}/{sort}.json"
+            params = {'limit': min(limit, 100)}
+            
+            wait = self.bucket.take()
+            if wait > 0:
+                await asyncio.sleep(wait)
                 
-                results.append(result)
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
                 
+            results = self._build_post_results(data, subreddit, limit)
             logger.info(f"Fetched {len(results)} posts from r/{subreddit}")
             
-            # Rate limiting
-            time.sleep(1)
-            
         except Exception as e:
             logger.error(f"Failed to fetch r/{subreddit}: {e}")
             
         return results
         
+    async def afetch_subreddits(
+        self,
+        subreddits: List[str],
+        sort: str = "hot",
+        limit: int = 100
+    ) -> List[ParserResult]:
+        """
+        Fetch several subreddits concurrently over one keep-alive session.
+        
+        Args:
+            subreddits: Subreddit names (without r/)
+            sort: Sort type (hot, new, top, rising)
+            limit: Maximum posts to fetch per subreddit
+            
+        Returns:
+            Posts from all subreddits, in the order the subreddits were given
+        """
+        connector = aiohttp.TCPConnector(limit_per_host=REDDIT_POOL_SIZE)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': self.session.headers['User-Agent']},
+            timeout=aiohttp.ClientTimeout(total=REDDIT_TIMEOUT)
+        ) as session:
+            batches = await asyncio.gather(*(
+                self.afetch_subreddit(session, subreddit, sort, limit)
+                for subreddit in subreddits
+            ))
+        return [result for batch in batches for result in batch]
+        
+    def _build_post_results(
+        self,
+        data: Dict[str, Any],
+        subreddit: str,
+        limit: int
+    ) -> List[ParserResult]:
+        """
+        Turn a subreddit listing into one result per post.
+        
+        Args:
+            data: Decoded listing JSON
+            subreddit: Subreddit name
+            limit: Maximum posts to keep
+            
+        Returns:
+            List of ParserResult objects
+        """
+        results = []
+        
+        for post_data in data.get('data', {}).get('children', [])[:limit]:
+            post = post_data.get('data', {})
+            
+            # Create result for each post
+            title = post.get('title', '')
+            selftext = post.get('selftext', '')
+            author = post.get('author', '')
+            created = post.get('created_utc', 0)
+            
+            text = f"{title}\n\n{selftext}"
+            cleaned = self.clean_text(text)
+            
+            result = ParserResult(
+                url=post.get('url', ''),
+                content_type="reddit",
+                raw_content=text,
+                cleaned_text=cleaned,
+                title=title,
+                author=author,
+                publish_date=datetime.fromtimestamp(created) if created else None,
+                custom_metadata={
+                    "platform": "reddit",
+                    "subreddit": subreddit,
+                    "score": post.get('score', 0),
+                    "num_comments": post.get('num_comments', 0),
+                    "post_id": post.get('id', '')
+                }
+            )
+            
+            results.append(result)
+            
+        return results
+        
     def fetch_post_comments(
         self,
         subreddit: str,
@@ -162,10 +288,11 @@ class RedditParser(BaseParser):
         
         try:
             url = f"{self.base_url}/r/{subreddit}/comments/{post_id}.json"
-            response = self.session.get(url, timeout=10)
+            self._throttle()
+            response = self.session.get(url, timeout=REDDIT_TIMEOUT)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Comments are in the second element
             if len(data) > 1:
@@ -197,8 +324,5 @@ class RedditParser(BaseParser):
         
     def _extract_subreddit(self, url: str) -> Optional[str]:
         """Extract subreddit name from URL."""
-        import re
-        match = re.search(r'/r/([^/]+)', url)
-        if match:
-            return match.group(1)
-        return None
+        match = _SUBREDDIT_RE.search(url)
+        return match.group(1) if match else None
@@ -3,21 +3,74 @@ RSS/XML parser using feedparser.
 Parses RSS and Atom feeds, treating each entry as a separate document.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import feedparser
+import os
+import re
+import requests
+import threading
+import time
 from time import struct_time
+from requests.adapters import HTTPAdapter
 
 from .base_parser import BaseParser, ParserResult
 from ...utils.logger import setup_logger
+from ...utils.config import settings
 
 logger = setup_logger(__name__)
 
+# Last-resort tag stripper for entry markup the HTML parser rejects
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Feeds remembered for conditional GETs, and how long a cached copy may be reused
+FEED_CACHE_MAX = 256
+FEED_CACHE_TTL = 24 * 3600
+
+# Keep-alive pool for feed fetches (hosts, connections per host)
+FEED_POOL_CONNECTIONS = 16
+FEED_POOL_MAXSIZE = 32
+
+# Feeds with at least this many entries have them parsed in worker threads
+PARALLEL_ENTRY_THRESHOLD = 8
+ENTRY_WORKERS = min(8, os.cpu_count() or 1)
+
 
 class RSSParser(BaseParser):
     """Parser for RSS and Atom feeds."""
     
-    def parse(self, content: bytes, url: str) -> ParserResult:
+    # Shared by all instances: url -> (ETag, Last-Modified, entries, stored_at)
+    _feed_cache: OrderedDict = OrderedDict()
+    _feed_cache_lock = threading.Lock()
+    
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+    
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Create the shared keep-alive session for feed fetches on first use."""
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                session.headers.update({
+                    'User-Agent': settings.crawler_user_agent,
+                    'Accept-Encoding': 'gzip, deflate'
+                })
+                adapter = HTTPAdapter(
+                    pool_connections=FEED_POOL_CONNECTIONS,
+                    pool_maxsize=FEED_POOL_MAXSIZE
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                cls._session = session
+            return cls._session
+            
+    def parse(self, content: bytes, url: str, encoding: Optional[str] = None) -> ParserResult:
         """
         Parse RSS/Atom feed content.
         
@@ -27,6 +80,7 @@ class RSSParser(BaseParser):
         Args:
             content: Raw feed content as bytes
             url: Feed URL
+            encoding: Charset declared by the response (detected if not given)
             
         Returns:
             ParserResult object for the feed
@@ -36,10 +90,10 @@ class RSSParser(BaseParser):
         """
         try:
             # Decode content
-            feed_text = self.decode_content(content)
+            feed_text = self.decode_content(content, encoding)
             
-            # Parse feed
-            feed = feedparser.parse(feed_text)
+            # Parse feed (only text is kept, so links inside content are left as-is)
+            feed = feedparser.parse(feed_text, resolve_relative_uris=False)
             
             if feed.bozo and not feed.entries:
                 # Feed has errors and no entries
@@ -86,33 +140,137 @@ class RSSParser(BaseParser):
         Raises:
             ValueError: If feed cannot be parsed
         """
-        try:
-            # Decode content
-            feed_text = self.decode_content(content)
+        entries = self._load_entries(content, feed_url)
+        
+        if len(entries) >= PARALLEL_ENTRY_THRESHOLD:
+            parsed = self._get_executor().map(lambda entry: self._safe_parse_entry(entry, feed_url), entries)
+        else:
+            parsed = (self._safe_parse_entry(entry, feed_url) for entry in entries)
+            
+        results = [result for result in parsed if result is not None]
+        self.logger.info(f"Parsed {len(results)} entries from {feed_url}")
+        return results
+        
+    def fetch_entries(self, feed_url: str, timeout: float = 10) -> List[ParserResult]:
+        """
+        Fetch a feed and parse its entries, using a conditional GET when possible.
+        
+        A 304 Not Modified reply returns the entries parsed last time without
+        downloading or parsing the feed again. The cache is shared by all
+        parser instances, so callers always receive copies they may modify.
+        
+        Args:
+            feed_url: Feed URL
+            timeout: Request timeout in seconds
             
-            # Parse feed
-            feed = feedparser.parse(feed_text)
+        Returns:
+            List of ParserResult objects, one per feed entry
             
-            if feed.bozo and not feed.entries:
-                raise ValueError(f"Invalid feed format: {feed.bozo_exception}")
+        Raises:
+            requests.RequestException: If the feed cannot be fetched
+            ValueError: If feed cannot be parsed
+        """
+        with self._feed_cache_lock:
+            cached = self._feed_cache.get(feed_url)
+        if cached and time.monotonic() - cached[3] > FEED_CACHE_TTL:
+            cached = None
+            
+        headers = {}
+        if cached:
+            etag, last_modified = cached[0], cached[1]
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
                 
-            results = []
-            
-            for entry in feed.entries:
-                try:
-                    result = self._parse_entry(entry, feed_url)
-                    results.append(result)
-                except Exception as e:
-                    self.logger.warning(f"Failed to parse feed entry: {e}")
-                    continue
-                    
-            self.logger.info(f"Parsed {len(results)} entries from {feed_url}")
-            return results
+        response = self._get_session().get(feed_url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and cached:
+            self.logger.debug(f"Feed not modified: {feed_url}")
+            return [entry.copy() for entry in cached[2]]
             
+        response.raise_for_status()
+        entries = self.parse_entries(response.content, feed_url)
+        
+        etag = response.headers.get('ETag', '')
+        last_modified = response.headers.get('Last-Modified', '')
+        with self._feed_cache_lock:
+            if etag or last_modified:
+                cached_entries = tuple(entry.copy() for entry in entries)
+                self._feed_cache[feed_url] = (etag, last_modified, cached_entries, time.monotonic())
+                self._feed_cache.move_to_end(feed_url)
+                while len(self._feed_cache) > FEED_CACHE_MAX:
+                    self._feed_cache.popitem(last=False)
+            else:
+                self._feed_cache.pop(feed_url, None)
+                
+        return entries
+        
+    def iter_entries(self, content: bytes, feed_url: str) -> Iterator[ParserResult]:
+        """
+        Yield feed entries one at a time, building each result only when requested.
+        
+        Callers that stop early (e.g. after max_hits entries) skip the
+        per-entry HTML cleanup for the rest of the feed.
+        
+        Args:
+            content: Raw feed content as bytes
+            feed_url: Feed URL
+            
+        Yields:
+            ParserResult objects, one per feed entry
+            
+        Raises:
+            ValueError: If feed cannot be parsed
+        """
+        for entry in self._load_entries(content, feed_url):
+            result = self._safe_parse_entry(entry, feed_url)
+            if result is not None:
+                yield result
+                
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Create the shared entry-parsing thread pool on first use."""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=ENTRY_WORKERS)
+            return cls._executor
+            
+    def _load_entries(self, content: bytes, feed_url: str) -> list:
+        """
+        Parse a feed document into its raw feedparser entries.
+        
+        Args:
+            content: Raw feed content as bytes
+            feed_url: Feed URL
+            
+        Returns:
+            List of feedparser entries
+            
+        Raises:
+            ValueError: If feed cannot be parsed
+        """
+        try:
+            # Let feedparser decode the bytes itself: it honours the XML
+            # encoding declaration and spares a chardet pass
+            feed = feedparser.parse(content, resolve_relative_uris=False)
         except Exception as e:
             self.logger.error(f"Failed to parse RSS feed from {feed_url}: {e}")
             raise ValueError(f"RSS parsing failed: {e}")
             
+        if feed.bozo and not feed.entries:
+            self.logger.error(f"Failed to parse RSS feed from {feed_url}: {feed.bozo_exception}")
+            raise ValueError(f"RSS parsing failed: Invalid feed format: {feed.bozo_exception}")
+            
+        return feed.entries
+        
+    def _safe_parse_entry(self, entry: feedparser.FeedParserDict, feed_url: str) -> Optional[ParserResult]:
+        """Parse one entry, logging and returning None instead of raising."""
+        try:
+            return self._parse_entry(entry, feed_url)
+        except Exception as e:
+            self.logger.warning(f"Failed to parse feed entry: {e}")
+            return None
+            
     def _parse_entry(self, entry: feedparser.FeedParserDict, feed_url: str) -> ParserResult:
         """
         Parse a single feed entry.
@@ -146,11 +304,9 @@ class RSSParser(BaseParser):
         elif 'description' in entry:
             content = entry.description
             
-        # Clean HTML tags from content
-        from bs4 import BeautifulSoup
+        # Clean HTML tags from content (plain-text summaries need no parse)
         if content:
-            soup = BeautifulSoup(content, 'html.parser')
-            cleaned_text = self.clean_text(soup.get_text())
+            cleaned_text = self.clean_text(self._entry_text(content))
         else:
             cleaned_text = title
             
@@ -174,6 +330,25 @@ class RSSParser(BaseParser):
             }
         )
         
+    def _entry_text(self, content: str) -> str:
+        """
+        Get the text of an entry's HTML content.
+        
+        Args:
+            content: Entry content or summary, possibly HTML
+            
+        Returns:
+            Text with markup removed
+        """
+        if '<' not in content:
+            return content
+            
+        try:
+            return self.node_text(self.build_tree(content), ' ')
+        except Exception as e:
+            logger.debug(f"Falling back to tag stripping for malformed entry HTML: {e}")
+            return _TAG_RE.sub(' ', content)
+            
     @staticmethod
     def _parse_date(date_struct: Optional[struct_time]) -> Optional[datetime]:
         """
@@ -189,8 +364,8 @@ class RSSParser(BaseParser):
             return None
             
         try:
-            from time import mktime
-            timestamp = mktime(date_struct)
-            return datetime.fromtimestamp(timestamp)
+            # Same naive value the mktime/fromtimestamp round trip produced,
+            # without two libc timezone conversions
+            return datetime(*date_struct[:6])
         except (ValueError, TypeError, OverflowError):
             return None
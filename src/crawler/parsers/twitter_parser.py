@@ -4,16 +4,31 @@ Extracts tweets from user timelines and search results.
 """
 
 from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
 import re
+from bs4 import BeautifulSoup, SoupStrainer
 
-from .base_parser import BaseParser, ParserResult
+from .base_parser import BaseParser, ParserResult, SELECTOLAX_AVAILABLE
+from .rss_parser import RSSParser
 from ...utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+_USERNAME_RE = re.compile(r'(?:twitter\.com|nitter\.[^/]+)/([^/]+)', re.IGNORECASE)
+
+# Seconds to wait for a Nitter instance's RSS feed
+NITTER_TIMEOUT = 10
+
+# Tried in order; the first selector that matches wins
+TWEET_SELECTORS = (
+    '.tweet-content',
+    '.timeline-item',
+    'article[data-tweet-id]'
+)
+# Keeps only the subtrees the class selectors can match when parsing with BeautifulSoup
+TWEET_STRAINER = SoupStrainer(attrs={'class': ['tweet-content', 'timeline-item']})
+
 
 class TwitterParser(BaseParser):
     """Parser for Twitter/X content via Nitter RSS or scraping."""
@@ -25,24 +40,33 @@ class TwitterParser(BaseParser):
             "https://nitter.poast.org",
             "https://nitter.privacydev.net"
         ]
+        self._rss_parser = RSSParser()
+        # Last instance that answered; tried alone before probing all of them
+        self.preferred_instance: Optional[str] = None
         
-    def parse(self, content: bytes, url: str) -> ParserResult:
+    def parse(self, content: bytes, url: str, encoding: Optional[str] = None) -> ParserResult:
         """
         Parse Twitter content.
         
         Args:
             content: Raw content
             url: Source URL
+            encoding: Charset declared by the response (detected if not given)
             
         Returns:
             ParserResult object
         """
         try:
-            text = self.decode_content(content)
-            soup = BeautifulSoup(text, 'html.parser')
-            
+            text = self.decode_content(content, encoding)
             # Extract tweets
-            tweets = self._extract_tweets(soup)
+            if SELECTOLAX_AVAILABLE:
+                tweets = self._extract_tweets(self.build_tree(text))
+            else:
+                # Build only the tweet containers; parse the full page only
+                # when the article[data-tweet-id] selector is needed
+                tweets = self._extract_tweets(BeautifulSoup(text, 'lxml', parse_only=TWEET_STRAINER))
+                if not tweets:
+                    tweets = self._extract_tweets(self.build_tree(text))
             
             # Combine all tweet text
             all_text = "\n\n".join([t['text'] for t in tweets])
@@ -78,66 +102,83 @@ class TwitterParser(BaseParser):
         Returns:
             List of ParserResult objects
         """
-        results = []
-        
-        for instance in self.nitter_instances:
+        if self.preferred_instance:
             try:
-                # Try Nitter RSS feed
-                rss_url = f"{instance}/{username}/rss"
-                response = requests.get(rss_url, timeout=10)
-                
-                if response.status_code == 200:
-                    # Parse RSS
-                    from .rss_parser import RSSParser
-                    rss_parser = RSSParser()
-                    entries = rss_parser.parse_entries(response.content, rss_url)
-                    
-                    # Convert to Twitter-specific results
-                    for entry in entries[:max_tweets]:
-                        entry.content_type = "twitter"
-                        entry.custom_metadata["platform"] = "twitter"
-                        entry.custom_metadata["username"] = username
-                        results.append(entry)
-                    
-                    logger.info(f"Fetched {len(results)} tweets from @{username}")
-                    return results
-                    
+                return self._fetch_timeline_from(self.preferred_instance, username, max_tweets)
             except Exception as e:
-                logger.warning(f"Failed to fetch from {instance}: {e}")
-                continue
+                logger.warning(f"Failed to fetch from {self.preferred_instance}: {e}")
+                self.preferred_instance = None
                 
-        if not results:
-            logger.error(f"Failed to fetch tweets for @{username} from all instances")
+        # Probe every instance at once and keep the first that answers
+        executor = ThreadPoolExecutor(max_workers=len(self.nitter_instances))
+        futures = {
+            executor.submit(self._fetch_timeline_from, instance, username, max_tweets): instance
+            for instance in self.nitter_instances
+        }
+        try:
+            for future in as_completed(futures):
+                instance = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to fetch from {instance}: {e}")
+                    continue
+                    
+                self.preferred_instance = instance
+                return results
+        finally:
+            # Slower instances finish in the background; nothing waits on them
+            executor.shutdown(wait=False, cancel_futures=True)
             
+        logger.error(f"Failed to fetch tweets for @{username} from all instances")
+        return []
+        
+    def _fetch_timeline_from(self, instance: str, username: str, max_tweets: int) -> List[ParserResult]:
+        """
+        Fetch and parse a user's RSS feed from one Nitter instance.
+        
+        Args:
+            instance: Nitter base URL
+            username: Twitter username
+            max_tweets: Maximum tweets to return
+            
+        Returns:
+            List of ParserResult objects
+            
+        Raises:
+            requests.RequestException: If the instance does not return the feed
+            ValueError: If the feed cannot be parsed
+        """
+        rss_url = f"{instance}/{username}/rss"
+        entries = self._rss_parser.fetch_entries(rss_url, timeout=NITTER_TIMEOUT)
+        
+        # Convert to Twitter-specific results
+        results = []
+        for entry in entries[:max_tweets]:
+            entry.content_type = "twitter"
+            entry.custom_metadata["platform"] = "twitter"
+            entry.custom_metadata["username"] = username
+            results.append(entry)
+            
+        logger.info(f"Fetched {len(results)} tweets from @{username} via {instance}")
         return results
         
-    def _extract_tweets(self, soup: BeautifulSoup) -> List[dict]:
+    def _extract_tweets(self, tree) -> List[dict]:
         """Extract tweets from HTML."""
         tweets = []
         
         # Try multiple selectors for tweet containers
-        tweet_selectors = [
-            '.tweet-content',
-            '.timeline-item',
-            'article[data-tweet-id]'
-        ]
-        
-        for selector in tweet_selectors:
-            elements = soup.select(selector)
-            if elements:
-                for elem in elements:
-                    text = elem.get_text(strip=True)
-                    if text:
-                        tweets.append({'text': text})
+        for selector in TWEET_SELECTORS:
+            texts = self.select_texts(tree, selector)
+            if texts:
+                tweets.extend({'text': text} for text in texts if text)
                 break
                 
         return tweets
         
     def _extract_username(self, url: str) -> Optional[str]:
         """Extract username from Twitter URL."""
-        match = re.search(r'twitter\.com/([^/]+)', url, re.IGNORECASE)
-        if not match:
-            match = re.search(r'nitter\.[^/]+/([^/]+)', url, re.IGNORECASE)
+        match = _USERNAME_RE.search(url)
         if match:
             return match.group(1)
         return None
@@ -5,6 +5,8 @@ Handles .txt files with various encodings.
 
 from typing import Optional
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
 
 from .base_parser import BaseParser, ParserResult
 from ...utils.logger import setup_logger
@@ -15,13 +17,14 @@ logger = setup_logger(__name__)
 class TXTParser(BaseParser):
     """Parser for plain text files."""
     
-    def parse(self, content: bytes, url: str) -> ParserResult:
+    def parse(self, content: bytes, url: str, encoding: Optional[str] = None) -> ParserResult:
         """
         Parse plain text content.
         
         Args:
             content: Raw text content as bytes
             url: Source URL
+            encoding: Charset declared by the response (detected if not given)
             
         Returns:
             ParserResult object
@@ -31,7 +34,7 @@ class TXTParser(BaseParser):
         """
         try:
             # Decode content with encoding detection
-            text = self.decode_content(content)
+            text = self.decode_content(content, encoding)
             
             if not text:
                 raise ValueError("Empty text file")
@@ -50,7 +53,7 @@ class TXTParser(BaseParser):
                 title=title,
                 custom_metadata={
                     "file_size": len(content),
-                    "encoding": self.detect_encoding(content)
+                    "encoding": encoding or self.detect_encoding(content)
                 }
             )
             
@@ -73,17 +76,20 @@ class TXTParser(BaseParser):
         Returns:
             Title or None
         """
-        # Try to get first line as title
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
+        # Try to get first line as title, reading lines one at a time
+        # rather than splitting the whole file
+        start = 0
+        while start < len(text):
+            end = text.find('\n', start)
+            if end == -1:
+                end = len(text)
+            line = text[start:end].strip()
             if line and len(line) < 200:  # Reasonable title length
                 return line
-                
+            start = end + 1
+            
         # Fallback to filename from URL
         try:
-            from urllib.parse import urlparse
-            from pathlib import Path
             path = urlparse(url).path
             filename = Path(path).stem  # Get filename without extension
             if filename:
@@ -5,13 +5,17 @@ Extracts video titles, descriptions, and metadata.
 
 from typing import List, Optional
 from datetime import datetime
-import requests
+import re
 
 from .base_parser import BaseParser, ParserResult
+from .rss_parser import RSSParser
 from ...utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# watch?v=ID, youtu.be/ID or embed/ID in one scan; one group per URL form
+_VIDEO_ID_RE = re.compile(r'watch\?v=([^&]+)|youtu\.be/([^?]+)|embed/([^?]+)')
+
 
 class YouTubeParser(BaseParser):
     """Parser for YouTube content via RSS feeds."""
@@ -19,24 +23,23 @@ class YouTubeParser(BaseParser):
     def __init__(self):
         super().__init__()
         self.feed_url = "https://www.youtube.com/feeds/videos.xml"
+        self._rss_parser = RSSParser()
         
-    def parse(self, content: bytes, url: str) -> ParserResult:
+    def parse(self, content: bytes, url: str, encoding: Optional[str] = None) -> ParserResult:
         """
         Parse YouTube RSS feed.
         
         Args:
             content: Raw XML content
             url: Source URL
+            encoding: Unused, accepted for interface compatibility
             
         Returns:
             ParserResult object
         """
         try:
-            from .rss_parser import RSSParser
-            rss_parser = RSSParser()
-            
             # Parse as RSS
-            result = rss_parser.parse(content, url)
+            result = self._rss_parser.parse(content, url)
             
             # Override content type
             result.content_type = "youtube"
@@ -69,14 +72,8 @@ class YouTubeParser(BaseParser):
             # Build RSS feed URL
             feed_url = f"{self.feed_url}?channel_id={channel_id}"
             
-            # Fetch feed
-            response = requests.get(feed_url, timeout=10)
-            response.raise_for_status()
-            
-            # Parse entries
-            from .rss_parser import RSSParser
-            rss_parser = RSSParser()
-            entries = rss_parser.parse_entries(response.content, feed_url)
+            # Fetch and parse entries (unchanged feeds come back from cache)
+            entries = self._rss_parser.fetch_entries(feed_url)
             
             # Convert to YouTube-specific results
             for entry in entries[:max_videos]:
@@ -120,14 +117,8 @@ class YouTubeParser(BaseParser):
             # Build RSS feed URL for playlist
             feed_url = f"{self.feed_url}?playlist_id={playlist_id}"
             
-            # Fetch feed
-            response = requests.get(feed_url, timeout=10)
-            response.raise_for_status()
-            
-            # Parse entries
-            from .rss_parser import RSSParser
-            rss_parser = RSSParser()
-            entries = rss_parser.parse_entries(response.content, feed_url)
+            # Fetch and parse entries (unchanged feeds come back from cache)
+            entries = self._rss_parser.fetch_entries(feed_url)
             
             # Convert to YouTube-specific results
             for entry in entries[:max_videos]:
@@ -146,17 +137,8 @@ class YouTubeParser(BaseParser):
         
     def _extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL."""
-        import re
-        
-        patterns = [
-            r'watch\?v=([^&]+)',
-            r'youtu\.be/([^?]+)',
-            r'embed/([^?]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-                
+        match = _VIDEO_ID_RE.search(url)
+        if match:
+            return next(group for group in match.groups() if group)
+            
         return None
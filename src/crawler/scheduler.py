@@ -7,6 +7,7 @@ from typing import Dict, Optional
 from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.jobstores.base import JobLookupError
 
 from .crawl_manager import CrawlManager
@@ -15,6 +16,9 @@ from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Job ID prefixes of crawl jobs; maintenance jobs share the scheduler but are not listed
+CRAWL_JOB_PREFIXES = ("crawl_", "manual_crawl_")
+
 
 class CrawlScheduler:
     """Manages scheduled crawling jobs."""
@@ -278,6 +282,30 @@ class CrawlScheduler:
             self.logger.error(f"Failed to load sources: {e}")
             return 0
             
+    def add_keyword_stats_job(self, hours: int = 1) -> None:
+        """
+        Schedule periodic rebuilds of the keyword stats used for search suggestions.
+        
+        Args:
+            hours: Interval between rebuilds
+        """
+        self.scheduler.add_job(
+            func=self._refresh_keyword_stats,
+            trigger=IntervalTrigger(hours=hours),
+            id="refresh_keyword_stats",
+            name="Refresh keyword stats",
+            replace_existing=True,
+            next_run_time=datetime.now()
+        )
+        self.logger.info(f"Scheduled keyword stats refresh every {hours}h")
+        
+    def _refresh_keyword_stats(self) -> None:
+        """Rebuild keyword stats, logging instead of raising on failure."""
+        try:
+            db_manager.refresh_keyword_stats()
+        except Exception as e:
+            self.logger.error(f"Keyword stats refresh failed: {e}")
+            
     def get_job_info(self, source_id: str) -> Optional[dict]:
         """
         Get information about a scheduled job.
@@ -306,13 +334,15 @@ class CrawlScheduler:
         
     def list_jobs(self) -> list:
         """
-        List all scheduled jobs.
+        List scheduled crawl jobs (scheduled and manual), skipping maintenance jobs.
         
         Returns:
             List of job info dictionaries
         """
         jobs = []
         for job in self.scheduler.get_jobs():
+            if not job.id.startswith(CRAWL_JOB_PREFIXES):
+                continue
             jobs.append({
                 "id": job.id,
                 "name": job.name,
@@ -3,7 +3,7 @@ Search functionality using MongoDB full-text search.
 Provides keyword-based search with filters and ranking.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from ..storage import db_manager, SearchQuery, SearchResult, ContentType
@@ -27,7 +27,7 @@ class SearchEngine:
         date_to: Optional[datetime] = None,
         limit: int = 20,
         offset: int = 0
-    ) -> List[SearchResult]:
+    ) -> Tuple[List[SearchResult], int]:
         """
         Search documents with filters.
         
@@ -41,7 +41,7 @@ class SearchEngine:
             offset: Results offset for pagination
             
         Returns:
-            List of search results
+            Tuple of (search results, total number of matches)
         """
         try:
             # Create search query
@@ -55,22 +55,22 @@ class SearchEngine:
                 offset=offset
             )
             
-            # Execute search
-            results = db_manager.search_documents(query)
+            # Execute search (page and total count in one round-trip)
+            results, total = db_manager.search_documents_page(query)
             
-            self.logger.info(f"Search for '{keywords}' returned {len(results)} results")
-            return results
+            self.logger.info(f"Search for '{keywords}' returned {len(results)} of {total} results")
+            return results, total
             
         except Exception as e:
             self.logger.error(f"Search failed: {e}")
-            return []
+            return [], 0
             
     def search_with_boolean(
         self,
         keywords: str,
         operator: str = "AND",
         **filters
-    ) -> List[SearchResult]:
+    ) -> Tuple[List[SearchResult], int]:
         """
         Search with boolean operators.
         
@@ -80,7 +80,7 @@ class SearchEngine:
             **filters: Additional search filters
             
         Returns:
-            List of search results
+            Tuple of (search results, total number of matches)
         """
         # MongoDB text search supports AND by default
         # For OR, we use quoted phrases or the pipe operator
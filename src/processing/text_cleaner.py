@@ -11,6 +11,27 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Patterns compiled once at import
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+EMAIL_RE = re.compile(r'\S+@\S+')
+SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,!?;:\-\']')
+WHITESPACE_RE = re.compile(r'\s+')
+REPEATED_PUNCT_RE = re.compile(r'[.,!?;:]{2,}')
+WORD_RE = re.compile(r'\b[a-z]+\b')
+
+# Enhanced stopwords for basic keyword extraction
+STOPWORDS = frozenset({
+    'the', 'is', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'up', 'down', 'about', 'which', 'that',
+    'this', 'these', 'those', 'it', 'be', 'are', 'was', 'were', 'been',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'can', 'may', 'might', 'must', 'should', 'a', 'an', 'as', 'if', 'than',
+    'then', 'so', 'such', 'no', 'not', 'only', 'own', 'same', 'just',
+    'le', 'la', 'les', 'un', 'une', 'des', 'de', 'et', 'ou', 'il', 'elle',
+    'wa', 'http', 'https', 'www', 'com'
+})
+
 
 class TextCleaner:
     """Text cleaning and keyword extraction utilities."""
@@ -29,22 +50,22 @@ class TextCleaner:
             return ""
             
         # Remove HTML artifacts
-        text = re.sub(r'<[^>]+>', '', text)
+        text = HTML_TAG_RE.sub('', text)
         
         # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+        text = URL_RE.sub('', text)
         
         # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
+        text = EMAIL_RE.sub('', text)
         
         # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s.,!?;:\-\']', ' ', text)
+        text = SPECIAL_CHARS_RE.sub(' ', text)
         
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         
         # Remove excessive punctuation
-        text = re.sub(r'[.,!?;:]{2,}', '.', text)
+        text = REPEATED_PUNCT_RE.sub('.', text)
         
         return text.strip()
         
@@ -65,7 +86,7 @@ class TextCleaner:
         text = text.lower()
         
         # Extract words
-        words = re.findall(r'\b[a-z]+\b', text)
+        words = WORD_RE.findall(text)
         
         # Count frequencies
         return dict(Counter(words))
@@ -111,22 +132,10 @@ class TextCleaner:
         # Get word frequencies
         word_freq = self.get_keyword_frequencies(text)
         
-        # Enhanced stopwords
-        stopwords = {
-            'the', 'is', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'up', 'down', 'about', 'which', 'that',
-            'this', 'these', 'those', 'it', 'be', 'are', 'was', 'were', 'been',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'can', 'may', 'might', 'must', 'should', 'a', 'an', 'as', 'if', 'than',
-            'then', 'so', 'such', 'no', 'not', 'only', 'own', 'same', 'just',
-            'le', 'la', 'les', 'un', 'une', 'des', 'de', 'et', 'ou', 'il', 'elle',
-            'wa', 'http', 'https', 'www', 'com'
-        }
-        
         # Filter and sort
         filtered = [
             (word, freq) for word, freq in word_freq.items()
-            if len(word) >= 3 and word.lower() not in stopwords and word.isalpha()
+            if len(word) >= 3 and word.lower() not in STOPWORDS and word.isalpha()
         ]
         
         sorted_keywords = sorted(filtered, key=lambda x: x[1], reverse=True)
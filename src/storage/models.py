@@ -6,7 +6,7 @@ Defines Pydantic models for sources and documents with validation.
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from enum import Enum
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
 
 class ContentType(str, Enum):
@@ -127,8 +127,10 @@ class Project(BaseModel):
         description="Timestamp when project was last updated"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "name": "Healthcare Investment Analysis",
                 "domain": "Healthcare",
@@ -137,6 +139,7 @@ class Project(BaseModel):
                 "icon": "🏥"
             }
         }
+    )
 
 
 class Source(BaseModel):
@@ -279,6 +282,10 @@ class Document(BaseModel):
         default_factory=DocumentMetadata,
         description="Document metadata"
     )
+    keywords: List[str] = Field(
+        default_factory=list,
+        description="Keywords extracted from cleaned text at ingestion time"
+    )
     crawl_config_snapshot: Dict[str, Any] = Field(
         default_factory=dict,
         description="Snapshot of crawl configuration at collection time"
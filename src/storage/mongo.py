@@ -3,12 +3,13 @@ MongoDB connection and database operations.
 Provides connection management, CRUD operations, and search functionality.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
 from datetime import datetime
-from pymongo import MongoClient, ASCENDING, DESCENDING, TEXT
+import re
+from pymongo import MongoClient, ASCENDING, DESCENDING, TEXT, UpdateOne
 from pymongo.database import Database
 from pymongo.collection import Collection
-from pymongo.errors import ConnectionFailure, DuplicateKeyError
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError
 from bson import ObjectId
 from bson.errors import InvalidId
 
@@ -21,6 +22,20 @@ from .models import (
 
 logger = setup_logger(__name__, level=settings.log_level)
 
+# _id of the single materialized stats document
+GLOBAL_STATS_ID = "global"
+
+# Fields returned for search hits (cleaned_text is only used for the snippet)
+SEARCH_PROJECTION = {
+    "url": 1,
+    "metadata.title": 1,
+    "cleaned_text": 1,
+    "source_id": 1,
+    "content_type": 1,
+    "crawled_at": 1,
+    "score": {"$meta": "textScore"}
+}
+
 
 class MongoDBManager:
     """MongoDB connection and operations manager."""
@@ -38,6 +53,8 @@ class MongoDBManager:
         self.client: Optional[MongoClient] = None
         self.db: Optional[Database] = None
         self._connected = False
+        # Bumped when a crawl completes or data is deleted; used to invalidate report caches
+        self.data_version = 0
         
     def connect(self) -> None:
         """Establish connection to MongoDB."""
@@ -70,20 +87,30 @@ class MongoDBManager:
         sources_coll.create_index([("url", ASCENDING)], unique=True)
         sources_coll.create_index([("created_at", DESCENDING)])
         sources_coll.create_index([("status", ASCENDING)])
+        sources_coll.create_index([("project_id", ASCENDING)])
         
         # Documents collection
         documents_coll = self.db.documents
         documents_coll.create_index([("url", ASCENDING), ("source_id", ASCENDING)], unique=True)
         documents_coll.create_index([("source_id", ASCENDING)])
+        documents_coll.create_index([("source_id", ASCENDING), ("crawled_at", DESCENDING)])
         documents_coll.create_index([("crawled_at", DESCENDING)])
         documents_coll.create_index([("content_type", ASCENDING)])
         
-        # Text index for full-text search on cleaned_text
-        documents_coll.create_index([("cleaned_text", TEXT)])
+        # Text index for full-text search on title and cleaned_text
+        # (MongoDB allows a single text index per collection, so replace the legacy one)
+        if "cleaned_text_text" in documents_coll.index_information():
+            documents_coll.drop_index("cleaned_text_text")
+        documents_coll.create_index(
+            [("metadata.title", TEXT), ("cleaned_text", TEXT)],
+            name="text_search",
+            weights={"metadata.title": 3, "cleaned_text": 1}
+        )
         
         # Crawl stats collection
         stats_coll = self.db.crawl_stats
         stats_coll.create_index([("source_id", ASCENDING), ("started_at", DESCENDING)])
+        stats_coll.create_index([("started_at", ASCENDING)])
         
         # Projects collection
         projects_coll = self.db.projects
@@ -91,6 +118,14 @@ class MongoDBManager:
         projects_coll.create_index([("domain", ASCENDING)])
         projects_coll.create_index([("created_at", DESCENDING)])
         
+        # Keyword stats collection (prefix lookups for search suggestions)
+        keyword_stats_coll = self.db.keyword_stats
+        keyword_stats_coll.create_index([("keyword", ASCENDING)])
+        
+        # Seed the materialized stats document from existing data
+        if self.db.stats.find_one({"_id": GLOBAL_STATS_ID}, {"_id": 1}) is None:
+            self.rebuild_global_stats()
+        
         logger.info("Initialized MongoDB collections and indexes")
         
     @property
@@ -112,6 +147,16 @@ class MongoDBManager:
     def projects(self) -> Collection:
         """Get projects collection."""
         return self.db.projects
+    
+    @property
+    def keyword_stats(self) -> Collection:
+        """Get keyword stats collection."""
+        return self.db.keyword_stats
+    
+    @property
+    def stats(self) -> Collection:
+        """Get materialized stats collection."""
+        return self.db.stats
         
     # ========================
     # Project CRUD Operations
@@ -155,6 +200,35 @@ class MongoDBManager:
             projects.append(Project(**doc))
         return projects
     
+    def list_projects_with_stats(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        List projects with their source and document counts in one aggregation.
+        
+        Args:
+            limit: Maximum number of projects
+            
+        Returns:
+            List of project dicts with source_count and doc_count
+        """
+        pipeline = [
+            {"$sort": {"created_at": -1}},
+            {"$limit": limit},
+            # Sources store project_id as a string, so join on the stringified _id
+            {"$addFields": {"id": {"$toString": "$_id"}}},
+            {"$lookup": {
+                "from": "sources",
+                "localField": "id",
+                "foreignField": "project_id",
+                "as": "srcs"
+            }},
+            {"$addFields": {
+                "source_count": {"$size": "$srcs"},
+                "doc_count": {"$sum": "$srcs.total_documents"}
+            }},
+            {"$project": {"_id": 0, "srcs": 0}}
+        ]
+        return list(self.projects.aggregate(pipeline))
+    
     def update_project(self, project_id: str, updates: Dict[str, Any]) -> bool:
         """Update project fields."""
         try:
@@ -176,6 +250,8 @@ class MongoDBManager:
         # Delete all sources from this project
         source_result = self.sources.delete_many({"project_id": project_id})
         logger.info(f"Deleted {source_result.deleted_count} sources for project {project_id}")
+        if source_result.deleted_count > 0:
+            self.rebuild_global_stats()
         
         # Delete the project
         result = self.projects.delete_one({"_id": obj_id})
@@ -208,6 +284,7 @@ class MongoDBManager:
         try:
             result = self.sources.insert_one(source_dict)
             source_id = str(result.inserted_id)
+            self.stats.update_one({"_id": GLOBAL_STATS_ID}, {"$inc": {"total_sources": 1}}, upsert=True)
             logger.info(f"Created source: {source.name} (ID: {source_id})")
             return source_id
         except DuplicateKeyError:
@@ -266,6 +343,18 @@ class MongoDBManager:
             
         return sources
         
+    def count_sources_by_status(self, status: CrawlStatus) -> int:
+        """
+        Count sources with a given crawl status.
+        
+        Args:
+            status: Crawl status to count
+            
+        Returns:
+            Number of matching sources
+        """
+        return self.sources.count_documents({"status": status.value})
+        
     def update_source(self, source_id: str, updates: Dict[str, Any]) -> bool:
         """
         Update source fields.
@@ -291,6 +380,50 @@ class MongoDBManager:
             return True
         return False
         
+    def find_existing_source_ids(self, source_ids: List[str]) -> Set[str]:
+        """
+        Find which of the given source IDs exist, in one query.
+        
+        Args:
+            source_ids: Source IDs to check
+            
+        Returns:
+            Set of IDs that belong to existing sources (invalid IDs are ignored)
+        """
+        obj_ids = [ObjectId(source_id) for source_id in source_ids if ObjectId.is_valid(source_id)]
+        if not obj_ids:
+            return set()
+            
+        cursor = self.sources.find({"_id": {"$in": obj_ids}}, {"_id": 1})
+        return {str(doc["_id"]) for doc in cursor}
+        
+    def bulk_update_sources(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Update several sources in one unordered bulk write.
+        
+        Args:
+            updates: Mapping of source ID to fields to update
+            
+        Returns:
+            Number of sources modified
+        """
+        now = datetime.utcnow()
+        operations = []
+        for source_id, fields in updates.items():
+            try:
+                obj_id = ObjectId(source_id)
+            except InvalidId:
+                logger.error(f"Invalid source ID: {source_id}")
+                continue
+            operations.append(UpdateOne({"_id": obj_id}, {"$set": {**fields, "updated_at": now}}))
+            
+        if not operations:
+            return 0
+            
+        result = self.sources.bulk_write(operations, ordered=False)
+        logger.info(f"Bulk updated {result.modified_count} sources")
+        return result.modified_count
+        
     def delete_source(self, source_id: str) -> bool:
         """
         Delete source and all its documents.
@@ -314,6 +447,9 @@ class MongoDBManager:
         # Delete the source
         result = self.sources.delete_one({"_id": obj_id})
         
+        if doc_result.deleted_count > 0 or result.deleted_count > 0:
+            self.rebuild_global_stats()
+            
         if result.deleted_count > 0:
             logger.info(f"Deleted source {source_id}")
             return True
@@ -340,12 +476,58 @@ class MongoDBManager:
         try:
             result = self.documents.insert_one(doc_dict)
             doc_id = str(result.inserted_id)
+            self.increment_document_stats(document.source_id, ContentType(document.content_type).value)
             logger.debug(f"Created document: {document.url}")
             return doc_id
         except DuplicateKeyError:
             logger.warning(f"Document already exists: {document.url}")
             return None
             
+    def create_documents_many(self, documents: List[Document]) -> int:
+        """
+        Insert documents in a single unordered bulk write, skipping duplicates.
+        
+        Args:
+            documents: Document models
+            
+        Returns:
+            Number of documents inserted
+        """
+        if not documents:
+            return 0
+            
+        now = datetime.utcnow()
+        doc_dicts = []
+        for document in documents:
+            doc_dict = document.model_dump(exclude={"id"})
+            doc_dict["metadata"] = document.metadata.model_dump()
+            doc_dict["crawled_at"] = now
+            doc_dicts.append(doc_dict)
+            
+        failed = set()
+        try:
+            self.documents.insert_many(doc_dicts, ordered=False)
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            other_errors = [err for err in errors if err.get("code") != 11000]
+            if other_errors:
+                logger.error(f"Bulk document insert failed: {other_errors[0].get('errmsg')}")
+            failed = {err["index"] for err in errors}
+            logger.debug(f"Skipped {len(errors)} documents that could not be inserted")
+            
+        counts: Dict[Tuple[str, str], int] = {}
+        for index, document in enumerate(documents):
+            if index not in failed:
+                key = (document.source_id, ContentType(document.content_type).value)
+                counts[key] = counts.get(key, 0) + 1
+                
+        for (source_id, content_type), count in counts.items():
+            self.increment_document_stats(source_id, content_type, count)
+            
+        inserted = len(documents) - len(failed)
+        logger.debug(f"Inserted {inserted}/{len(documents)} documents")
+        return inserted
+        
     def get_document(self, document_id: str) -> Optional[Document]:
         """
         Get document by ID.
@@ -401,6 +583,111 @@ class MongoDBManager:
             
         return documents
         
+    @staticmethod
+    def _document_filter(
+        source_id: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Build a documents query on the {source_id, crawled_at} index."""
+        query: Dict[str, Any] = {}
+        if source_id:
+            query["source_id"] = source_id
+        if date_from or date_to:
+            query["crawled_at"] = {}
+            if date_from:
+                query["crawled_at"]["$gte"] = date_from
+            if date_to:
+                query["crawled_at"]["$lte"] = date_to
+        return query
+        
+    def get_keyword_frequencies(
+        self,
+        top_n: int = 20,
+        source_id: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Count stored document keywords with a server-side aggregation.
+        
+        Args:
+            top_n: Number of top keywords to return
+            source_id: Filter by source ID
+            date_from: Only documents crawled at or after this date
+            date_to: Only documents crawled at or before this date
+            
+        Returns:
+            List of {"keyword", "frequency"} dicts, most frequent first
+        """
+        pipeline = [
+            {"$match": self._document_filter(source_id, date_from, date_to)},
+            {"$unwind": "$keywords"},
+            {"$group": {"_id": "$keywords", "frequency": {"$sum": 1}}},
+            {"$sort": {"frequency": -1}},
+            {"$limit": top_n},
+            {"$project": {"_id": 0, "keyword": "$_id", "frequency": 1}}
+        ]
+        return list(self.documents.aggregate(pipeline))
+        
+    def refresh_keyword_stats(self) -> None:
+        """Rebuild the keyword_stats collection from stored document keywords."""
+        pipeline = [
+            {"$unwind": "$keywords"},
+            {"$group": {"_id": "$keywords", "frequency": {"$sum": 1}}},
+            {"$project": {"keyword": "$_id", "frequency": 1}},
+            # $out replaces the documents but keeps the keyword index
+            {"$out": "keyword_stats"}
+        ]
+        self.documents.aggregate(pipeline)
+        logger.info("Refreshed keyword stats")
+        
+    def get_keyword_suggestions(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Get the most frequent keywords starting with a prefix.
+        
+        Args:
+            prefix: Keyword prefix
+            limit: Maximum suggestions
+            
+        Returns:
+            List of keywords, most frequent first
+        """
+        cursor = self.keyword_stats.find(
+            {"keyword": {"$regex": f"^{re.escape(prefix)}"}},
+            {"_id": 0, "keyword": 1}
+        ).sort("frequency", DESCENDING).limit(limit)
+        
+        return [doc["keyword"] for doc in cursor]
+        
+    def list_document_texts(
+        self,
+        source_id: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: int = 1000
+    ) -> List[str]:
+        """
+        List cleaned text of documents matching source and date filters.
+        
+        Only the cleaned_text field is fetched, so no full Document models are built.
+        
+        Args:
+            source_id: Filter by source ID
+            date_from: Only documents crawled at or after this date
+            date_to: Only documents crawled at or before this date
+            limit: Maximum number of results
+            
+        Returns:
+            List of cleaned text strings, newest first
+        """
+        query = self._document_filter(source_id, date_from, date_to)
+        cursor = self.documents.find(
+            query, {"_id": 0, "cleaned_text": 1}
+        ).sort("crawled_at", DESCENDING).limit(limit)
+        
+        return [doc.get("cleaned_text", "") for doc in cursor]
+        
     def count_documents(self, source_id: Optional[str] = None) -> int:
         """
         Count documents, optionally filtered by source.
@@ -420,17 +707,8 @@ class MongoDBManager:
     # Search Operations
     # ========================
     
-    def search_documents(self, search_query: SearchQuery) -> List[SearchResult]:
-        """
-        Search documents using keyword-based full-text search.
-        
-        Args:
-            search_query: Search query parameters
-            
-        Returns:
-            List of search results with relevance scores
-        """
-        # Build MongoDB query
+    def _build_search_filter(self, search_query: SearchQuery) -> Dict[str, Any]:
+        """Build the $text query with optional source, type and date filters."""
         query: Dict[str, Any] = {
             "$text": {"$search": search_query.keywords}
         }
@@ -448,35 +726,79 @@ class MongoDBManager:
                 date_filter["$lte"] = search_query.date_to
             query["crawled_at"] = date_filter
             
+        return query
+        
+    def _to_search_result(self, doc: Dict[str, Any], keywords: str) -> SearchResult:
+        """Convert a projected search hit into a SearchResult."""
+        # Generate snippet with keyword context
+        snippet = self._generate_snippet(doc.get("cleaned_text", ""), keywords)
+        
+        return SearchResult(
+            document_id=str(doc["_id"]),
+            url=doc["url"],
+            title=doc.get("metadata", {}).get("title"),
+            snippet=snippet,
+            relevance_score=doc.get("score", 0.0),
+            source_id=doc["source_id"],
+            content_type=doc["content_type"],
+            crawled_at=doc["crawled_at"]
+        )
+        
+    def search_documents(self, search_query: SearchQuery) -> List[SearchResult]:
+        """
+        Search documents using keyword-based full-text search.
+        
+        Args:
+            search_query: Search query parameters
+            
+        Returns:
+            List of search results with relevance scores
+        """
         # Execute search with text score for relevance
         cursor = self.documents.find(
-            query,
-            {"score": {"$meta": "textScore"}}
+            self._build_search_filter(search_query),
+            SEARCH_PROJECTION
         ).sort([("score", {"$meta": "textScore"})]).skip(search_query.offset).limit(search_query.limit)
         
-        results = []
-        for doc in cursor:
-            # Generate snippet with keyword context
-            snippet = self._generate_snippet(
-                doc.get("cleaned_text", ""),
-                search_query.keywords
-            )
-            
-            result = SearchResult(
-                document_id=str(doc["_id"]),
-                url=doc["url"],
-                title=doc.get("metadata", {}).get("title"),
-                snippet=snippet,
-                relevance_score=doc.get("score", 0.0),
-                source_id=doc["source_id"],
-                content_type=doc["content_type"],
-                crawled_at=doc["crawled_at"]
-            )
-            results.append(result)
+        results = [self._to_search_result(doc, search_query.keywords) for doc in cursor]
             
         logger.info(f"Search for '{search_query.keywords}' returned {len(results)} results")
         return results
         
+    def search_documents_page(self, search_query: SearchQuery) -> Tuple[List[SearchResult], int]:
+        """
+        Search documents and count all matches in a single aggregation.
+        
+        Args:
+            search_query: Search query parameters
+            
+        Returns:
+            Tuple of (page of search results, total number of matches)
+        """
+        pipeline = [
+            {"$match": self._build_search_filter(search_query)},
+            {"$project": SEARCH_PROJECTION},
+            {"$facet": {
+                "data": [
+                    {"$sort": {"score": -1}},
+                    {"$skip": search_query.offset},
+                    {"$limit": search_query.limit}
+                ],
+                "meta": [{"$count": "total"}]
+            }}
+        ]
+        facets = next(self.documents.aggregate(pipeline), {})
+        
+        results = [
+            self._to_search_result(doc, search_query.keywords)
+            for doc in facets.get("data", [])
+        ]
+        meta = facets.get("meta", [])
+        total = meta[0]["total"] if meta else 0
+        
+        logger.info(f"Search for '{search_query.keywords}' matched {total} documents")
+        return results, total
+        
     def _generate_snippet(self, text: str, keywords: str, max_length: int = 200) -> str:
         """
         Generate a snippet from text with keyword context.
@@ -536,6 +858,7 @@ class MongoDBManager:
         """
         stats_dict = stats.model_dump()
         result = self.crawl_stats.insert_one(stats_dict)
+        self.data_version += 1
         return str(result.inserted_id)
         
     def get_source_stats(self, source_id: str) -> Dict[str, Any]:
@@ -562,33 +885,80 @@ class MongoDBManager:
             "latest_crawl": latest_stats
         }
         
+    def increment_document_stats(self, source_id: str, content_type: str, count: int = 1) -> None:
+        """
+        Add ingested documents to the materialized stats document.
+        
+        Args:
+            source_id: Source the documents belong to
+            content_type: Content type of the documents
+            count: Number of documents ingested
+        """
+        self.stats.update_one(
+            {"_id": GLOBAL_STATS_ID},
+            {"$inc": {
+                "total_documents": count,
+                f"by_content_type.{content_type}": count,
+                f"by_source.{source_id}": count
+            }},
+            upsert=True
+        )
+        
+    def rebuild_global_stats(self) -> None:
+        """Recompute the materialized stats document from the collections."""
+        self.data_version += 1
+        by_content_type = {
+            str(row["_id"]): row["count"]
+            for row in self.documents.aggregate([
+                {"$group": {"_id": "$content_type", "count": {"$sum": 1}}}
+            ])
+        }
+        by_source = {
+            str(row["_id"]): row["count"]
+            for row in self.documents.aggregate([
+                {"$group": {"_id": "$source_id", "count": {"$sum": 1}}}
+            ])
+        }
+        
+        self.stats.replace_one(
+            {"_id": GLOBAL_STATS_ID},
+            {
+                "total_sources": self.sources.count_documents({}),
+                "total_documents": sum(by_content_type.values()),
+                "by_content_type": by_content_type,
+                "by_source": by_source
+            },
+            upsert=True
+        )
+        
     def get_global_stats(self) -> Dict[str, Any]:
         """
         Get global statistics across all sources.
         
+        Reads the materialized stats document maintained at ingestion time
+        instead of aggregating over the documents collection.
+        
         Returns:
             Statistics dictionary
         """
-        total_sources = self.sources.count_documents({})
-        total_documents = self.documents.count_documents({})
-        
-        # Documents per content type
-        pipeline = [
-            {"$group": {"_id": "$content_type", "count": {"$sum": 1}}}
-        ]
-        content_type_stats = list(self.documents.aggregate(pipeline))
-        
-        # Documents per source
-        pipeline = [
-            {"$group": {"_id": "$source_id", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}},
-            {"$limit": 10}
+        stats = self.stats.find_one({"_id": GLOBAL_STATS_ID})
+        if stats is None:
+            self.rebuild_global_stats()
+            stats = self.stats.find_one({"_id": GLOBAL_STATS_ID}) or {}
+            
+        content_type_stats = [
+            {"_id": content_type, "count": count}
+            for content_type, count in stats.get("by_content_type", {}).items()
         ]
-        top_sources = list(self.documents.aggregate(pipeline))
+        top_sources = sorted(
+            ({"_id": source_id, "count": count} for source_id, count in stats.get("by_source", {}).items()),
+            key=lambda row: row["count"],
+            reverse=True
+        )[:10]
         
         return {
-            "total_sources": total_sources,
-            "total_documents": total_documents,
+            "total_sources": stats.get("total_sources", 0),
+            "total_documents": stats.get("total_documents", 0),
             "by_content_type": content_type_stats,
             "top_sources": top_sources
         }
@@ -2,5 +2,6 @@
 
 from .config import settings
 from .logger import setup_logger, app_logger
+from .async_utils import run_blocking
 
-__all__ = ["settings", "setup_logger", "app_logger"]
+__all__ = ["settings", "setup_logger", "app_logger", "run_blocking"]
@@ -0,0 +1,24 @@
+"""
+Async helpers for calling blocking code from FastAPI handlers.
+Offloads synchronous work (e.g. PyMongo calls) to the default thread pool.
+"""
+
+import asyncio
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking function in a worker thread without stalling the event loop.
+    
+    Args:
+        func: Synchronous callable to execute
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+        
+    Returns:
+        Return value of func
+    """
+    return await asyncio.to_thread(func, *args, **kwargs)
@@ -42,6 +42,22 @@ class Settings(BaseSettings):
         default=3,
         description="Maximum number of retry attempts for failed requests"
     )
+    max_content_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        description="Maximum response body size downloaded per fetch"
+    )
+    robots_cache_path: str = Field(
+        default="~/.cache/webanalytics/robots.json",
+        description="File used to persist robots.txt across restarts (empty to disable)"
+    )
+    dns_cache_enabled: bool = Field(
+        default=False,
+        description="Cache DNS lookups process-wide for the synchronous crawler session"
+    )
+    dns_cache_ttl: int = Field(
+        default=300,
+        description="Seconds a cached DNS lookup stays valid"
+    )
     
     # Logging Configuration
     log_level: str = Field(
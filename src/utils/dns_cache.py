@@ -0,0 +1,52 @@
+"""
+Process-wide DNS cache for the synchronous HTTP stack.
+Wraps socket.getaddrinfo with a TTL cache so repeated requests to a host skip resolution.
+"""
+
+import socket
+import threading
+
+from cachetools import TTLCache
+
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DNS_CACHE_MAX = 100_000
+
+_original_getaddrinfo = socket.getaddrinfo
+_install_lock = threading.Lock()
+_installed = False
+
+
+def install_dns_cache(ttl: float) -> None:
+    """
+    Replace socket.getaddrinfo with a cached version (idempotent).
+    
+    Failed lookups are not cached, so transient resolver errors are retried.
+    
+    Args:
+        ttl: Seconds a resolved address stays cached
+    """
+    global _installed
+    
+    with _install_lock:
+        if _installed:
+            return
+            
+        cache = TTLCache(maxsize=DNS_CACHE_MAX, ttl=ttl)
+        cache_lock = threading.Lock()
+        
+        def cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+            key = (host, port, family, type, proto, flags)
+            with cache_lock:
+                result = cache.get(key)
+            if result is None:
+                result = _original_getaddrinfo(host, port, family, type, proto, flags)
+                with cache_lock:
+                    cache[key] = result
+            return result
+            
+        socket.getaddrinfo = cached_getaddrinfo
+        _installed = True
+        logger.info(f"DNS cache installed (ttl={ttl}s)")
@@ -82,10 +82,11 @@ class TestSearchEndpoints:
     @patch('src.api.search.search_engine')
     def test_search(self, mock_search, client):
         """Test search endpoint."""
-        mock_search.search.return_value = []
+        mock_search.search.return_value = ([], 0)
         
         response = client.get("/api/search/?q=test")
         assert response.status_code == 200
         data = response.json()
         assert "results" in data
         assert data["query"] == "test"
+        assert data["total_results"] == 0
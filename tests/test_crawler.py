@@ -3,8 +3,9 @@ Tests for crawler functionality.
 """
 
 import pytest
-from src.crawler.base_crawler import BaseCrawler
-from unittest.mock import Mock, patch
+import requests
+from src.crawler.base_crawler import BaseCrawler, TokenBucket
+from unittest.mock import MagicMock, Mock, patch
 
 
 class TestBaseCrawler:
@@ -36,6 +37,79 @@ class TestBaseCrawler:
         # Should have waited at least the delay time
         assert elapsed >= 0.1
         
+    def test_token_bucket(self):
+        """Test token bucket reserves future slots once empty."""
+        bucket = TokenBucket(rate=10.0, capacity=1)
+        
+        assert bucket.take() == 0.0
+        assert bucket.take() == pytest.approx(0.1, abs=0.01)
+        
+    def test_circuit_breaker(self):
+        """Test domain circuit opens once failures exceed the threshold."""
+        crawler = BaseCrawler()
+        url = "http://example.com/page"
+        
+        for _ in range(9):
+            crawler.record_result(url, True)
+        assert not crawler.is_circuit_open(url)
+        
+        crawler.record_result(url, False)
+        crawler.record_result(url, False)
+        assert crawler.is_circuit_open(url)
+        
+    def test_circuit_ignores_broken_links(self):
+        """Test 404 responses do not open the domain circuit, but 503s do."""
+        crawler = BaseCrawler()
+        url = "http://example.com/missing"
+        
+        def respond(status_code):
+            response = Mock(status_code=status_code, headers={})
+            response.raise_for_status.side_effect = requests.HTTPError(response=response)
+            context = MagicMock()
+            context.__enter__.return_value = response
+            crawler.session.get = Mock(return_value=context)
+            
+        with patch.object(crawler, 'respect_rate_limit'):
+            respond(404)
+            for _ in range(12):
+                assert crawler.fetch(url, respect_robots=False) is None
+            assert not crawler.is_circuit_open(url)
+            
+            respond(503)
+            for _ in range(2):
+                crawler.fetch(url, respect_robots=False)
+            assert crawler.is_circuit_open(url)
+            
+    def test_robots_crawl_delay(self):
+        """Test Crawl-delay from robots.txt raises the per-domain delay."""
+        from urllib.robotparser import RobotFileParser
+        
+        crawler = BaseCrawler(delay=0.1)
+        robot_parser = RobotFileParser()
+        robot_parser.parse(["User-agent: *", "Crawl-delay: 2"])
+        
+        crawler._update_domain_delay("example.com", robot_parser)
+        
+        assert crawler.domain_delay["example.com"] == 2.0
+        
+    def test_robots_cache_persistence(self, tmp_path):
+        """Test robots.txt bodies survive a save/load round trip."""
+        import time
+        
+        crawler = BaseCrawler()
+        crawler.robots_cache_path = str(tmp_path / "robots.json")
+        crawler.robots_texts["http://example.com"] = ("User-agent: *\nDisallow: /private", time.time())
+        crawler._save_robots_cache()
+        
+        restored = BaseCrawler()
+        restored.robots_cache_path = crawler.robots_cache_path
+        restored.robots_cache.clear()
+        restored._load_robots_cache()
+        
+        robot_parser, _ = restored.robots_cache["http://example.com"]
+        assert not robot_parser.can_fetch(restored.user_agent, "http://example.com/private/page")
+        assert robot_parser.can_fetch(restored.user_agent, "http://example.com/public")
+        
     def test_session_creation(self):
         """Test session is created with retry logic."""
         crawler = BaseCrawler()
@@ -80,6 +80,25 @@ class TestRSSParser:
         assert results[0].title == "Article 1"
         assert results[1].title == "Article 2"
         assert all(r.content_type == "rss" for r in results)
+        
+    def test_iter_entries_is_lazy(self):
+        """Test that entries are yielded one at a time."""
+        parser = RSSParser()
+        rss = b"""<?xml version="1.0"?>
+        <rss version="2.0">
+            <channel>
+                <title>Test Feed</title>
+                <item><title>Article 1</title><link>http://example.com/1</link></item>
+                <item><title>Article 2</title><link>http://example.com/2</link></item>
+            </channel>
+        </rss>
+        """
+        
+        entries = parser.iter_entries(rss, "http://example.com/feed")
+        
+        assert next(entries).title == "Article 1"
+        assert next(entries).title == "Article 2"
+        assert next(entries, None) is None
 
 
 class TestPDFParser: